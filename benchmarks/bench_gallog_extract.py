@@ -0,0 +1,103 @@
+# benchmarks/bench_gallog_extract.py
+# 100개 항목 갤로그 픽스처로 목록 추출 방식별 소요 시간 비교
+#   python benchmarks/bench_gallog_extract.py [--repeat 20]
+# Chromium 이 설치되어 있으면 기존 항목별 query_selector 방식과 단일 page.evaluate 방식도 함께 측정한다.
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dc_post import build_posts, fetch_posts, parse_gallog_html  # noqa: E402
+
+FIXTURE = os.path.join(ROOT, 'benchmarks', 'fixtures', 'gallog_100.html')
+
+
+async def legacy_extract(page):
+    # 기존 get_posts_from_gallog 의 항목별 탐색 (print 제외)
+    items = []
+    for li in await page.query_selector_all('.cont_listbox li, .list_box li'):
+        date_el = None
+        for selector in ['.date', '.gall_date', 'time']:
+            date_el = await li.query_selector(selector)
+            if date_el:
+                break
+        title_el = None
+        for selector in ['.txt_box', '.subject', 'a']:
+            title_el = await li.query_selector(selector)
+            if title_el:
+                break
+        link_el = await li.query_selector('a')
+        items.append([
+            (await date_el.inner_text()).strip() if date_el else None,
+            await title_el.inner_text() if title_el else None,
+            await link_el.get_attribute('href') if link_el else None,
+        ])
+    return items
+
+
+def report(name, samples, count):
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    print(f"{name:<28} mean {mean * 1000:8.2f} ms  min {samples[0] * 1000:8.2f} ms  ({count} items)")
+    return mean
+
+
+def bench_html_parser(html, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        posts, _ = build_posts(parse_gallog_html(html), hours_ago=1.0)
+        samples.append(time.perf_counter() - t0)
+    return report('html.parser (page.content)', samples, len(posts))
+
+
+async def bench_browser(html, repeat):
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        print("playwright 미설치: 브라우저 측정 생략")
+        return
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(headless=True)
+        except Exception as e:
+            print(f"Chromium 실행 불가: 브라우저 측정 생략 ({e.__class__.__name__})")
+            return
+        page = await browser.new_page()
+        await page.set_content(html)
+        results = {}
+        for name, func in (('legacy query_selector', legacy_extract), ('single page.evaluate', fetch_posts)):
+            samples = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                out = await func(page)
+                samples.append(time.perf_counter() - t0)
+            count = len(out[0]) if isinstance(out, tuple) else len(out)
+            results[name] = report(name, samples, count)
+        samples = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            parse_gallog_html(await page.content())
+            samples.append(time.perf_counter() - t0)
+        report('page.content + html.parser', samples, 100)
+        await browser.close()
+        speedup = results['legacy query_selector'] / results['single page.evaluate']
+        print(f"speedup (legacy / evaluate): {speedup:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    with open(FIXTURE, encoding='utf-8') as f:
+        html = f.read()
+    bench_html_parser(html, args.repeat)
+    asyncio.run(bench_browser(html, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
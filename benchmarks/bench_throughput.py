@@ -0,0 +1,191 @@
+# benchmarks/bench_throughput.py
+# 로컬 대역 서버(mock_server.py)를 상대로 실제 DCCleaner + DeletePipeline 을 돌려 처리량을 측정한다.
+#   python benchmarks/bench_throughput.py --posts 200 --concurrency 1,2,4,8 --engines browser,http,listing
+#   python benchmarks/bench_throughput.py --json result.json              # 결과 저장
+#   python benchmarks/bench_throughput.py --baseline result.json          # 이전 결과 대비 회귀 확인 (posts/sec 기준)
+# listing 은 browser 엔진 + 갤로그 목록에서 바로 삭제(DC_LISTING_DELETE=1).
+# 엔진/동시 삭제 수 조합마다 posts/sec, 게시글당 지연 p50/p95, 최대 RSS(브라우저 자식 프로세스 포함)를 출력한다.
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from dc_memory import process_tree_rss_kb  # noqa: E402
+from mock_server import add_server_args, server_from_args  # noqa: E402
+
+BENCH_USER = 'bench'
+
+
+class RssSampler:
+    def __init__(self, interval: float = 0.2):
+        self.interval = interval
+        self.peak_kb = 0
+        self._task = None
+
+    def sample(self):
+        if os.path.isdir('/proc'):
+            self.peak_kb = max(self.peak_kb, process_tree_rss_kb(os.getpid()))
+        else:
+            # /proc 이 없으면 현재 프로세스의 최대 RSS 만 (macOS 는 바이트 단위)
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            self.peak_kb = max(self.peak_kb, peak // 1024 if sys.platform == 'darwin' else peak)
+
+    async def _loop(self):
+        while True:
+            self.sample()
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        self._task = asyncio.ensure_future(self._loop())
+
+    async def stop(self):
+        self._task.cancel()
+        self.sample()
+
+
+def configure_env(base_url: str, engine: str, concurrency: int, workdir: str):
+    # DCCleaner 가 __init__ 에서 읽는 설정을 대역 서버/고정 동시 삭제 수로 맞춘다
+    os.environ.update({
+        'DC_USERNAME': BENCH_USER,
+        'DC_PASSWORD': BENCH_USER,
+        'DC_MAIN_URL': base_url + '/',
+        'DC_LOGIN_URL': base_url + '/',
+        'DC_GALLOG_BASE': base_url,
+        'DC_ROUTE_ALLOW': '127.0.0.1',
+        'DC_DELETE_ENGINE': 'browser' if engine == 'listing' else engine,
+        'DC_LISTING_DELETE': '1' if engine == 'listing' else '0',
+        'DC_HTTP_CONCURRENCY': str(concurrency),
+        'DC_CONCURRENCY_MIN': str(concurrency),
+        'DC_CONCURRENCY_MAX': str(concurrency),
+        'DC_HUMAN_DELAY': '0',
+        'DC_CHALLENGE': '0',  # 대역 서버 캡차는 무작위라 운영자 창을 띄우지 않는다
+        'DC_RATE_LIMIT': '0',
+        'DC_LEDGER_PATH': os.path.join(workdir, f'ledger_{engine}_{concurrency}.sqlite3'),
+        'DC_SESSION_PATH': os.path.join(workdir, 'dc_session.json'),
+        'DC_METRICS_PROM': '',
+        'DC_METRICS_JSON': '',
+        'DC_VERIFY_DELAY': '0.5',
+    })
+
+
+def write_cookie_file(workdir: str) -> str:
+    path = os.path.join(workdir, 'dc_cookies.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([{'name': 'ci_c', 'value': 'bench', 'domain': '127.0.0.1', 'path': '/'}], f)
+    return path
+
+
+async def run_once(server, engine: str, concurrency: int, posts: int, workdir: str) -> dict:
+    from pathlib import Path
+    from dc_cleaner import DCCleaner
+    from dc_metrics import percentile
+    from dc_pipeline import DeletePipeline
+
+    server.reset(posts)
+    configure_env(server.base_url, engine, concurrency, workdir)
+    cleaner = DCCleaner()
+    cleaner.cookies_path = Path(write_cookie_file(workdir))
+    sampler = RssSampler()
+    sampler.start()
+    try:
+        await cleaner.init_browser()
+        await cleaner.login()
+        started = time.perf_counter()
+        stats = await DeletePipeline(cleaner, hours_ago=0).run()
+        elapsed = time.perf_counter() - started
+    finally:
+        await cleaner.close_resources()
+        await sampler.stop()
+    latencies = cleaner.stage_timer.samples.get('total', [])
+    return {
+        'engine': engine,
+        'concurrency': concurrency,
+        'posts': posts,
+        'deleted': server.stats['deleted'],
+        'success': stats['success'],
+        'fail': stats['fail'],
+        'seconds': elapsed,
+        'posts_per_sec': server.stats['deleted'] / elapsed if elapsed else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'peak_rss_mb': sampler.peak_kb / 1024,
+        'server': dict(server.stats),
+    }
+
+
+def print_table(results):
+    print(f"{'engine':<8}{'conc':>5}{'deleted':>9}{'sec':>8}{'posts/s':>9}{'p50(s)':>8}{'p95(s)':>8}{'rss(MB)':>9}"
+          f"{'captcha':>8}{'403':>5}{'500':>5}")
+    for r in results:
+        print(f"{r['engine']:<8}{r['concurrency']:>5}{r['deleted']:>5}/{r['posts']:<3}{r['seconds']:>8.1f}"
+              f"{r['posts_per_sec']:>9.2f}{r['p50']:>8.2f}{r['p95']:>8.2f}{r['peak_rss_mb']:>9.0f}"
+              f"{r['server']['captcha']:>8}{r['server']['forbidden']:>5}{r['server']['errors']:>5}")
+
+
+def check_regression(results, baseline_path: str, tolerance: float) -> bool:
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(r['engine'], r['concurrency']): r for r in json.load(f)['results']}
+    ok = True
+    for r in results:
+        base = baseline.get((r['engine'], r['concurrency']))
+        if not base or not base['posts_per_sec']:
+            continue
+        change = r['posts_per_sec'] / base['posts_per_sec'] - 1
+        mark = 'REGRESSION' if change < -tolerance else 'ok'
+        ok = ok and mark == 'ok'
+        print(f"  {r['engine']:<8} x{r['concurrency']:<3} {base['posts_per_sec']:.2f} -> {r['posts_per_sec']:.2f} posts/s "
+              f"({change:+.0%}) {mark}")
+    return ok
+
+
+async def main(args) -> int:
+    server = server_from_args(args, user=BENCH_USER)
+    await server.start()
+    print(f"mock server: {server.base_url} (latency {args.latency}s + jitter {args.jitter}s, "
+          f"500 {args.error_rate:.0%}, captcha {args.captcha_rate:.0%}, 403 {args.forbidden_rate:.0%})")
+    results = []
+    workdir = tempfile.mkdtemp(prefix='dc_bench_')
+    try:
+        for engine in args.engines.split(','):
+            for concurrency in (int(c) for c in args.concurrency.split(',')):
+                try:
+                    result = await run_once(server, engine, concurrency, args.posts, workdir)
+                except Exception as e:
+                    print(f"[{engine} x{concurrency}] 실행 실패: {type(e).__name__}: {e}")
+                    continue
+                results.append(result)
+                print(f"[{engine} x{concurrency}] {result['deleted']}/{args.posts} 삭제, "
+                      f"{result['posts_per_sec']:.2f} posts/s")
+    finally:
+        await server.stop()
+    print()
+    print_table(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        print(f"\nbaseline: {args.baseline} (허용 감소 {args.tolerance:.0%})")
+        if not check_regression(results, args.baseline, args.tolerance):
+            return 1
+    return 0 if results else 1
+
+
+if __name__ == '__main__':
+    # 로그는 파일에만 남기고 콘솔에는 결과만 출력
+    os.environ.setdefault('DC_LOG_CONSOLE', '0')
+    parser = argparse.ArgumentParser(description='로컬 대역 서버 기반 삭제 처리량 벤치마크')
+    add_server_args(parser)
+    parser.add_argument('--concurrency', default='1,2,4,8', help='쉼표로 구분한 동시 삭제 수 목록')
+    parser.add_argument('--engines', default='browser,http', help='browser,http,listing 중 측정할 엔진')
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용할 posts/sec 감소 비율')
+    sys.exit(asyncio.run(main(parser.parse_args())))
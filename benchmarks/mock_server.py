@@ -0,0 +1,233 @@
+# benchmarks/mock_server.py
+# 오프라인 벤치마크용 로컬 DCInside 대역 서버 (aiohttp)
+#   python benchmarks/mock_server.py --posts 200 --latency 0.05 --captcha-rate 0.02
+# 갤로그 목록(?p=N), /board/view/ (삭제 버튼 + goDelete 메타 URL), /board/delete/ 확인 폼,
+# 갤로그 목록의 삭제 요청(/{user}/ajax/log_list_ajax/delete), 삭제 요청 처리와
+# 가끔씩의 캡차/403/500 응답을 흉내 낸다.
+import argparse
+import asyncio
+import html
+import random
+from typing import Dict, Optional
+
+from aiohttp import web
+
+CAPTCHA_PAGE = """<!DOCTYPE html><html><body>
+<div class="kcaptcha_box"><img src="/kcaptcha/image/?t={t}"><p>자동입력 방지 문자를 입력해 주세요.</p></div>
+</body></html>"""
+FORBIDDEN_PAGE = "<!DOCTYPE html><html><body><p>접근이 차단되었습니다.</p></body></html>"
+DELETED_PAGE = "<!DOCTYPE html><html><body><p>삭제된 게시물입니다.</p></body></html>"
+DELETE_DONE_PAGE = "<!DOCTYPE html><html><body><p>삭제되었습니다.</p></body></html>"
+
+
+class MockDCServer:
+    def __init__(self, posts: int = 200, per_page: int = 20, user: str = 'bench', gallery: str = 'bench',
+                 latency: float = 0.02, jitter: float = 0.01, error_rate: float = 0.0,
+                 captcha_rate: float = 0.0, forbidden_rate: float = 0.0, meta_ratio: float = 0.5,
+                 listing_refuse_rate: float = 0.0, seed: Optional[int] = None):
+        self.per_page = per_page
+        self.user = user
+        self.gallery = gallery
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.captcha_rate = captcha_rate
+        self.forbidden_rate = forbidden_rate
+        self.meta_ratio = meta_ratio
+        self.listing_refuse_rate = listing_refuse_rate
+        self.random = random.Random(seed)
+        self.base_url = ''
+        self._runner: Optional[web.AppRunner] = None
+        self.reset(posts)
+
+    def reset(self, posts: int):
+        # 글번호 -> 메타 삭제 URL 사용 여부. 삭제되면 목록에서 빠진다
+        self.posts: Dict[int, bool] = {
+            1000 + i: self.random.random() < self.meta_ratio for i in range(posts)
+        }
+        self.stats = {'requests': 0, 'deleted': 0, 'captcha': 0, 'forbidden': 0, 'errors': 0,
+                      'listing_deleted': 0, 'listing_refused': 0}
+
+    def view_url(self, no: int) -> str:
+        return f"{self.base_url}/board/view/?id={self.gallery}&no={no}"
+
+    async def _delay(self):
+        self.stats['requests'] += 1
+        delay = self.latency + self.random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _fault(self) -> Optional[web.Response]:
+        # 설정한 비율로 500/캡차/403 응답
+        roll = self.random.random()
+        if roll < self.error_rate:
+            self.stats['errors'] += 1
+            return web.Response(status=500, text='Internal Server Error')
+        roll -= self.error_rate
+        if roll < self.captcha_rate:
+            self.stats['captcha'] += 1
+            return web.Response(text=CAPTCHA_PAGE.format(t=self.stats['requests']), content_type='text/html')
+        roll -= self.captcha_rate
+        if roll < self.forbidden_rate:
+            self.stats['forbidden'] += 1
+            return web.Response(status=403, text=FORBIDDEN_PAGE, content_type='text/html')
+        return None
+
+    def _post_no(self, request) -> Optional[int]:
+        no = request.query.get('no', '')
+        return int(no) if no.isdigit() else None
+
+    async def main_page(self, request):
+        await self._delay()
+        # #login_process 가 없으면 쿠키 로그인 성공으로 판정된다
+        return web.Response(text='<!DOCTYPE html><html><body><div class="user_info">bench</div></body></html>',
+                            content_type='text/html')
+
+    async def gallog(self, request):
+        await self._delay()
+        page_no = int(request.query.get('p', '1') or 1)
+        live = sorted(self.posts, reverse=True)
+        chunk = live[(page_no - 1) * self.per_page:page_no * self.per_page]
+        items = []
+        for no in chunk:
+            link = html.escape(self.view_url(no))
+            items.append(
+                f'<li data-no="{no}"><div class="cont_head clear"><a class="link" href="{link}">'
+                f'<div class="txt_box"><span class="txt">벤치마크 글 {no}</span></div></a></div>'
+                f'<div class="cont_info clear"><span class="date">2024.01.01 00:00</span>'
+                f'<button type="button" class="btn_delete" data-no="{no}">삭제</button></div></li>'
+            )
+        body = (
+            '<!DOCTYPE html><html><body><input type="hidden" name="service_code" value="bench">'
+            f'<div class="cont_listbox"><ul>{"".join(items)}</ul></div></body></html>'
+        )
+        return web.Response(text=body, content_type='text/html')
+
+    async def view(self, request):
+        await self._delay()
+        no = self._post_no(request)
+        if no not in self.posts:
+            return web.Response(status=404, text=DELETED_PAGE, content_type='text/html')
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        delete_url = f"/board/delete/?id={self.gallery}&no={no}"
+        meta = ''
+        if self.posts[no]:
+            meta = f"<script>function del(){{goDelete('/board/delete/meta?id={self.gallery}&no={no}')}}</script>"
+        body = (
+            '<!DOCTYPE html><html><body><div class="gallview_contents"><div class="write_div">본문</div></div>'
+            f'<button type="button" class="btn_grey cancle" onclick="location.href=\'{delete_url}\'">삭제</button>'
+            f'{meta}</body></html>'
+        )
+        return web.Response(text=body, content_type='text/html')
+
+    async def delete_form(self, request):
+        await self._delay()
+        no = self._post_no(request)
+        if no not in self.posts:
+            return web.Response(status=404, text=DELETED_PAGE, content_type='text/html')
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        body = (
+            f'<!DOCTYPE html><html><body><form method="post" action="/board/delete/submit?id={self.gallery}&no={no}">'
+            f'<input type="hidden" name="id" value="{self.gallery}"><input type="hidden" name="no" value="{no}">'
+            '<button type="submit" class="btn_blue btn_svc">삭제</button></form></body></html>'
+        )
+        return web.Response(text=body, content_type='text/html')
+
+    async def delete_submit(self, request):
+        await self._delay()
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        no = self._post_no(request)
+        if self.posts.pop(no, None) is not None:
+            self.stats['deleted'] += 1
+        return web.Response(text=DELETE_DONE_PAGE, content_type='text/html')
+
+    async def listing_delete(self, request):
+        # 갤로그 목록의 삭제 버튼이 보내는 ajax 요청. 목록 글번호(data-no)로 삭제
+        await self._delay()
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        form = await request.post()
+        no = str(form.get('no', ''))
+        if self.random.random() < self.listing_refuse_rate:
+            self.stats['listing_refused'] += 1
+            return web.json_response({'result': 'fail', 'msg': '삭제할 권한이 없습니다.'})
+        if no.isdigit() and self.posts.pop(int(no), None) is not None:
+            self.stats['deleted'] += 1
+            self.stats['listing_deleted'] += 1
+        return web.json_response({'result': 'success'})
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/', self.main_page)
+        app.router.add_get(f'/{self.user}/posting', self.gallog)
+        app.router.add_get('/board/view/', self.view)
+        app.router.add_get('/board/delete/', self.delete_form)
+        app.router.add_post('/board/delete/submit', self.delete_submit)
+        app.router.add_post('/board/delete/meta', self.delete_submit)
+        app.router.add_post(f'/{self.user}/ajax/log_list_ajax/delete', self.listing_delete)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def add_server_args(parser: argparse.ArgumentParser):
+    parser.add_argument('--posts', type=int, default=200)
+    parser.add_argument('--per-page', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.02, help='응답마다 더할 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.01, help='지연에 더할 최대 랜덤 값(초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 응답 비율')
+    parser.add_argument('--captcha-rate', type=float, default=0.0, help='캡차 페이지 비율')
+    parser.add_argument('--forbidden-rate', type=float, default=0.0, help='403 응답 비율')
+    parser.add_argument('--meta-ratio', type=float, default=0.5, help='goDelete 메타 URL 을 포함한 글 비율')
+    parser.add_argument('--listing-refuse-rate', type=float, default=0.0, help='목록 삭제 요청을 거부할 비율')
+    parser.add_argument('--seed', type=int, default=None)
+
+
+def server_from_args(args, user: str = 'bench') -> MockDCServer:
+    return MockDCServer(
+        posts=args.posts, per_page=args.per_page, user=user, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, captcha_rate=args.captcha_rate, forbidden_rate=args.forbidden_rate,
+        meta_ratio=args.meta_ratio, listing_refuse_rate=args.listing_refuse_rate, seed=args.seed,
+    )
+
+
+async def _serve(args):
+    server = server_from_args(args, user=args.user)
+    base_url = await server.start(port=args.port)
+    print(f"mock server: {base_url}")
+    print(f"  DC_MAIN_URL={base_url}/ DC_GALLOG_BASE={base_url} DC_USERNAME={args.user} DC_ROUTE_ALLOW=127.0.0.1")
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await server.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='로컬 DCInside 대역 서버')
+    add_server_args(parser)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--user', default='bench')
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
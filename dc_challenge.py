@@ -0,0 +1,126 @@
+# dc_challenge.py
+# 헤드리스 실행 중 캡차/수동 인증 페이지를 만나면 작업자를 멈추고 운영자용 헤드풀 창을 띄운다.
+# 저장한 storage state 로 헤드풀 창을 열고, 운영자가 인증을 마치면 쿠키를 헤드리스 컨텍스트로 되돌린 뒤 재개.
+import asyncio
+import os
+from typing import Optional
+
+from dc_delete_strategy import looks_like_captcha
+from dc_logger import log_error, log_info
+
+
+class ChallengeGate:
+    def __init__(self, state_path: str = 'dc_storage_state.json', timeout: float = 600.0,
+                 poll_interval: float = 2.0, enabled: bool = True):
+        self.state_path = state_path
+        self.timeout = timeout  # 운영자가 인증을 마칠 때까지 기다릴 최대 시간
+        self.poll_interval = poll_interval
+        self.enabled = enabled
+        self._open: Optional[asyncio.Event] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._solved = False  # 마지막 인증 처리 결과 (기다린 작업자도 같은 결과를 받는다)
+        self.stats = {'escalations': 0, 'solved': 0, 'timeouts': 0, 'paused_seconds': 0.0}
+
+    @classmethod
+    def from_env(cls) -> 'ChallengeGate':
+        return cls(
+            state_path=os.getenv('DC_STORAGE_STATE', 'dc_storage_state.json'),
+            timeout=float(os.getenv('DC_CHALLENGE_TIMEOUT', '600')),
+            enabled=os.getenv('DC_CHALLENGE', '1') != '0',
+        )
+
+    def _event(self) -> asyncio.Event:
+        if self._open is None:
+            self._open = asyncio.Event()
+            self._open.set()
+        return self._open
+
+    @property
+    def paused(self) -> bool:
+        return not self._event().is_set()
+
+    async def wait_open(self):
+        # 인증 처리 중이면 끝날 때까지 새 삭제를 시작하지 않는다
+        await self._event().wait()
+
+    async def escalate(self, cleaner, url: str) -> bool:
+        # 캡차 해결 시 True. 다른 작업자가 이미 처리 중이면 그 결과를 기다린다
+        if not self.enabled:
+            return False
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        if self._lock.locked():
+            await self.wait_open()
+            return self._solved
+        async with self._lock:
+            self._event().clear()
+            self.stats['escalations'] += 1
+            started = asyncio.get_event_loop().time()
+            self._solved = False
+            try:
+                self._solved = await self._solve(cleaner, url)
+                return self._solved
+            finally:
+                self.stats['paused_seconds'] += asyncio.get_event_loop().time() - started
+                self._event().set()
+                log_info("[challenge] 작업 재개")
+
+    async def _solve(self, cleaner, url: str) -> bool:
+        log_info(f"[challenge] 캡차/수동 인증 감지 -> 작업 일시 정지: {url}")
+        await cleaner.context.storage_state(path=self.state_path)
+        browser = None
+        if cleaner.headless:
+            # 운영자용 헤드풀 창은 저장한 세션으로 따로 띄운다 (디스플레이가 없는 서버면 실패 -> 기존 세션으로 재개)
+            try:
+                browser = await cleaner.playwright.chromium.launch(headless=False, args=['--window-size=1280,720'])
+                context = await browser.new_context(storage_state=self.state_path,
+                                                    viewport={'width': 1280, 'height': 720})
+            except Exception as e:
+                log_error(f"[challenge] 인증용 브라우저 창을 띄우지 못함 (디스플레이 확인), 기존 세션으로 재개: "
+                          f"{type(e).__name__}: {e}")
+                if browser is not None:
+                    try:
+                        await browser.close()
+                    except Exception:
+                        pass
+                return False
+        else:
+            context = cleaner.context
+        page = await context.new_page()
+        try:
+            await page.goto(url, wait_until='domcontentloaded', timeout=60000)
+            print(f"\033[93m[CAPTCHA] 열린 브라우저 창에서 캡차/인증을 완료해 주세요. (최대 {self.timeout:.0f}초 대기)\033[0m")
+            if not await self._wait_solved(page):
+                self.stats['timeouts'] += 1
+                log_error(f"[challenge] 인증 대기 시간 초과 ({self.timeout:.0f}s), 기존 세션으로 재개")
+                return False
+            if browser is not None:
+                # 인증 후 쿠키를 헤드리스 컨텍스트로 옮긴다
+                await context.storage_state(path=self.state_path)
+                await cleaner.context.add_cookies(await context.cookies())
+            await cleaner.save_cookies()
+            self.stats['solved'] += 1
+            log_info("[challenge] 인증 완료, 세션 갱신")
+            return True
+        finally:
+            try:
+                await page.close()
+                if browser is not None:
+                    await browser.close()
+            except Exception as e:
+                log_error(f"[challenge] 인증 창 정리 실패: {e}")
+
+    async def _wait_solved(self, page) -> bool:
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self.timeout
+        while loop.time() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                if page.is_closed():
+                    return False
+                if not looks_like_captcha(await page.content()):
+                    return True
+            except Exception:
+                # 운영자가 페이지를 이동하는 중이면 다음 확인에서 다시 본다
+                continue
+        return False
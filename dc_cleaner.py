@@ -4,10 +4,11 @@ import asyncio
 import json
 import os
 import random
+import re
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict
 from dotenv import load_dotenv
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
@@ -15,8 +16,28 @@ from dc_logger import log, LOG_VERSION, log_task_start, log_task_end
 import sys  # for exception logging
 
 from dc_login import login as dc_login
-from dc_post import fetch_posts
-from dc_delete_strategy import find_delete_button, try_meta_delete
+from dc_post import extract_gallog_items, fetch_posts, parse_gallog_items
+from dc_delete_strategy import (
+    DELETE_FAIL_PATTERNS, DELETE_SUCCESS_PATTERNS, FAIL_ALREADY_DELETED, FAIL_BLOCKED,
+    FAIL_INVALID_LINK, FAIL_NO_BUTTON, FAIL_TIMEOUT, PERMANENT_FAILURES, STRATEGY_BUTTON, STRATEGY_LISTING,
+    STRATEGY_META, DeleteStrategy, StrategyRegistry, classify_exception, classify_refusal, gallery_type,
+    listing_delete, page_has_captcha, try_meta_delete
+)
+from dc_http_engine import DCHttpDeleter, RESULT_DELETED, RESULT_NEED_BROWSER
+from dc_pipeline import DeletePipeline
+from dc_ledger import SYNC_GALLOG_COMPLETE, DeletionLedger
+from dc_metrics import MetricsWriter, StageTimer
+from dc_resource_policy import ResourcePolicy
+from dc_page_pool import PagePool
+from dc_challenge import ChallengeGate
+from dc_cookie import DCCookieManager, SESSION_VALID
+from dc_concurrency import AdaptiveLimiter
+from dc_diagnostics import Diagnostics
+from dc_memory import MemoryGuard, MemoryProfiler
+from dc_supervisor import BrowserSupervisor
+from dc_rate_limit import HostRateLimiter
+from dc_selectors import CONFIRM_BUTTON_SELECTORS, DELETE_BUTTON_SELECTORS, SelectorResolver
+from dc_wait import start_waiting, wait_for_text
 
 # 로그 파일: error_log_v1.2.0.txt 사용
 
@@ -26,23 +47,85 @@ class DCCleaner:
         self.username = os.getenv('DC_USERNAME')
         self.password = os.getenv('DC_PASSWORD')
         self.delay = 0.8  # Default delay between actions
+        # 삭제 확인 클릭 전 사람처럼 쉬는 랜덤 대기 배율 (0 이면 생략)
+        self.human_delay = float(os.getenv('DC_HUMAN_DELAY', '1.0'))
+        # DC_TRACEMALLOC=1 이면 단계별 파이썬 힙 최대 증가량 기록
+        self.memory_profiler = MemoryProfiler.from_env()
+        self.stage_timer = StageTimer(memory=self.memory_profiler)
+        # 단계별 히스토그램/카운터를 Prometheus 텍스트 + JSON 으로 주기적으로 기록
+        self.metrics_writer = MetricsWriter.from_env(self.stage_timer)
+        # 디버깅용 DOM 직렬화/HTML 덤프 (DC_DIAGNOSTICS=off|summary|full)
+        self.diagnostics = Diagnostics.from_env()
+        self.headless = os.getenv('DC_HEADLESS', '1') != '0'
+        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.page_pool: Optional[PagePool] = None
         self.cookies_path = Path('dc_cookies.json')
+        self.session_path = os.getenv('DC_SESSION_PATH', 'dc_session.json')
+        self.session_state: Optional[dict] = None
+        # 접속 주소 (벤치마크용 로컬 대역 서버를 가리키도록 바꿀 수 있음)
+        self.main_url = os.getenv('DC_MAIN_URL', 'https://www.dcinside.com')
+        self.login_url = os.getenv('DC_LOGIN_URL', 'https://sign.dcinside.com/login')
+        self.gallog_base = os.getenv('DC_GALLOG_BASE', 'https://gallog.dcinside.com').rstrip('/')
+        # 삭제 엔진: browser(기본, 게시글마다 탭 사용) | http(쿠키 재사용, 브라우저는 로그인/캡차만)
+        self.engine = os.getenv('DC_DELETE_ENGINE', 'browser').lower()
+        self.http_concurrency = int(os.getenv('DC_HTTP_CONCURRENCY', '8'))
+        self.http_deleter: Optional[DCHttpDeleter] = None
+        # 갤로그 목록 페이지에서 바로 삭제 (거부된 글만 게시글별 삭제로 넘김)
+        self.listing_delete = os.getenv('DC_LISTING_DELETE', '0') != '0'
+        # 목록 삭제 성공 횟수 (열거 중 현재 목록 페이지에서 글이 빠졌는지 판단)
+        self.listing_deleted = 0
+        # 삭제 전략: 갤러리 종류별 성공률/소요 시간을 학습해 (비용 / 성공률) 이 낮은 것부터 시도
+        self.strategies = StrategyRegistry.from_env()
+        # 삭제/확인 버튼 셀렉터 일괄 확인 + 페이지 종류별 학습
+        self.selectors = SelectorResolver()
+        if self.listing_delete:
+            self.strategies.register(DeleteStrategy(STRATEGY_LISTING, 0.3, self._listing_strategy, scope='listing'))
+        self.strategies.register(DeleteStrategy(STRATEGY_META, 0.5, self._meta_delete))
+        self.strategies.register(DeleteStrategy(STRATEGY_BUTTON, 3.0, self._button_delete))
+        # 동시 삭제 수 자동 조절 (AIMD)
+        default_max = 16 if self.engine == 'http' else 6
+        self.concurrency = AdaptiveLimiter(
+            initial=self.max_concurrent,
+            min_limit=int(os.getenv('DC_CONCURRENCY_MIN', '1')),
+            max_limit=int(os.getenv('DC_CONCURRENCY_MAX', str(default_max))),
+        )
+        # 캡차 감지 시 작업자 일시 정지 + 운영자용 헤드풀 창 (DC_CHALLENGE=0 이면 끔)
+        self.challenge = ChallengeGate.from_env()
+        # 호스트별 요청 속도 제한 (모든 워커 공유)
+        self.rate_limiter = HostRateLimiter.from_env()
+        # 삭제 원장 (재시작 시 이어서 진행, 영구 실패 글 skip)
+        self.ledger = DeletionLedger(os.getenv('DC_LEDGER_PATH', 'dc_ledger.sqlite3'))
+        # 갤로그 목록 색인 (다음 실행부터 새 페이지만 가져옴, DC_GALLOG_INDEX=0 이면 매번 전체 순회)
+        self.gallog_index = os.getenv('DC_GALLOG_INDEX', '1') != '0'
+        # 이미지/동영상/폰트/외부 호스트 요청 차단 (DC_BLOCK_RESOURCES=0 으로 끔)
+        self.resource_policy: Optional[ResourcePolicy] = None
+        if os.getenv('DC_BLOCK_RESOURCES', '1') != '0':
+            extra_allowed = [h.strip() for h in os.getenv('DC_ROUTE_ALLOW', '').split(',') if h.strip()]
+            self.resource_policy = ResourcePolicy(extra_allowed=extra_allowed)
+        # 브라우저 포함 RSS 가 DC_RSS_LIMIT_MB 를 넘으면 동시 삭제 상한을 낮춘다 (0 이면 끔)
+        self.memory_guard = MemoryGuard.from_env(self.concurrency)
+        # 브라우저/컨텍스트/메인 Page 종료 감지 시 재시작 + 저장된 세션 복원 (진행 중이던 글은 다시 큐로)
+        self.supervisor = BrowserSupervisor.from_env(self)
 
     async def init_browser(self):
         log_task_start('init_browser', module='DCCleaner')
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
-            headless=False,  # Run with GUI to handle CAPTCHAs
+        self.playwright = await async_playwright().start()
+        # 기본 헤드리스. 캡차는 ChallengeGate 가 필요할 때만 헤드풀 창을 따로 띄운다
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
             args=['--window-size=1280,720'],
             timeout=60000  # Increase timeout to 60 seconds
         )
         # Use desktop user agent
         desktop_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         
+        # 저장된 storage_state 가 있으면 쿠키/localStorage 를 복원한 컨텍스트로 시작
+        self.session_state = self.cookie_manager.load_state()
         self.context = await self.browser.new_context(
+            storage_state=self.session_state,
             viewport={'width': 1280, 'height': 720},
             user_agent=desktop_user_agent,
             extra_http_headers={
@@ -54,7 +137,18 @@ class DCCleaner:
                 'Upgrade-Insecure-Requests': '1'
             }
         )
+        if self.resource_policy:
+            await self.resource_policy.install(self.context)
+        self.rate_limiter.log_limits()
+        self.metrics_writer.start()
         self.page = await self.context.new_page()
+        # 삭제용 Page 는 현재 동시 삭제 수만큼 미리 만들고, 한도가 늘면 최대치까지 추가 생성
+        self.page_pool = PagePool(self.context, size=self.concurrency.max_limit, initial=self.concurrency.limit)
+        self.memory_guard.page_pool = self.page_pool
+        self.memory_guard.start()
+        if self.memory_profiler:
+            self.memory_profiler.start()
+        self.supervisor.attach()
 
     async def load_cookies(self) -> bool:
         log_task_start('load_cookies', module='DCCleaner')
@@ -65,12 +159,32 @@ class DCCleaner:
         log_task_end('load_cookies', module='DCCleaner')
         return True
 
-    async def save_cookies(self):
+    async def save_cookies(self, verified: bool = False):
         log_task_start('save_cookies', module='DCCleaner')
-        cookies = await self.context.cookies()
-        self.cookies_path.write_text(json.dumps(cookies))
+        # 쿠키 파일 + storage_state/만료 정보 (다음 실행에서 오프라인으로 세션 판정).
+        # verified=True 는 로그인 여부를 방금 확인했을 때만 (주기 저장은 이전 확인 시각 유지)
+        self.cookie_manager.save_state(await self.context.storage_state(), time.time() if verified else None)
         log_task_end('save_cookies', module='DCCleaner')
 
+    @property
+    def cookie_manager(self) -> DCCookieManager:
+        return DCCookieManager(
+            str(self.cookies_path), state_path=self.session_path,
+            refresh_margin=float(os.getenv('DC_SESSION_REFRESH_MARGIN', '3600')),
+        )
+
+    async def _probe_session(self) -> bool:
+        # 페이지 렌더링 없이 메인 페이지 HTML 만 받아 로그인 여부 확인 (컨텍스트 쿠키 공유)
+        from dc_logger import log_error
+        try:
+            await self.rate_limiter.acquire(self.main_url)
+            response = await self.context.request.get(self.main_url, timeout=15000)
+            body = await response.text()
+        except Exception as e:
+            log_error(f"[login] 세션 확인 요청 실패: {e}")
+            return False
+        return response.ok and not re.search(r'id=["\']login_process["\']', body)
+
     async def login(self):
         log_task_start('login', module='DCCleaner')
         if not self.username or not self.password:
@@ -78,11 +192,20 @@ class DCCleaner:
         
         print(f"Attempting to login with username: {self.username}")
 
-        if await self.load_cookies():
-            # Verify if cookies are still valid
-            await self.page.goto('https://www.dcinside.com', timeout=60000)  # 60 seconds timeout
-            if await self.page.locator('#login_process').count() == 0:
+        from dc_logger import log_info
+        status = self.cookie_manager.session_status()
+        log_info(f"[login] 저장된 세션 상태: {status}")
+        if status == SESSION_VALID and self.session_state:
+            # 만료까지 여유가 있으면 확인 페이지 로드 없이 바로 사용
+            print("Successfully logged in using saved session")
+            log_task_end('login', module='DCCleaner')
+            return
+        # 만료 임박/만료/세션 정보 없음: 쿠키를 가볍게 확인하고 실패할 때만 재로그인
+        if self.session_state or await self.load_cookies():
+            if await self._probe_session():
                 print("Successfully logged in using cookies")
+                await self.save_cookies(verified=True)
+                log_task_end('login', module='DCCleaner')
                 return
 
         print("Starting login process...")
@@ -93,7 +216,7 @@ class DCCleaner:
         try:
             # Go directly to login page
             print("Navigating to login page...")
-            await self.page.goto('https://sign.dcinside.com/login', timeout=60000)
+            await self._goto(self.page, self.login_url, timeout=60000)
             await asyncio.sleep(2 + random.random() * 2)
             
             # Wait for login form fields
@@ -123,6 +246,7 @@ class DCCleaner:
                     login_button = await self.page.wait_for_selector(selector, timeout=5000)
                     if login_button:
                         print(f"Found login button with selector: {selector}")
+                        await self.rate_limiter.acquire(self.login_url)
                         await login_button.click()
                         break
                 except Exception:
@@ -134,11 +258,12 @@ class DCCleaner:
             await asyncio.sleep(2 + random.random() * 2)
             
             # Go to main page to verify login
-            await self.page.goto('https://www.dcinside.com', timeout=60000)
+            await self._goto(self.page, self.main_url, timeout=60000)
             await asyncio.sleep(2 + random.random() * 2)
             
             # Verify login success
-            if await self.page.query_selector('.user_info') or await self.page.query_selector('.logout'):
+            logged_in = bool(await self.page.query_selector('.user_info') or await self.page.query_selector('.logout'))
+            if logged_in:
                 print("Login successful!")
             else:
                 print("Login might have failed - could not find logged-in indicators")
@@ -149,447 +274,430 @@ class DCCleaner:
             
             raise
         
-        # Save cookies for future use
-        await self.save_cookies()
+        # Save cookies for future use (로그인 확인에 실패했으면 다음 실행에서 다시 확인하도록 미확인으로 저장)
+        await self.save_cookies(verified=logged_in)
         print("Successfully logged in and saved cookies")
         log_task_end('login', module='DCCleaner')
 
+    async def _goto(self, page, url: str, **kwargs):
+        await self.rate_limiter.acquire(url)
+        return await page.goto(url, **kwargs)
+
+    def gallog_url(self, page_no: int = 1) -> str:
+        base = f'{self.gallog_base}/{self.username}/posting'
+        return base if page_no <= 1 else f'{base}?p={page_no}'
+
+    def listing_delete_url(self) -> str:
+        return f'{self.gallog_base}/{self.username}/ajax/log_list_ajax/delete'
+
+    async def delete_from_listing(self, post: dict) -> bool:
+        # iter_gallog_posts 가 멈춰 있는 동안 self.page 는 해당 목록 페이지에 그대로 있다
+        url = self.listing_delete_url()
+        await self.rate_limiter.acquire(url)
+        started = time.perf_counter()
+        try:
+            ok, reason = await listing_delete(self.page, url, post['gallog_no'])
+        finally:
+            self.stage_timer.record('listing_delete', time.perf_counter() - started)
+        if not ok:
+            post['fail_reason'] = reason
+            post['blocked'] = reason == FAIL_BLOCKED
+        else:
+            self.listing_deleted += 1
+        return ok
+
+    async def _listing_strategy(self, post: dict, page=None) -> Optional[bool]:
+        if not post.get('gallog_no'):
+            return None
+        return await self.delete_from_listing(post)
+
     async def get_posts_from_gallog(self, hours_ago: float = 1.0) -> List[dict]:
-        posts = []
-        cutoff_time = datetime.now() - timedelta(hours=hours_ago)
-        
         # Go to gallog
         print("Navigating to gallog...")
-        await self.page.goto(f'https://gallog.dcinside.com/{self.username}/posting', timeout=60000)
+        await self._goto(self.page, self.gallog_url(), timeout=60000)
         await self.page.wait_for_load_state('networkidle')
         await asyncio.sleep(2)
-        
-        
-        
-        
-        # Get all posts from the gallog
-        print("Finding posts...")
-        post_elements = await self.page.query_selector_all('.cont_listbox li, .list_box li')
-        print(f"Found {len(post_elements)} post elements")
-        
-        for post in post_elements:
-            try:
-                # Try different date selectors
-                date_text = None
-                for selector in ['.date', '.gall_date', 'time']:
-                    date_text = await post.query_selector(selector)
-                    if date_text:
-                        break
-                
-                if not date_text:
-                    print("Could not find date element")
-                    continue
-                
-                date_str = await date_text.inner_text()
-                date_str = date_str.strip()
-                print(f"Found date: {date_str}")
-                
-                # 시간이 없는 경우 현재 시간으로 설정
-                if len(date_str.split()) == 1:
-                    date_str = f"{date_str} 00:00"
-                post_date = datetime.strptime(date_str, '%Y.%m.%d %H:%M')
-                
-                if post_date > cutoff_time:
-                    continue
-                
-                # Try different title selectors
-                title_element = None
-                for selector in ['.txt_box', '.subject', 'a']:
-                    title_element = await post.query_selector(selector)
-                    if title_element:
-                        break
-                
-                if not title_element:
-                    print("Could not find title element")
-                    continue
-                
-                title = await title_element.inner_text()
-                
-                # Try different link selectors
-                link_element = await post.query_selector('a')
-                if not link_element:
-                    print("Could not find link element")
-                    continue
-                
-                link = await link_element.get_attribute('href')
-                
-                print(f"Found post: {title} ({date_str})")
-                posts.append({
-                    'title': title,
-                    'link': link,
-                    'date': post_date
-                })
-            except Exception as e:
-                print(f"Error parsing post: {e}")
-                continue
-            
+        posts, _ = await self._parse_gallog_page(hours_ago)
         return posts
 
+    async def iter_gallog_posts(self, hours_ago: float = 1.0, max_pages: Optional[int] = None) -> AsyncIterator[dict]:
+        # 갤로그 전체 페이지(?p=N)를 순회하며 찾는 즉시 게시글을 yield
+        cutoff_time = datetime.now() - timedelta(hours=hours_ago)
+        if self.gallog_index:
+            async for post in self._iter_indexed_posts(cutoff_time, max_pages):
+                yield post
+            return
+        page_no = 1
+        prev_links = None
+        while max_pages is None or page_no <= max_pages:
+            print(f"Navigating to gallog page {page_no}...")
+            deleted_before = self.listing_deleted
+            # 목록은 서버 렌더링이므로 DOMContentLoaded 이후 바로 파싱 (networkidle/sleep 불필요)
+            await self._goto(self.page, self.gallog_url(page_no), wait_until='domcontentloaded', timeout=60000)
+            posts, links = await self._parse_gallog_page(hours_ago, cutoff_time)
+            # 마지막 페이지를 넘기면 빈 목록이거나 같은 목록이 반복된다
+            if not links or links == prev_links:
+                break
+            for post in posts:
+                yield post
+            prev_links, page_no = self._next_gallog_page(links, page_no, deleted_before)
+
+    async def _iter_indexed_posts(self, cutoff_time: datetime, max_pages: Optional[int]) -> AsyncIterator[dict]:
+        # 새 글이 있는 앞쪽 페이지만 가져와 색인에 추가하고, 이미 모두 색인된 페이지를 만나면 순회를 멈춘다.
+        # 마지막 페이지까지 한 번 색인하기 전에는 전체 페이지를 순회한다. 대상 글은 색인 날짜 범위 조회로 고른다
+        from dc_logger import log_info
+        synced = self.ledger.sync_value(SYNC_GALLOG_COMPLETE) == '1'
+        yielded = set()
+        page_no = 1
+        prev_links = None
+        while max_pages is None or page_no <= max_pages:
+            print(f"Navigating to gallog page {page_no}...")
+            deleted_before = self.listing_deleted
+            await self._goto(self.page, self.gallog_url(page_no), wait_until='domcontentloaded', timeout=60000)
+            items = await extract_gallog_items(self.page)
+            links = [item[2] for item in items if item[2]]
+            if not links or links == prev_links:
+                self.ledger.set_sync_value(SYNC_GALLOG_COMPLETE, '1')
+                break
+            known = self.ledger.indexed_links(links)
+            # 날짜 파싱은 처음 보는 글만
+            new_posts = parse_gallog_items(items, skip_links=known)
+            self.ledger.index_posts(new_posts)
+            print(f"Found {len(links)} post elements, {len(new_posts)} new")
+            for post in new_posts:
+                if post['title'] is not None and post['date'] is not None and post['date'] <= cutoff_time:
+                    yielded.add(post['link'])
+                    yield post
+            if synced and len(known) == len(set(links)):
+                log_info(f"[gallog] {page_no}페이지가 모두 색인되어 있음 -> 목록 순회 중단", module='DCCleaner')
+                break
+            prev_links, page_no = self._next_gallog_page(links, page_no, deleted_before)
+        for post in self.ledger.indexed_posts(cutoff_time):
+            if post['link'] not in yielded:
+                yield post
+
+    def _next_gallog_page(self, links: List[str], page_no: int, deleted_before: int):
+        # 이 페이지를 도는 동안 목록 삭제가 있었으면 뒤 글이 앞으로 당겨지므로 같은 페이지를 다시 읽는다.
+        # (다시 읽은 목록이 이전과 같아도 끝으로 보지 않도록 prev_links 를 비움)
+        if self.listing_deleted != deleted_before:
+            return None, page_no
+        return links, page_no + 1
+
+    async def _parse_gallog_page(self, hours_ago: float, cutoff_time: Optional[datetime] = None):
+        # 목록 전체를 page.evaluate 한 번으로 추출 (항목별 query_selector/inner_text 왕복 제거)
+        posts, links = await fetch_posts(self.page, hours_ago, cutoff_time)
+        print(f"Found {len(links)} post elements, {len(posts)} posts older than cutoff")
+        return posts, links
+
     async def delete_post_with_page(self, post: dict, page) -> bool:
+        # 한 번만 시도한다. 실패 시 재시도는 파이프라인의 RetryScheduler 가 실패 사유별 backoff 로 예약
         print("[DEBUG] delete_post_with_page 진입 (최상단)")
         log_task_start('delete_post', module='DCCleaner')
         from dc_logger import log_info, log_error
-        import traceback
-        max_retry = 2
-        import time as _time
-        for attempt in range(1, max_retry+1):
-            print(f"[DEBUG] delete_post 루프 진입: attempt={attempt}")
-            try:
-                _start_time = _time.time()
-                # 페이지/브라우저가 닫혀있으면 복구 시도
-                await page.goto(post['link'], timeout=45000)
-                await page.wait_for_load_state('networkidle', timeout=45000)
-                await asyncio.sleep(2)
-                # 게시글 상세 페이지가 아니면 삭제 버튼 탐색 모두 생략
-                if "/board/view" not in post['link']:
-                    print("[DEBUG] delete_post: 링크 패턴 불일치 분기")
-                    log_info(f"[delete_post] Invalid post link pattern: {post['link']} -> Skipping.")
-                    return False
-
-                current_url = page.url
-                if "/board/view/" not in current_url and "/board/" not in current_url:
-                    print("[DEBUG] delete_post: 상세페이지 아님 분기")
-                    log_info(f"[delete_post] Not a post detail page: {current_url} (expected: {post['link']}) -> Skipping delete button search.")
-                    ts = int(time.time())
-                    
-                    with open(f"not_detail_{ts}.html", "w", encoding="utf-8") as f:
-                        f.write(await page.content())
-                    return False
-                print("[DEBUG] delete_post: 정상 상세페이지 진입")
-                
+        timer = self.stage_timer
+        try:
+            # 게시글 상세 페이지가 아니면 삭제 버튼 탐색 모두 생략
+            if "/board/view" not in post['link']:
+                print("[DEBUG] delete_post: 링크 패턴 불일치 분기")
+                log_info(f"[delete_post] Invalid post link pattern: {post['link']} -> Skipping.")
+                post['fail_reason'] = FAIL_INVALID_LINK
+                return False
+            # 광고가 많은 페이지라 networkidle 대신 DOMContentLoaded 까지만 대기 (삭제 버튼은 서버 렌더링)
+            await self.rate_limiter.acquire(post['link'])
+            with timer.stage('navigate'):
+                await page.goto(post['link'], wait_until='domcontentloaded', timeout=45000)
 
-                # 동영상 포함 게시물 감지 및 삭제 버튼 탐색 최적화
-                video_selectors = [
-                    'iframe[src*="youtube"]',
-                    'iframe[src*="naver"]',
-                    'iframe[src*="kakao"]',
-                    'video',
-                    '.video_area',
-                    '.ytp-player'
-                ]
-                has_video = False
-                for selector in video_selectors:
-                    if await page.query_selector(selector):
-                        has_video = True
-                        break
-                delete_button = None
-                delete_selectors = [
-                    'button.btn_grey.cancle',
-                    "button:has-text('삭제')",
-                    "input[type=button][value=삭제]"
-                ]
-                # 삭제 버튼 탐색/클릭 try-except로 감싸고, detach 발생 시 재탐색
-                print("[DEBUG] delete_post: 삭제 버튼 탐색 루프 진입")
-                for selector in delete_selectors:
-                    try:
-                        delete_button = await page.query_selector(selector)
-                        if delete_button:
-                            print(f"[DEBUG] delete_post: 삭제 버튼 발견 및 클릭 시도: {selector}")
-                            try:
-                                print("[DEBUG] 삭제 버튼 is_enabled:", await delete_button.is_enabled())
-                                print("[DEBUG] 삭제 버튼 is_visible:", await delete_button.is_visible())
-                                await delete_button.hover()
-                                await asyncio.sleep(0.5)
-                                await delete_button.focus()
-                                await asyncio.sleep(0.2)
-                                await page.evaluate('(el) => el.click()', delete_button)
-                                await asyncio.sleep(0.5)
-                                print(f"[DEBUG] 삭제 버튼 (사람처럼) 클릭 후 URL: {page.url}")
-                                content_snippet = await page.content()
-                                print(f"[DEBUG] 삭제 버튼 클릭 후 본문 일부: {content_snippet[:300]}")
-                                
-                                log_info(f"[delete_post] 삭제 버튼 클릭 성공: {selector}")
-                                await asyncio.sleep(1)
-                                # 삭제 확인 페이지 처리
-                                if '/board/delete/' in page.url:
-                                    print("[DEBUG] delete_post: 정상 삭제 확인 페이지 진입 (최신 네트워크/본문 판정 분기)")
-                                    # robust selector for 최종 삭제 버튼
-                                    confirm_btn = await page.query_selector("button.btn_blue.btn_svc[type=submit]:has-text('삭제')")
-                                    if not confirm_btn:
-                                        confirm_btn = await page.query_selector("input[type=submit][value=삭제], button:has-text('삭제')")
-                                    if confirm_btn:
-                                        try:
-                                            import random
-                                            log_info("[delete_post] [delete 페이지] 삭제 확인 버튼 클릭 전 스크린샷 저장")
-                                            
-                                            # 사람처럼 랜덤 대기
-                                            rand_delay1 = random.uniform(1.2, 2.8)
-                                            log_info(f"[delete_post] [anti-bot] 삭제 버튼 클릭 전 랜덤 대기: {rand_delay1:.2f}s")
-                                            await asyncio.sleep(rand_delay1)
-                                            # 마우스 이동
-                                            box = await confirm_btn.bounding_box()
-                                            if box:
-                                                steps = random.randint(8, 20)
-                                                await page.mouse.move(box['x'] + box['width']/2, box['y'] + box['height']/2, steps=steps)
-                                                rand_delay2 = random.uniform(0.1, 0.4)
-                                                log_info(f"[delete_post] [anti-bot] 삭제 버튼 마우스 이동 후 대기: {rand_delay2:.2f}s (steps={steps})")
-                                                await asyncio.sleep(rand_delay2)
-                                            # 클릭 (사람처럼 딜레이)
-                                            click_delay = random.randint(80, 180)
-                                            log_info(f"[delete_post] [anti-bot] 삭제 버튼 클릭 (delay={click_delay}ms)")
-                                            await confirm_btn.click(delay=click_delay)
-                                            log_info("[delete_post] 삭제 확인 버튼 클릭 성공 (최종 삭제)")
-                                            await asyncio.sleep(0.5)
-                                            log_info("[delete_post] [delete 페이지] 삭제 확인 버튼 클릭 후 스크린샷 저장")
-                                            
-                                            # 버튼 사라졌는지 또는 페이지 이동 확인
-                                            gone = False
-                                            try:
-                                                await confirm_btn.is_visible()
-                                            except Exception:
-                                                gone = True
-                                            if gone:
-                                                log_info("[delete_post] 삭제 확인 버튼 클릭 후 버튼이 사라짐 또는 페이지 이동 감지")
-
-                                            log_info("[delete_post] [delete 페이지] 삭제 확인 버튼 클릭 후 서버 반영 대기 (4초)")
-                                            # --- 네트워크 응답 감지 ---
-                                            delete_response = None
-                                            try:
-                                                async with page.expect_response(
-                                                    lambda resp: ('delete' in resp.url or 'remove' in resp.url) and resp.status in [200, 302, 303, 204, 403], timeout=5000
-                                                ) as resp_info:
-                                                    await confirm_btn.click()
-                                                delete_response = await resp_info.value
-                                                log_info(f"[delete_post] [network] 삭제 관련 응답 감지: {delete_response.status} {delete_response.url}")
-                                                print(f"[delete_post] [network] 삭제 관련 응답 감지: {delete_response.status} {delete_response.url}")
-                                                # --- 본문까지 체크 ---
-                                                resp_text = ""
-                                                try:
-                                                    resp_text = await delete_response.text()
-                                                except Exception:
-                                                    pass
-                                                fail_patterns = [
-                                                    "삭제할 권한이 없습니다",
-                                                    "이미 삭제된 게시물",
-                                                    "삭제 실패",
-                                                    "not allowed",
-                                                    "error",
-                                                    "권한이 없습니다",
-                                                    "삭제할 수 없습니다"
-                                                ]
-                                                if any(pat in resp_text for pat in fail_patterns):
-                                                    print(f"[delete_post] [network] 삭제 응답 본문에 실패 메시지 감지: {resp_text[:100]}")
-                                                    log_info(f"[delete_post] [network] 삭제 응답 본문에 실패 메시지 감지: {resp_text[:100]}")
-                                                else:
-                                                    print(f"[delete_post] [network] 삭제 응답 본문 OK: {resp_text[:100]}")
-                                                    log_info(f"[delete_post] [network] 삭제 응답 본문 OK: {resp_text[:100]}")
-                                            except Exception as e:
-                                                log_info(f"[delete_post] [network] 삭제 관련 응답 감지 실패: {e}")
-                                                print(f"[delete_post] [network] 삭제 관련 응답 감지 실패: {e}")
-                                            await asyncio.sleep(4)
-                                            # --- 삭제 후 페이지에서 성공/실패 텍스트 직접 확인 ---
-                                            page_content = await page.content()
-                                            success_phrases = [
-                                                '삭제되었습니다',
-                                                '존재하지 않는 게시물입니다',
-                                                '복구할 수 없습니다',
-                                                '삭제 처리',
-                                                '삭제된 게시물',
-                                                '삭제 완료',
-                                            ]
-                                            detected = None
-                                            for phrase in success_phrases:
-                                                if phrase in page_content:
-                                                    detected = phrase
-                                                    break
-                                            if detected:
-                                                log_info(f"[delete_post] [detect] 삭제 성공 텍스트 감지: '{detected}'")
-                                                print(f"[delete_post] [detect] 삭제 성공 텍스트 감지: '{detected}'")
-                                            else:
-                                                log_info(f"[delete_post] [detect] 삭제 성공 텍스트 미감지. 본문 일부: {page_content[:200]}")
-                                                print(f"[delete_post] [detect] 삭제 성공 텍스트 미감지. 본문 일부: {page_content[:200]}")
-                                            # 삭제 성공 조건: 네트워크 응답이 200/302/303/204/403 중 하나이거나, 성공 텍스트 감지
-                                            delete_success = False
-                                            if detected or (delete_response and delete_response.status in [200, 302, 303, 204, 403]):
-                                                delete_success = True
-                                            if delete_success:
-                                                log_info("[delete_post] [RESULT] 삭제 성공 판정")
-                                                print("[delete_post] [RESULT] 삭제 성공 판정")
-                                                return True
-                                            else:
-                                                log_info("[delete_post] [RESULT] 삭제 실패 판정")
-                                                print("[delete_post] [RESULT] 삭제 실패 판정")
-                                                return False
-                                        except Exception as click_exc:
-                                            log_error(f"[delete_post] 삭제 확인 버튼 클릭 실패: {click_exc}")
-                                            
-                                            return False
-                                        try:
-                                            await self.page.wait_for_load_state('networkidle', timeout=10000)
-                                        except Exception as e:
-                                            log_info(f"[delete_post] wait_for_load_state 예외: {e}")
-                                        delete_confirm_time = _time.time()
-                                        # 최대 10초 동안 1초 간격으로 삭제 성공 패턴 polling
-                                        poll_success = False
-                                        poll_count = 0
-                                        last_page_content = None
-                                        delete_success_patterns = [
-                                            "삭제된 게시물", "존재하지 않는 게시물", "없는 게시물", "삭제되었습니다", "삭제 처리되었습니다",
-                                            "삭제가 완료되었습니다", "삭제하신 게시물이 존재하지 않습니다", "해당 게시물을 찾을 수 없습니다",
-                                            "삭제 또는 이동된 게시물입니다", "삭제된 글입니다"
-                                        ]
-                                        for poll_count in range(1, 11):
-                                            await asyncio.sleep(1)
-                                            await self.page.reload()
-                                            await asyncio.sleep(0.5)
-                                            last_page_content = await self.page.content()
-                                            if any(pattern in last_page_content for pattern in delete_success_patterns):
-                                                poll_success = True
-                                                log_info(f"[delete_post] polling {poll_count}: 삭제 성공 패턴 감지 (즉시 break)")
-                                                print(f"\033[96m[delete_post] polling {poll_count}: 삭제 성공 패턴 감지\033[0m")
-                                                break
-                                            else:
-                                                log_info(f"[delete_post] polling {poll_count}: 삭제 성공 패턴 미감지")
-                                                print(f"\033[93m[delete_post] polling {poll_count}: 삭제 성공 패턴 미감지\033[0m")
-                                        verify_start_time = _time.time()
-                                        log_info(f"[delete_post] 삭제 확인~검증 대기 시간: {verify_start_time - delete_confirm_time:.2f}s, polling 횟수: {poll_count}, polling 결과: {'성공' if poll_success else '타임아웃'}")
-                                        # polling 마지막 page_content를 아래 검증 로직에서 재활용
-                                        page_content = last_page_content if last_page_content is not None else await self.page.content()
-                                        if poll_success:
-                                            log_info("[delete_post] polling 성공 후 추가 대기 (3초)")
-                                            await asyncio.sleep(3)
-                                        await asyncio.sleep(0.5)
-
-                                    else:
-                                        log_error("[delete_post] 삭제 확인 버튼을 찾지 못함 (최종 삭제 단계)")
-                                        
-                                        return False
-                                # 삭제 후 실제 삭제 여부 검증
-                                await self.page.reload()
-                                await asyncio.sleep(1)
-                                page_content = await self.page.content()
-                                delete_success_patterns = [
-                                    "삭제된 게시물", "존재하지 않는 게시물", "없는 게시물", "삭제되었습니다", "삭제 처리되었습니다",
-                                    "삭제가 완료되었습니다", "삭제하신 게시물이 존재하지 않습니다", "해당 게시물을 찾을 수 없습니다",
-                                    "삭제 또는 이동된 게시물입니다", "삭제된 글입니다"
-                                ]
-                                # 1차: 삭제 패턴 체크
-                                deleted = any(pattern in page_content for pattern in delete_success_patterns)
-                                # 2차: 실제로 접근해서 본문이 남아있는지 재확인 (최대 3회 polling)
-                                is_deleted = False
-                                content_area = None
-                                from bs4 import BeautifulSoup
-                                for verify_attempt in range(1, 4):
-                                    await asyncio.sleep(1.5)
-                                    log_info(f"[delete_post] 게시글 삭제 검증 재접근 시도 {verify_attempt}/3")
-                                    await self.page.goto(post['link'], timeout=20000)
-                                    await asyncio.sleep(1)
-                                    verify_content = await self.page.content()
-                                    is_deleted = any(p in verify_content for p in delete_success_patterns)
-                                    soup = BeautifulSoup(verify_content, 'html.parser')
-                                    content_area = soup.select_one('.gallview, .write_div, .write_content')
-                                    # 삭제 버튼이 또 있으면 반복적으로 삭제 시도
-                                    delete_btn_retry = None
-                                    for selector in [
-                                        'button.btn_grey.cancle',
-                                        "button:has-text('삭제')",
-                                        "input[type=button][value=삭제]"
-                                    ]:
-                                        delete_btn_retry = await self.page.query_selector(selector)
-                                        if delete_btn_retry:
-                                            break
-                                    if delete_btn_retry:
-                                        log_info(f"[delete_post] 게시글 재접근 {verify_attempt}회차: 삭제 버튼 발견, 반복 삭제 시도")
-                                        try:
-                                            await delete_btn_retry.click()
-                                            log_info(f"[delete_post] 재삭제 버튼 클릭 성공: {selector}")
-                                            await asyncio.sleep(1)
-                                            # 삭제 확인 버튼도 다시 시도
-                                            if '/board/delete/' in self.page.url:
-                                                confirm_btn_retry = await self.page.query_selector("input[type=submit][value=삭제], button:has-text('삭제')")
-                                                if confirm_btn_retry:
-                                                    await confirm_btn_retry.click()
-                                                    log_info("[delete_post] 재삭제 확인 버튼 클릭 성공 (최종)")
-                                                    try:
-                                                        await self.page.wait_for_load_state('networkidle', timeout=10000)
-                                                    except Exception as e:
-                                                        log_info(f"[delete_post] 재삭제 wait_for_load_state 예외: {e}")
-                                                    log_info("[delete_post] 재삭제 후 추가 대기 (4초)")
-                                                    await asyncio.sleep(4)
-                                                    # 재시도 후 바로 다음 검증으로 넘어감
-                                                    continue
-                                        except Exception as re_del_e:
-                                            log_info(f"[delete_post] 재삭제 버튼 클릭 예외: {re_del_e}")
-                                    if (is_deleted or not content_area):
-                                        log_info(f"[delete_post] 게시글 검증 {verify_attempt}회차: 삭제 성공 패턴 감지 또는 본문 없음")
-                                        break
-                                    else:
-                                        log_info(f"[delete_post] 게시글 검증 {verify_attempt}회차: 본문 영역 존재, 삭제 미확인")
-
-                                elapsed = _time.time() - _start_time
-                                # 확인~검증 대기 시간은 위에서 이미 계산한 verify_start_time - delete_confirm_time 사용
-                                confirm_verify_time = 0.0
-                                try:
-                                    confirm_verify_time = verify_start_time - delete_confirm_time
-                                except Exception:
-                                    pass
-                                if (deleted or is_deleted) and not content_area:
-                                    msg = f"[delete_post] [SUCCESS] Post deleted and not accessible: {post['title']} (총소요: {elapsed:.2f}s, 확인~검증: {confirm_verify_time:.2f}s)"
-                                    log_info(msg)
-                                    print(f"\033[92m{msg}\033[0m")
-                                    log_task_end('delete_post', module='DCCleaner')
-                                    return True
-                                else:
-                                    msg = f"[delete_post] [FAIL] Post still exists or accessible after deletion attempt: {post['title']} at {self.page.url} (총소요: {elapsed:.2f}s, 확인~검증: {confirm_verify_time:.2f}s)"
-                                    log_error(msg)
-                                    print(f"\033[91m{msg}\033[0m")
-                                    
-                                    log_task_end('delete_post', module='DCCleaner')
-                                    return False
-                            except Exception as click_e:
-                                log_error(f"[delete_post] 삭제 버튼 클릭 예외: {click_e}")
-                                # detach 등 예외 발생 시 재탐색
-                                continue
-                    except Exception as e:
-                        log_error(f"[delete_post] 삭제 버튼 탐색 예외: {e}")
-                        continue
-                # 삭제 버튼 없으면 메타 삭제 시도
-                content = await self.page.content()
-                import re
-                m = re.search(r"goDelete\('([^']+)'\)", content)
-                meta_delete_url = m.group(1) if m else None
-                if meta_delete_url:
-                    try:
-                        response = await self.page.request.post(meta_delete_url)
-                        log_info(f"[delete_post] 직접 삭제 요청 결과: {response.status}")
-                        if response.status == 200:
-                            return True
-                        else:
-                            continue
-                    except Exception as e:
-                        log_error(f"[delete_post] 직접 삭제 요청 예외: {e}", exc_info=sys.exc_info())
-                        continue
-                else:
-                    log_info(f"[delete_post] 삭제 버튼/삭제 URL 모두 탐색 실패.")
+            current_url = page.url
+            if "/board/view/" not in current_url and "/board/" not in current_url:
+                print("[DEBUG] delete_post: 상세페이지 아님 분기")
+                log_info(f"[delete_post] Not a post detail page: {current_url} (expected: {post['link']}) -> Skipping delete button search.")
+                await self.diagnostics.capture(page, 'not_detail')
+                return False
+            print("[DEBUG] delete_post: 정상 상세페이지 진입")
+            # 학습된 (비용 / 성공률) 순으로 삭제 전략 시도. 해당 없는 전략(None)은 건너뛴다
+            kind = gallery_type(post['link'])
+            attempted = False
+            planned = self.strategies.plan(kind)
+            self.strategies.skip_excluded(kind, planned)
+            for strategy in planned:
+                started = time.perf_counter()
+                result = await strategy.run(post, page)
+                if result is None:
                     continue
-            except Exception as e:
-                log_error(f"[delete_post] 예외 발생 (attempt {attempt}): {e}", exc_info=sys.exc_info())
-                
-                if attempt == max_retry:
-                    return False
-                # 페이지 복구 후 재시도
-                try:
-                    self.page = await self.context.new_page()
-                except Exception as e2:
-                    log_error(f"[delete_post] 페이지 복구 실패: {e2}", exc_info=sys.exc_info())
+                attempted = True
+                self.strategies.record(kind, strategy.name, result, time.perf_counter() - started,
+                                       post.get('fail_reason'))
+                if result:
+                    post['strategy'] = strategy.name
+                    log_task_end('delete_post', module='DCCleaner')
+                    return True
+                # 권한 거부/차단/캡차는 다른 전략도 같은 결과이므로 더 시도하지 않는다 (차단 중 요청을 늘리지 않음)
+                if post.get('fail_reason') in PERMANENT_FAILURES + (FAIL_BLOCKED,) or post.get('captcha'):
                     return False
+            if attempted:
+                return False
+            log_info(f"[delete_post] 삭제 버튼/삭제 URL 모두 탐색 실패.")
+            # 삭제 버튼이 없으면 캡차/차단 페이지인지 확인 (동시 삭제 수 감소 신호)
+            post['captcha'] = await page_has_captcha(page)
+            post['fail_reason'] = FAIL_BLOCKED if post['captcha'] else FAIL_NO_BUTTON
+            return False
+        except Exception as e:
+            log_error(f"[delete_post] 예외 발생: {e}", exc_info=sys.exc_info())
+            post['fail_reason'] = classify_exception(e)
+            return False
+
+    async def _meta_delete(self, post: dict, page) -> Optional[bool]:
+        with self.stage_timer.stage('meta_delete'):
+            return await try_meta_delete(page, post, self.rate_limiter)
+
+    async def _button_delete(self, post: dict, page) -> Optional[bool]:
+        # 삭제 버튼 클릭 -> 확인 페이지. 버튼이 없으면 None
+        from dc_logger import log_info, log_error
+        timer = self.stage_timer
+        # 삭제 버튼 후보를 evaluate_handle 한 번으로 확인하고 찾은 요소를 그대로 클릭 (학습된 셀렉터 우선)
+        with timer.stage('button_lookup'):
+            delete_button, selector = await self.selectors.query(page, 'delete_button', DELETE_BUTTON_SELECTORS)
+        if not delete_button:
+            return None
+        print(f"[DEBUG] delete_post: 삭제 버튼 발견 및 클릭 시도: {selector}")
+        waiter = None
+        try:
+            await self.diagnostics.element_state(delete_button, '삭제 버튼')
+            # 클릭하면 삭제 확인 페이지로 이동하므로 요청 제한을 거친다
+            await self.rate_limiter.acquire(post['link'])
+            with timer.stage('delete_click'):
+                await delete_button.hover()
+                await delete_button.focus()
+                # 클릭 -> 페이지 이동(보통 삭제 확인 페이지 /board/delete/)까지 대기.
+                # 클릭 전 글 보기 페이지에는 본문/댓글/관련 글 목록에 삭제 문구가 있을 수 있어 문구는 이동 후에만 본다
+                view_url = page.url
+                waiter = await start_waiting(page, timeout=10000, url=lambda url: url != view_url)
+                await page.evaluate('(el) => el.click()', delete_button)
+                signal, value = await waiter
+            print(f"[DEBUG] 삭제 버튼 (사람처럼) 클릭 후 URL: {page.url} (신호: {signal})")
+            await self.diagnostics.snippet(page, '삭제 버튼 클릭 후 본문 일부', 300)
+            log_info(f"[delete_post] 삭제 버튼 클릭 성공: {selector}")
+        except Exception as click_e:
+            # detach 등으로 클릭하지 못하면 다른 전략으로 넘긴다 (걸어 둔 대기 태스크/리스너도 정리)
+            if waiter is not None:
+                waiter.cancel()
+            log_error(f"[delete_post] 삭제 버튼 클릭 예외: {click_e}")
+            return None
+        # 삭제 확인 페이지 처리
+        if '/board/delete/' in page.url:
+            return await self._confirm_delete(post, page)
+        # 확인 페이지 없이 다른 페이지로 이동했고 그 페이지에 삭제 문구가 뜬 경우만 성공.
+        # 실제 삭제 여부는 검증 단계(dc_verify)에서 확인
+        result = signal == 'url' and await wait_for_text(page, DELETE_SUCCESS_PATTERNS, timeout=3000) is not None
+        log_info(f"[delete_post] 확인 페이지 없이 처리됨: 삭제 문구 {'감지' if result else '미감지'}")
+        return result
+
+    async def _confirm_delete(self, post: dict, page) -> bool:
+        from dc_logger import log_info, log_error
+        print("[DEBUG] delete_post: 정상 삭제 확인 페이지 진입 (최신 네트워크/본문 판정 분기)")
+        # 최종 삭제 버튼 (후보를 evaluate 한 번으로 확인)
+        confirm_btn, _ = await self.selectors.query(page, 'confirm_button', CONFIRM_BUTTON_SELECTORS)
+        if not confirm_btn:
+            log_error("[delete_post] 삭제 확인 버튼을 찾지 못함 (최종 삭제 단계)")
+            return False
+        waiter = None
+        try:
+            # 사람처럼 랜덤 대기 (anti-bot, DC_HUMAN_DELAY 배율로 조절)
+            rand_delay1 = random.uniform(1.2, 2.8) * self.human_delay
+            log_info(f"[delete_post] [anti-bot] 삭제 버튼 클릭 전 랜덤 대기: {rand_delay1:.2f}s")
+            await asyncio.sleep(rand_delay1)
+            # 마우스 이동
+            box = await confirm_btn.bounding_box()
+            if box:
+                steps = random.randint(8, 20)
+                await page.mouse.move(box['x'] + box['width']/2, box['y'] + box['height']/2, steps=steps)
+                rand_delay2 = random.uniform(0.1, 0.4) * self.human_delay
+                log_info(f"[delete_post] [anti-bot] 삭제 버튼 마우스 이동 후 대기: {rand_delay2:.2f}s (steps={steps})")
+                await asyncio.sleep(rand_delay2)
+            await self.rate_limiter.acquire(page.url)
+            # --- 네트워크 응답 / 페이지 이동 중 먼저 오는 신호 감지 ---
+            # 확인 페이지 자체의 안내 문구에 삭제 문구가 있을 수 있어 문구는 응답/이동 이후에만 본다
+            confirm_url = page.url
+            with self.stage_timer.stage('confirm_click'):
+                waiter = await start_waiting(
+                    page, timeout=10000,
+                    response=lambda resp: ('delete' in resp.url or 'remove' in resp.url) and resp.status in [200, 302, 303, 204, 403],
+                    url=lambda url: url != confirm_url,
+                )
+                # 클릭 (사람처럼 딜레이)
+                click_delay = random.randint(80, 180)
+                log_info(f"[delete_post] [anti-bot] 삭제 버튼 클릭 (delay={click_delay}ms)")
+                await confirm_btn.click(delay=click_delay)
+                log_info("[delete_post] 삭제 확인 버튼 클릭 성공 (최종 삭제)")
+            with self.stage_timer.stage('server_response'):
+                signal, value = await waiter
+        except Exception as click_exc:
+            if waiter is not None:
+                waiter.cancel()
+            log_error(f"[delete_post] 삭제 확인 버튼 클릭 실패: {click_exc}")
+            return False
+
+        delete_response = None
+        detected = None
+        refusal = None
+        if signal == 'response':
+            delete_response = value
+            log_info(f"[delete_post] [network] 삭제 관련 응답 감지: {delete_response.status} {delete_response.url}")
+            print(f"[delete_post] [network] 삭제 관련 응답 감지: {delete_response.status} {delete_response.url}")
+            if delete_response.status == 403:
+                # 기존 판정대로 성공으로 보되, 차단 신호로 동시 삭제 수를 줄인다
+                post['blocked'] = True
+            # --- 본문까지 체크 ---
+            resp_text = ""
+            try:
+                resp_text = await delete_response.text()
+            except Exception:
+                pass
+            refusal = classify_refusal(resp_text)
+            if any(pat in resp_text for pat in DELETE_FAIL_PATTERNS):
+                print(f"[delete_post] [network] 삭제 응답 본문에 실패 메시지 감지: {resp_text[:100]}")
+                log_info(f"[delete_post] [network] 삭제 응답 본문에 실패 메시지 감지: {resp_text[:100]}")
+            else:
+                print(f"[delete_post] [network] 삭제 응답 본문 OK: {resp_text[:100]}")
+                log_info(f"[delete_post] [network] 삭제 응답 본문 OK: {resp_text[:100]}")
+            # 응답 이후 페이지에 성공 문구가 뜨는지 짧게 확인 (고정 4초 대기 대체)
+            detected = await wait_for_text(page, DELETE_SUCCESS_PATTERNS, timeout=3000)
+        elif signal == 'url':
+            # 응답 감지 전에 이동한 경우: 이동한 페이지에서만 성공 문구 확인
+            detected = await wait_for_text(page, DELETE_SUCCESS_PATTERNS, timeout=3000)
+        else:
+            log_info("[delete_post] [network] 삭제 관련 응답/문구 감지 실패 (timeout)")
+            print("[delete_post] [network] 삭제 관련 응답/문구 감지 실패 (timeout)")
+            post['captcha'] = await page_has_captcha(page)
+            post['fail_reason'] = FAIL_BLOCKED if post['captcha'] else FAIL_TIMEOUT
+        # --- 삭제 후 페이지에서 성공/실패 텍스트 확인 결과 ---
+        if detected:
+            log_info(f"[delete_post] [detect] 삭제 성공 텍스트 감지: '{detected}'")
+            print(f"[delete_post] [detect] 삭제 성공 텍스트 감지: '{detected}'")
+        else:
+            log_info("[delete_post] [detect] 삭제 성공 텍스트 미감지")
+            print("[delete_post] [detect] 삭제 성공 텍스트 미감지")
+            await self.diagnostics.snippet(page, '삭제 성공 텍스트 미감지 본문 일부', 200)
+            await self.diagnostics.capture(page, 'confirm_undetected')
+        # 삭제 성공 조건: 네트워크 응답이 200/302/303/204/403 중 하나이거나, 성공 텍스트 감지
+        delete_success = False
+        if detected or (delete_response and delete_response.status in [200, 302, 303, 204, 403]):
+            delete_success = True
+        if refusal:
+            # 권한 없음 등 거부 응답은 실패로 기록 (이미 삭제된 글은 성공 취급)
+            post['fail_reason'] = refusal
+            delete_success = refusal == FAIL_ALREADY_DELETED
+        if delete_success:
+            log_info("[delete_post] [RESULT] 삭제 성공 판정")
+            print("[delete_post] [RESULT] 삭제 성공 판정")
+            return True
+        log_info("[delete_post] [RESULT] 삭제 실패 판정")
+        print("[delete_post] [RESULT] 삭제 실패 판정")
         return False
 
+    def log_run_report(self, module='DCCleaner'):
+        from dc_logger import log_info
+        if self.stage_timer.samples:
+            log_info("[report] 단계별 소요 시간\n" + self.stage_timer.report(), module=module)
+        log_info(f"[report] 카운터: {self.stage_timer.counters}", module=module)
+        self.metrics_writer.write()
+        if self.resource_policy:
+            log_info(f"[report] 요청 차단: {self.resource_policy.summary()}", module=module)
+        if self.page_pool:
+            log_info(f"[report] Page 풀: {self.page_pool.stats}", module=module)
+        if self.rate_limiter.stats():
+            log_info("[report] 호스트별 요청 제한 대기\n" + self.rate_limiter.summary(), module=module)
+        if self.challenge.stats['escalations']:
+            log_info(f"[report] 캡차 대응: {self.challenge.stats}", module=module)
+        if self.selectors.stats['evaluations']:
+            log_info(f"[report] 셀렉터: {self.selectors.summary()}", module=module)
+        if self.strategies.summary():
+            log_info("[report] 삭제 전략별 성공률/소요 시간\n" + self.strategies.summary(), module=module)
+        if self.diagnostics.summary:
+            log_info(f"[report] 진단: {self.diagnostics.report()}", module=module)
+        if self.supervisor.restarts or self.supervisor.stats['page_restarts']:
+            log_info(f"[report] 브라우저 재시작: {self.supervisor.stats}", module=module)
+        if self.memory_guard.stats['samples']:
+            log_info(f"[report] 메모리: {self.memory_guard.summary()}", module=module)
+        if self.memory_profiler:
+            log_info("[report] 단계별 메모리\n" + self.memory_profiler.report(), module=module)
+        log_info(f"[report] 동시 삭제 수: 최종 {self.concurrency.limit} (범위 {self.concurrency.min_limit}~{self.concurrency.max_limit}, 조정 {self.concurrency.changes}회)", module=module)
+
+    async def delete_post_http(self, post: dict) -> bool:
+        from dc_logger import log_info
+        if self.http_deleter is None:
+            self.http_deleter = DCHttpDeleter(
+                self.cookies_path, max_connections=self.http_concurrency, rate_limiter=self.rate_limiter
+            )
+            await self.http_deleter.start()
+        result = await self.http_deleter.delete_post(post)
+        if result == RESULT_NEED_BROWSER:
+            # 캡차/세션 만료 시에만 Chromium 경로로 처리
+            log_info(f"[delete_post] HTTP 엔진 -> 브라우저 경로 전환: {post.get('link', '')}", module='DCCleaner')
+            async with self.page_pool.page() as page:
+                return await self.delete_post_with_page(post, page)
+        return result == RESULT_DELETED
+
+    async def _delete_once(self, post: dict) -> bool:
+        if self.engine == 'http':
+            return await self.delete_post_http(post)
+        async with self.page_pool.page() as page:
+            return await self.delete_post_with_page(post, page)
+
+    async def delete_post(self, post: dict) -> bool:
+        await self.challenge.wait_open()
+        with self.stage_timer.stage('total'):
+            result = await self._delete_once(post)
+            if not result and post.get('captcha') and await self.challenge.escalate(self, post['link']):
+                # 인증 완료 후 같은 글을 한 번 더 시도 (큐/원장 상태는 그대로)
+                if self.http_deleter:
+                    self.http_deleter.reload_cookies()
+                post.pop('fail_reason', None)
+                result = await self._delete_once(post)
+                post['captcha'] = True
+            return result
+
+    @property
+    def max_concurrent(self) -> int:
+        # 동시 삭제 수 초기값 (이후 AdaptiveLimiter 가 조절)
+        return self.http_concurrency if self.engine == 'http' else 3
+
+    def record_outcome(self, post: dict, success: bool, latency: float):
+        # 동시 삭제 수 조절기에 결과 전달 (403/캡차/timeout 은 즉시 감소)
+        blocked = post.pop('blocked', False)
+        signal = FAIL_BLOCKED if blocked else (None if success else post.get('fail_reason'))
+        self.concurrency.record(success, latency, signal)
+        self.stage_timer.inc('success' if success else 'failure')
+        if post.pop('captcha', False):
+            self.stage_timer.inc('captcha')
+        if blocked:
+            self.stage_timer.inc('blocked')
+
     async def close_resources(self):
         from dc_logger import log_info
         log_info('[CLEANUP] 리소스 정리 시작', module='DCCleaner')
         try:
+            await self.supervisor.close()
+            if self.http_deleter:
+                await self.http_deleter.close()
+                self.http_deleter = None
+            self.ledger.close()
+            await self.memory_guard.close()
+            if self.memory_profiler:
+                self.memory_profiler.stop()
+            await self.diagnostics.drain()
+            await self.metrics_writer.close()
+            if self.page_pool:
+                await self.page_pool.close()
             if self.page and not self.page.is_closed():
                 await self.page.close()
             if self.context:
                 await self.context.close()
             if self.browser:
                 await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
         except Exception as e:
             log_info(f'[CLEANUP] 리소스 정리 중 예외: {e}', module='DCCleaner')
         log_info('[CLEANUP] 리소스 정리 완료', module='DCCleaner')
@@ -597,71 +705,14 @@ class DCCleaner:
     async def cleanup(self, hours_ago: float = 1.0):
         pass
 
-    async def run_delete_loop(self, posts, max_concurrent=3):
-        from dc_logger import log_info
-        total_attempt = len(posts)
-        success_count = 0
-        fail_count = 0
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def delete_with_semaphore(post):
-            nonlocal success_count, fail_count
-            async with semaphore:
-                page = await self.context.new_page()
-                try:
-                    result = await self.delete_post_with_page(post, page)
-                    if result:
-                        success_count += 1
-                        print(f"\033[92m[SUCCESS] Deleted: {post['title']} | {post.get('link', '')}\033[0m")
-                        log_info(f"[delete_post] SUCCESS: {post['title']} | {post.get('link', '')}", module="DCCleaner")
-                    else:
-                        fail_count += 1
-                        print(f"\033[91m[FAIL] Failed to delete: {post['title']} | {post.get('link', '')}\033[0m")
-                        log_info(f"[delete_post] FAIL: {post['title']} | {post.get('link', '')}", module="DCCleaner")
-                except Exception as e:
-                    fail_count += 1
-                    err_msg = str(e)
-                    print("\033[91m[FAIL] Unhandled exception in delete_post: {}\033[0m".format(e))
-                    log_info(f"[delete_post] FAIL (Exception): {post['title']} | {post.get('link', '')} | {e}", module="DCCleaner")
-                    with open('error_log.txt', 'a', encoding='utf-8') as f:
-                        f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {post['title']} | {getattr(page, 'url', 'unknown')} | {type(e).__name__}: {e}\n")
-                    if "TargetClosedError" in err_msg or "context or browser has been closed" in err_msg or "browser has been closed" in err_msg:
-                        print("\033[91m[FAIL] 브라우저가 닫혀 삭제 루프를 중단합니다.\033[0m")
-                        log_info(f"[delete_post] 브라우저가 닫혀 삭제 루프를 중단합니다.", module="DCCleaner")
-                finally:
-                    await page.close()
-        await asyncio.gather(*(delete_with_semaphore(post) for post in posts))
-        print(f"\033[94m[INFO] 모든 삭제 시도 완료. 총 시도: {total_attempt}, 성공: {success_count}, 실패: {fail_count}\033[0m")
-        log_info(f"[delete_post] 모든 삭제 시도 완료. 총 시도: {total_attempt}, 성공: {success_count}, 실패: {fail_count}", module="DCCleaner")
-
-        try:
-            await self.init_browser()
-            await self.login()
-            
-            posts = await self.get_posts_from_gallog(hours_ago)
-            print(f"Found {len(posts)} posts older than {hours_ago} hours")
-            
-            for post in posts:
-                success = await self.delete_post(post)
-                if success:
-                    print(f"Successfully deleted: {post['title']}")
-                else:
-                    print(f"Failed to delete: {post['title']}")
-                
-        except Exception as e:
-            print(f"Error during cleanup: {e}")
-        finally:
-            if self.browser:
-                await self.browser.close()
-
 async def main():
     cleaner = DCCleaner()
-    await cleaner.init_browser()
-    await cleaner.login()
-    posts = await cleaner.get_posts_from_gallog(hours_ago=1.0)
-    await cleaner.run_delete_loop(posts)
-    if cleaner.browser:
-        await cleaner.browser.close()
+    try:
+        await cleaner.init_browser()
+        await cleaner.login()
+        await DeletePipeline(cleaner, hours_ago=1.0).run()
+    finally:
+        await cleaner.close_resources()
 
 if __name__ == "__main__":
     async def safe_main():
@@ -669,46 +720,11 @@ if __name__ == "__main__":
         try:
             await cleaner.init_browser()
             await cleaner.login()
-            total_deleted = 0
-            batch_num = 1
-            while True:
-                try:
-                    # 훨씬 더 많은 게시물을 한 번에 삭제 (10배 확대, 최대한 오래된 글까지)
-                    posts = await cleaner.get_posts_from_gallog(hours_ago=100000.0)
-                    if not posts:
-                        print("No more posts to delete.")
-                        break
-                    print(f"[Batch {batch_num}] Found {len(posts)} posts to delete.")
-                    # 병렬 삭제 최적화 (동시에 3개씩)
-                    semaphore = asyncio.Semaphore(3)
-                    batch_success = 0
-                    batch_fail = 0
-                    async def delete_with_semaphore(post):
-                        nonlocal total_deleted, batch_success, batch_fail
-                        async with semaphore:
-                            page = await cleaner.context.new_page()
-                            try:
-                                success = await cleaner.delete_post_with_page(post, page)
-                                if success:
-                                    print(f"[Batch {batch_num}] Successfully deleted: {post['title']}")
-                                    total_deleted += 1
-                                    batch_success += 1
-                                else:
-                                    print(f"[Batch {batch_num}] Failed to delete: {post['title']}")
-                                    batch_fail += 1
-                            except Exception as post_err:
-                                print(f"[Batch {batch_num}] Error deleting post: {post['title']} | {post_err}")
-                                batch_fail += 1
-                            finally:
-                                await page.close()
-                    await asyncio.gather(*(delete_with_semaphore(post) for post in posts))
-                    print(f"[Batch {batch_num}] Batch completed. 성공: {batch_success}, 실패: {batch_fail}, Total deleted so far: {total_deleted}")
-                    batch_num += 1
-                except Exception as batch_err:
-                    print(f"[Batch {batch_num}] Error in batch: {batch_err}")
-                    # 예외 발생 시에도 루프를 중단하지 않고 다음 반복 진행
-                    batch_num += 1
-            print(f"\n[RESULT] 실행 종료 - 이번 실행에서 총 {total_deleted}개의 게시물을 삭제했습니다.")
+            # 갤로그 전체 페이지를 열거하면서 동시에 삭제 (최대한 오래된 글까지)
+            stats = await DeletePipeline(cleaner, hours_ago=100000.0).run()
+            if not stats['enumerated']:
+                print("No more posts to delete.")
+            print(f"\n[RESULT] 실행 종료 - 이번 실행에서 총 {stats['success']}개의 게시물을 삭제했습니다. (실패: {stats['fail']})")
         finally:
             await cleaner.close_resources()
     try:
@@ -0,0 +1,118 @@
+# dc_concurrency.py
+# 고정 Semaphore 대신 AIMD 방식으로 동시 삭제 수를 조절한다.
+# 지연/성공률이 건강하면 +1, 403/캡차/timeout 이나 실패 비율 증가 시 절반으로 줄인다.
+import asyncio
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+from dc_delete_strategy import FAIL_BLOCKED, FAIL_TIMEOUT
+from dc_logger import log_info
+
+BACKOFF_SIGNALS = (FAIL_BLOCKED, FAIL_TIMEOUT)
+
+
+class AdaptiveLimiter:
+    def __init__(self, initial: int = 3, min_limit: int = 1, max_limit: int = 8,
+                 window: int = 10, max_failure_ratio: float = 0.3, latency_slack: float = 2.0):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(max(initial, self.min_limit), self.max_limit)
+        self.window = window
+        self.max_failure_ratio = max_failure_ratio
+        self.latency_slack = latency_slack  # 기준 지연의 몇 배까지를 건강한 것으로 볼지
+        self.in_flight = 0
+        self.baseline_latency: Optional[float] = None
+        self._results: List[bool] = []
+        self._latencies: List[float] = []
+        self._cooldown = False
+        self._cond: Optional[asyncio.Condition] = None
+        self.changes = 0
+        self.ceiling: Optional[int] = None  # 메모리 압박 시 MemoryGuard 가 거는 상한 (None = max_limit)
+
+    def _condition(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    async def acquire(self):
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self):
+        cond = self._condition()
+        async with cond:
+            self.in_flight -= 1
+            cond.notify_all()
+
+    @asynccontextmanager
+    async def slot(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+    def _set_limit(self, new_limit: int, reason: str):
+        upper = self.max_limit if self.ceiling is None else min(self.max_limit, self.ceiling)
+        new_limit = min(max(new_limit, self.min_limit), upper)
+        if new_limit == self.limit:
+            return
+        log_info(f"[concurrency] 동시 삭제 수 {self.limit} -> {new_limit} ({reason})")
+        self.limit = new_limit
+        self.changes += 1
+        if self._cond is not None:
+            # 한도가 늘어난 경우 대기 중인 워커를 깨운다
+            asyncio.ensure_future(self._wake())
+
+    def set_ceiling(self, ceiling: Optional[int], reason: str = ''):
+        # None 이면 상한 해제. 현재 한도가 상한보다 높으면 바로 낮춘다
+        if ceiling is not None:
+            ceiling = max(ceiling, self.min_limit)
+        if ceiling == self.ceiling:
+            return
+        self.ceiling = ceiling
+        log_info(f"[concurrency] 동시 삭제 상한 {'해제' if ceiling is None else ceiling} ({reason})")
+        if ceiling is not None and self.limit > ceiling:
+            self._set_limit(ceiling, reason)
+
+    async def _wake(self):
+        async with self._condition():
+            self._condition().notify_all()
+
+    def _reset_window(self):
+        self._results.clear()
+        self._latencies.clear()
+
+    def record(self, success: bool, latency: float, signal: Optional[str] = None):
+        if signal in BACKOFF_SIGNALS:
+            # 차단/timeout 신호는 즉시 절반으로 (multiplicative decrease)
+            self._set_limit(self.limit // 2, f"{signal} 감지")
+            self._reset_window()
+            self._cooldown = True
+            return
+        self._results.append(success)
+        if success:
+            self._latencies.append(latency)
+        if len(self._results) < self.window:
+            return
+        failure_ratio = self._results.count(False) / len(self._results)
+        mean_latency = sum(self._latencies) / len(self._latencies) if self._latencies else None
+        self._reset_window()
+        if failure_ratio > self.max_failure_ratio:
+            self._set_limit(self.limit // 2, f"실패 비율 {failure_ratio:.0%}")
+            self._cooldown = True
+            return
+        if mean_latency is None:
+            return
+        if self.baseline_latency is None or mean_latency < self.baseline_latency:
+            self.baseline_latency = mean_latency
+        if self._cooldown:
+            # 감소 직후 한 구간은 증가하지 않는다
+            self._cooldown = False
+            return
+        if mean_latency <= self.baseline_latency * self.latency_slack:
+            self._set_limit(self.limit + 1, f"평균 지연 {mean_latency:.2f}s, 실패 비율 {failure_ratio:.0%}")
+        else:
+            self._set_limit(self.limit - 1, f"평균 지연 {mean_latency:.2f}s > 기준 {self.baseline_latency:.2f}s x {self.latency_slack}")
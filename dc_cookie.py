@@ -1,9 +1,45 @@
 import json
+import os
+import time
+from typing import Optional
+
 from dc_logger import log_info, log_error
 
+# 로그인 세션 판정에 쓰는 쿠키 도메인. httpOnly 쿠키만 인증 쿠키로 보고 만료 시각을 계산한다
+SESSION_COOKIE_DOMAIN = 'dcinside.com'
+
+SESSION_VALID = 'valid'
+SESSION_NEAR_EXPIRY = 'near_expiry'
+SESSION_EXPIRED = 'expired'
+SESSION_MISSING = 'missing'
+SESSION_UNVERIFIED = 'unverified'  # 저장은 됐지만 로그인 확인을 한 번도 통과하지 못한 세션
+
+
+def session_expiry(cookies) -> Optional[float]:
+    # 인증 쿠키 중 가장 먼저 만료되는 시각 (세션 쿠키만 있으면 None)
+    expiries = [
+        cookie['expires'] for cookie in cookies or []
+        if SESSION_COOKIE_DOMAIN in cookie.get('domain', '') and cookie.get('httpOnly')
+        and cookie.get('expires', -1) > 0
+    ]
+    return min(expiries) if expiries else None
+
+
+def write_json_atomic(path, data):
+    # 임시 파일에 다 쓴 뒤 교체 (execute shard 프로세스들이 같은 파일을 동시에 써도 깨진 JSON 이 남지 않게)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
 class DCCookieManager:
-    def __init__(self, cookie_path):
+    def __init__(self, cookie_path, state_path: Optional[str] = None,
+                 max_age: float = 12 * 3600, refresh_margin: float = 3600):
         self.cookie_path = cookie_path
+        self.state_path = state_path  # storage_state + 만료 메타데이터
+        self.max_age = max_age  # 만료 시각이 없는(세션) 쿠키만 있을 때 저장 후 유효하다고 볼 시간
+        self.refresh_margin = refresh_margin  # 만료까지 이 시간 미만이면 확인/재로그인
 
     def load_cookies(self):
         try:
@@ -17,8 +53,64 @@ class DCCookieManager:
 
     def save_cookies(self, cookies):
         try:
-            with open(self.cookie_path, "w", encoding="utf-8") as f:
-                json.dump(cookies, f)
+            write_json_atomic(self.cookie_path, cookies)
             log_info(f"[cookie] 쿠키 저장 성공: {self.cookie_path}")
         except Exception as e:
             log_error(f"[cookie] 쿠키 저장 실패: {e}")
+
+    def save_state(self, storage_state: dict, verified_at: Optional[float] = None):
+        # Playwright storage_state 와 세션 만료 정보를 함께 저장 (쿠키 파일도 같이 갱신).
+        # verified_at 은 로그인 확인을 통과했을 때만 넘긴다. 주기 저장/로그인 실패 시 저장은 이전 확인 시각을 유지
+        self.save_cookies(storage_state.get('cookies', []))
+        if not self.state_path:
+            return
+        now = time.time()
+        if verified_at is None:
+            previous = self._load_session()
+            verified_at = previous.get('verified_at') if previous else None
+        data = {
+            'saved_at': now,
+            'verified_at': verified_at,
+            'expires_at': session_expiry(storage_state.get('cookies')),
+            'storage_state': storage_state,
+        }
+        try:
+            write_json_atomic(self.state_path, data)
+            log_info(f"[cookie] 세션 저장 성공: {self.state_path}")
+        except Exception as e:
+            log_error(f"[cookie] 세션 저장 실패: {e}")
+
+    def _load_session(self) -> Optional[dict]:
+        if not self.state_path:
+            return None
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log_error(f"[cookie] 세션 로드 실패: {e}")
+            return None
+
+    def load_state(self) -> Optional[dict]:
+        session = self._load_session()
+        return session.get('storage_state') if session else None
+
+    def session_status(self, now: Optional[float] = None) -> str:
+        # 네트워크 없이 저장된 메타데이터만으로 세션 상태 판정
+        session = self._load_session()
+        if not session or not session.get('storage_state', {}).get('cookies'):
+            return SESSION_MISSING
+        verified_at = session.get('verified_at')
+        if verified_at is None:
+            return SESSION_UNVERIFIED
+        now = now or time.time()
+        expires_at = session.get('expires_at')
+        if expires_at is None:
+            # 만료 시각을 모르면 마지막 확인 시점부터 max_age 동안 유효하다고 본다
+            expires_at = verified_at + self.max_age
+        if expires_at <= now:
+            return SESSION_EXPIRED
+        if expires_at - now < self.refresh_margin:
+            return SESSION_NEAR_EXPIRY
+        return SESSION_VALID
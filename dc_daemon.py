@@ -0,0 +1,267 @@
+# dc_daemon.py
+# 로그인된 브라우저/컨텍스트를 띄워 둔 채로 로컬 소켓(JSON lines)으로 삭제 작업을 받는 데몬 + CLI.
+#   dcinside-post-cleaner daemon            # 데몬 시작 (브라우저 실행 + 로그인 1회)
+#   dcinside-post-cleaner run --hours-ago 1 # 데몬이 있으면 작업 제출 후 진행 상황 출력, 없으면 직접 실행
+#   dcinside-post-cleaner status | stop
+#   dcinside-post-cleaner plan | execute    # 열거/삭제 분리 실행 (dc_plan.py 참고, 데몬 없이 직접 실행)
+# 요청: {"cmd": "run", "hours_ago": 1.0, "max_pages": null} / {"cmd": "status"} / {"cmd": "shutdown"}
+# 응답: 한 줄에 JSON 하나 ({"event": "accepted" | "progress" | "done" | "error" | "status", ...})
+import argparse
+import asyncio
+import ipaddress
+import json
+import os
+import sys
+import time
+from typing import AsyncIterator, Optional
+
+from dc_logger import log_error, log_info
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8799
+PROGRESS_INTERVAL = 1.0
+
+
+def _address():
+    return os.getenv('DC_DAEMON_HOST', DEFAULT_HOST), int(os.getenv('DC_DAEMON_PORT', str(DEFAULT_PORT)))
+
+
+def check_host(host: str):
+    # 인증 없는 프로토콜이라 로그인된 세션으로 삭제/종료 요청을 받는 데몬은 루프백 주소에만 연다
+    if host == 'localhost':
+        return
+    try:
+        loopback = ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        loopback = False
+    if not loopback:
+        raise ValueError(f"데몬은 루프백 주소(127.0.0.1, ::1, localhost)에만 열 수 있습니다: {host}")
+
+
+class CleanerDaemon:
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.cleaner = None
+        self.started_at = time.time()
+        self.jobs = 0
+        self.current: Optional[dict] = None
+        self._job_lock: Optional[asyncio.Lock] = None
+        self._server = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    async def _ensure_browser(self):
+        # 처음 한 번, 또는 브라우저가 죽었을 때만 실행 + 로그인
+        from dc_cleaner import DCCleaner
+        if self.cleaner is not None and self.cleaner.browser and self.cleaner.browser.is_connected():
+            return
+        if self.cleaner is not None:
+            # 저장된 세션으로 브라우저만 다시 띄우고, 재시작 한도를 넘었으면 cleaner 를 새로 만든다
+            supervisor = self.cleaner.supervisor
+            if await supervisor.recover(supervisor.generation):
+                return
+            log_error("[daemon] 브라우저 연결 끊김 -> 다시 시작")
+            await self.cleaner.close_resources()
+        self.cleaner = DCCleaner()
+        await self.cleaner.init_browser()
+        await self.cleaner.login()
+
+    async def start(self):
+        check_host(self.host)
+        self._job_lock = asyncio.Lock()
+        self._stopped = asyncio.Event()
+        await self._ensure_browser()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        log_info(f"[daemon] 작업 대기 중: {self.host}:{self.port}")
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._stopped.wait()
+        finally:
+            self._server.close()
+            await self._server.wait_closed()
+            if self.cleaner is not None:
+                await self.cleaner.close_resources()
+            log_info("[daemon] 종료")
+
+    async def _send(self, writer, event: str, **data):
+        writer.write((json.dumps({'event': event, **data}, ensure_ascii=False, default=str) + '\n').encode('utf-8'))
+        await writer.drain()
+
+    async def _handle(self, reader, writer):
+        try:
+            line = await reader.readline()
+            if not line:
+                return  # 연결 확인만 하고 끊은 경우
+            request = json.loads(line.decode('utf-8'))
+            cmd = request.get('cmd')
+            if cmd == 'run':
+                await self._run_job(request, writer)
+            elif cmd == 'status':
+                await self._send(writer, 'status', busy=self.current is not None, current=self.current,
+                                 jobs=self.jobs, uptime=time.time() - self.started_at)
+            elif cmd == 'shutdown':
+                await self._send(writer, 'done', message='shutdown')
+                self._stopped.set()
+            else:
+                await self._send(writer, 'error', message=f'unknown cmd: {cmd}')
+        except Exception as e:
+            log_error(f"[daemon] 요청 처리 예외: {type(e).__name__}: {e}")
+            try:
+                await self._send(writer, 'error', message=f'{type(e).__name__}: {e}')
+            except Exception:
+                pass
+        finally:
+            writer.close()
+
+    async def _run_job(self, request: dict, writer):
+        from dc_pipeline import DeletePipeline
+        if self._job_lock.locked():
+            await self._send(writer, 'queued', message='이전 작업이 끝나면 시작합니다')
+        async with self._job_lock:
+            await self._ensure_browser()
+            self.jobs += 1
+            job_id = self.jobs
+            hours_ago = float(request.get('hours_ago', 1.0))
+            self.current = {'job': job_id, 'hours_ago': hours_ago, 'started_at': time.time()}
+            await self._send(writer, 'accepted', job=job_id)
+            log_info(f"[daemon] 작업 #{job_id} 시작 (hours_ago={hours_ago})")
+            pipeline = DeletePipeline(self.cleaner, hours_ago=hours_ago, max_pages=request.get('max_pages'))
+            task = asyncio.ensure_future(pipeline.run())
+            try:
+                while not task.done():
+                    await asyncio.wait({task}, timeout=PROGRESS_INTERVAL)
+                    if not task.done():
+                        await self._send(writer, 'progress', job=job_id, stats=pipeline.stats)
+                stats = task.result()
+                await self._send(writer, 'done', job=job_id, stats=stats)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # 클라이언트가 끊겨도 작업은 끝까지 진행
+                log_info(f"[daemon] 작업 #{job_id} 클라이언트 연결 끊김, 작업은 계속 진행")
+                await asyncio.shield(task)
+            finally:
+                self.current = None
+
+
+async def request_daemon(request: dict, host: str, port: int) -> AsyncIterator[dict]:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write((json.dumps(request) + '\n').encode('utf-8'))
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            yield json.loads(line.decode('utf-8'))
+    finally:
+        writer.close()
+
+
+async def _daemon_available(host: str, port: int) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=1.0)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+def _print_event(event: dict):
+    kind = event.get('event')
+    if kind == 'progress':
+        s = event['stats']
+        print(f"\r[작업 #{event['job']}] 열거 {s['enumerated']} | 성공 {s['success']} | 실패 {s['fail']} | "
+              f"검증 {s['verified']}", end='', flush=True)
+    elif kind == 'done' and 'stats' in event:
+        s = event['stats']
+        print(f"\n\033[94m[RESULT] 작업 #{event['job']} 완료 - 성공 {s['success']}, 실패 {s['fail']}, "
+              f"검증 {s['verified']}\033[0m")
+    elif kind == 'error':
+        print(f"\033[91m[ERROR] {event.get('message')}\033[0m")
+    else:
+        print(f"[{kind}] {event.get('message', event.get('job', ''))}")
+
+
+async def _run_local(hours_ago: float, max_pages: Optional[int]):
+    from dc_cleaner import DCCleaner
+    from dc_pipeline import DeletePipeline
+    cleaner = DCCleaner()
+    try:
+        await cleaner.init_browser()
+        await cleaner.login()
+        stats = await DeletePipeline(cleaner, hours_ago=hours_ago, max_pages=max_pages).run()
+        print(f"\n[RESULT] 실행 종료 - 이번 실행에서 총 {stats['success']}개의 게시물을 삭제했습니다. (실패: {stats['fail']})")
+    finally:
+        await cleaner.close_resources()
+
+
+async def _cli(args) -> int:
+    from dc_plan import run_execute, run_plan
+    host, port = args.host, args.port
+    if args.command == 'plan':
+        await run_plan(args.plan, args.hours_ago, args.max_pages)
+        return 0
+    if args.command == 'execute':
+        stats = await run_execute(args.plan, args.shard_index or 0, args.shard_count)
+        return 0 if not stats['fail'] else 1
+    if args.command == 'daemon':
+        await CleanerDaemon(host, port).serve_forever()
+        return 0
+    if args.command in ('status', 'stop'):
+        if not await _daemon_available(host, port):
+            print(f"데몬이 실행 중이 아닙니다 ({host}:{port})")
+            return 1
+        async for event in request_daemon({'cmd': 'status' if args.command == 'status' else 'shutdown'}, host, port):
+            print(json.dumps(event, ensure_ascii=False, indent=2) if args.command == 'status' else '데몬 종료 요청 완료')
+        return 0
+    # run: 데몬이 떠 있으면 제출, 없으면 이 프로세스에서 직접 실행
+    if not args.no_daemon and await _daemon_available(host, port):
+        request = {'cmd': 'run', 'hours_ago': args.hours_ago, 'max_pages': args.max_pages}
+        status = 1
+        async for event in request_daemon(request, host, port):
+            _print_event(event)
+            if event.get('event') == 'done':
+                status = 0
+        return status
+    await _run_local(args.hours_ago, args.max_pages)
+    return 0
+
+
+def cli():
+    host, port = _address()
+    parser = argparse.ArgumentParser(prog='dcinside-post-cleaner', description='DCInside 게시글 자동 삭제')
+    parser.add_argument('command', nargs='?', default='run',
+                        choices=['run', 'daemon', 'status', 'stop', 'plan', 'execute'])
+    parser.add_argument('--hours-ago', type=float, default=1.0, help='이 시간(시간 단위)보다 오래된 글만 삭제')
+    parser.add_argument('--max-pages', type=int, default=None, help='열거할 최대 갤로그 페이지 수')
+    parser.add_argument('--no-daemon', action='store_true', help='데몬이 떠 있어도 직접 실행')
+    parser.add_argument('--host', default=host)
+    parser.add_argument('--port', type=int, default=port)
+    parser.add_argument('--plan', default=os.getenv('DC_PLAN_PATH', 'dc_plan.jsonl'), help='삭제 계획 파일 (JSONL)')
+    parser.add_argument('--shard-index', type=int, default=None, help='이 프로세스가 맡을 shard (0부터)')
+    parser.add_argument('--shard-count', type=int, default=1, help='계획을 나눌 shard 수')
+    args = parser.parse_args()
+    if args.command == 'daemon':
+        try:
+            check_host(args.host)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.command == 'execute':
+        from dc_plan import check_shard
+        try:
+            check_shard(args.shard_index or 0, args.shard_count)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.command == 'execute' and args.shard_index is None and args.shard_count > 1:
+        # shard 를 지정하지 않으면 shard 수만큼 execute 프로세스를 띄운다
+        from dc_plan import spawn_executors
+        sys.exit(spawn_executors(args.plan, args.shard_count))
+    try:
+        sys.exit(asyncio.run(_cli(args)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    cli()
@@ -1,29 +1,297 @@
 # dc_delete_strategy.py
-import re
-from dc_logger import log
-
-async def find_delete_button(page):
-    selectors = [
-        'button.btn_grey.cancle',
-        "button:has-text('삭제')",
-        "input[type=button][value=삭제]"
-    ]
-    for selector in selectors:
-        btn = await page.query_selector(selector)
-        if btn:
-            log(f"삭제 버튼 탐색 성공! 셀렉터: {selector}")
-            return btn
-    log("삭제 버튼 탐색 실패.", level="WARN")
+import json
+import os
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from dc_logger import log_info
+
+# 삭제 성공/실패/캡차 판정용 문구 (브라우저/HTTP 엔진 공용)
+DELETE_SUCCESS_PATTERNS = [
+    "삭제된 게시물", "존재하지 않는 게시물", "없는 게시물", "삭제되었습니다", "삭제 처리되었습니다",
+    "삭제가 완료되었습니다", "삭제하신 게시물이 존재하지 않습니다", "해당 게시물을 찾을 수 없습니다",
+    "삭제 또는 이동된 게시물입니다", "삭제된 글입니다"
+]
+# 서버가 삭제를 거부할 때의 문구 (HTML 페이지 전체에 대해 검사해도 안전한 것만)
+DELETE_REFUSAL_PATTERNS = [
+    "삭제할 권한이 없습니다",
+    "이미 삭제된 게시물",
+    "삭제 실패",
+    "권한이 없습니다",
+    "삭제할 수 없습니다"
+]
+# 짧은 삭제 응답 본문 검사용
+DELETE_FAIL_PATTERNS = DELETE_REFUSAL_PATTERNS + ["not allowed", "error"]
+CAPTCHA_MARKERS = [
+    'kcaptcha',
+    'g-recaptcha',
+    'h-captcha',
+    'captcha_img',
+    '자동입력 방지',
+    '자동 입력 방지',
+]
+
+# 삭제 실패 사유 (post['fail_reason'] 에 기록, 원장/재시도 정책에서 사용)
+FAIL_PERMISSION = 'permission'
+FAIL_ALREADY_DELETED = 'already_deleted'
+FAIL_INVALID_LINK = 'invalid_link'
+FAIL_BLOCKED = 'blocked'        # 403 / 캡차
+FAIL_TIMEOUT = 'timeout'
+FAIL_DETACHED = 'detached'      # 탭/프레임 분리, 브라우저 종료
+FAIL_NO_BUTTON = 'no_button'
+PERMANENT_FAILURES = (FAIL_PERMISSION, FAIL_INVALID_LINK)
+
+# 실패 사유 -> (최대 재시도 횟수, 첫 재시도 대기(초)). 대기는 재시도마다 2배
+# 재시도 스케줄러와 삭제 원장이 같은 표를 쓴다: 사유별 전체 시도 횟수 = 최대 재시도 + 1
+RETRY_POLICIES: Dict[str, Tuple[int, float]] = {
+    FAIL_TIMEOUT: (2, 2.0),
+    FAIL_DETACHED: (2, 1.0),      # 탭/프레임 분리는 다른 탭으로 바로 다시
+    FAIL_NO_BUTTON: (1, 5.0),     # 페이지가 덜 그려졌을 수 있어 한 번만
+    FAIL_BLOCKED: (2, 30.0),      # 403/캡차는 충분히 쉬고
+    FAIL_PERMISSION: (0, 0.0),
+    FAIL_INVALID_LINK: (0, 0.0),
+    FAIL_ALREADY_DELETED: (0, 0.0),
+}
+DEFAULT_POLICY = (2, 2.0)
+
+
+def looks_like_captcha(content: str) -> bool:
+    return any(marker in content for marker in CAPTCHA_MARKERS)
+
+
+def classify_refusal(content: str):
+    # 서버 거부 문구 -> 실패 사유 (거부가 아니면 None)
+    if "이미 삭제된 게시물" in content:
+        return FAIL_ALREADY_DELETED
+    if any(pattern in content for pattern in DELETE_REFUSAL_PATTERNS):
+        return FAIL_PERMISSION
     return None
 
-async def try_meta_delete(page):
-    content = await page.content()
-    m = re.search(r"goDelete\('([^']+)'\)", content)
-    if m:
-        meta_delete_url = m.group(1)
-        log(f"[META] delete url candidate: {meta_delete_url}")
-        response = await page.request.post(meta_delete_url)
-        log(f"[META] delete POST status: {response.status}")
-        return response.status == 200
-    log("[META] delete url extraction failed", level="ERROR")
-    return False
+
+def classify_exception(exc: BaseException) -> str:
+    name = type(exc).__name__
+    message = str(exc)
+    if 'Timeout' in name or 'Timeout' in message:
+        return FAIL_TIMEOUT
+    if 'TargetClosed' in name or 'detached' in message or 'has been closed' in message:
+        return FAIL_DETACHED
+    return name
+
+
+# 갤로그 목록 페이지에서 목록 자체의 삭제 요청을 보낸다 (ci_c 쿠키 -> ci_t, 페이지의 service_code)
+LISTING_DELETE_JS = """
+async ([url, no]) => {
+    const cookie = document.cookie.split('; ').find(c => c.startsWith('ci_c='));
+    const serviceCode = document.querySelector('input[name=service_code]');
+    const body = new URLSearchParams({
+        ci_t: cookie ? decodeURIComponent(cookie.slice(5)) : '',
+        no: no,
+        service_code: serviceCode ? serviceCode.value : '',
+    });
+    const resp = await fetch(url, {
+        method: 'POST',
+        credentials: 'same-origin',
+        headers: {
+            'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+            'X-Requested-With': 'XMLHttpRequest',
+        },
+        body: body.toString(),
+    });
+    return [resp.status, await resp.text()];
+}
+"""
+
+
+def parse_listing_delete_response(status: int, text: str) -> Tuple[bool, Optional[str]]:
+    # (삭제 성공 여부, 실패 사유). 응답은 {"result": "success"} 형태의 JSON 또는 짧은 문자열
+    if status == 403 or looks_like_captcha(text):
+        return False, FAIL_BLOCKED
+    if status != 200:
+        return False, f'http_{status}'
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        result = str(data.get('result', '')).lower()
+        if result in ('success', 'true', 'ok', '1'):
+            return True, None
+        return False, classify_refusal(str(data.get('msg', ''))) or 'refused'
+    if text.strip().lower() in ('success', 'true', 'ok', '1'):
+        return True, None
+    return False, classify_refusal(text) or 'refused'
+
+
+async def listing_delete(page, delete_url: str, gallog_no) -> Tuple[bool, Optional[str]]:
+    status, text = await page.evaluate(LISTING_DELETE_JS, [delete_url, str(gallog_no)])
+    return parse_listing_delete_response(status, text)
+
+
+# 캡차 표식을 페이지 안에서 찾는다 (page.content() 로 HTML 전체를 파이썬으로 복사하지 않음)
+CAPTCHA_JS = """
+(markers) => {
+    const html = document.documentElement ? document.documentElement.outerHTML : '';
+    return markers.some(marker => html.includes(marker));
+}
+"""
+
+
+async def page_has_captcha(page) -> bool:
+    try:
+        return bool(await page.evaluate(CAPTCHA_JS, CAPTCHA_MARKERS))
+    except Exception:
+        return False
+
+
+# 본문 스크립트의 goDelete('...') 메타 삭제 URL 만 꺼낸다 (page.content() 직렬화 없이)
+META_DELETE_JS = """
+() => {
+    const m = document.documentElement.innerHTML.match(/goDelete\\('([^']+)'\\)/);
+    return m ? m[1] : null;
+}
+"""
+
+
+async def try_meta_delete(page, post: Optional[dict] = None, rate_limiter=None) -> Optional[bool]:
+    # goDelete 메타 URL 로 바로 POST. URL 이 없으면 None (이 글에는 해당 없음)
+    meta_delete_url = await page.evaluate(META_DELETE_JS)
+    if not meta_delete_url:
+        log_info("[META] delete url 없음")
+        return None
+    url = urljoin(page.url, meta_delete_url)
+    log_info(f"[META] delete url candidate: {url}")
+    if rate_limiter:
+        await rate_limiter.acquire(url)
+    response = await page.request.post(url)
+    text = await response.text()
+    log_info(f"[META] delete POST status: {response.status}")
+    post = post if post is not None else {}
+    if response.status == 403 or looks_like_captcha(text):
+        post['captcha'] = looks_like_captcha(text)
+        post['blocked'] = response.status == 403
+        post['fail_reason'] = FAIL_BLOCKED
+        return False
+    refusal = classify_refusal(text)
+    if refusal:
+        post['fail_reason'] = refusal
+        return refusal == FAIL_ALREADY_DELETED
+    return response.status == 200
+
+
+STRATEGY_LISTING = 'listing'  # 갤로그 목록 페이지에서 ajax 삭제 (게시글 페이지 로드 없음)
+STRATEGY_META = 'meta'        # 게시글 페이지의 goDelete 메타 URL 로 POST 1회
+STRATEGY_BUTTON = 'button'    # 삭제 버튼 클릭 -> 확인 페이지 -> 확인 클릭
+# 전략 자체의 문제가 아닌 실패 (성공률 학습에서 제외)
+ENVIRONMENT_FAILURES = (FAIL_BLOCKED, FAIL_TIMEOUT, FAIL_DETACHED)
+
+
+def gallery_type(link: str) -> str:
+    # 갤러리 종류별로 통하는 삭제 방식이 달라서 성공률을 따로 센다
+    path = urlparse(link or '').path
+    if path.startswith('/mgallery/'):
+        return 'minor'
+    if path.startswith('/mini/'):
+        return 'mini'
+    if path.startswith('/person/'):
+        return 'person'
+    return 'main'
+
+
+class DeleteStrategy:
+    def __init__(self, name: str, cost: float, run: Callable[..., Awaitable[Optional[bool]]],
+                 scope: str = 'post'):
+        self.name = name
+        self.cost = cost  # 예상 소요 시간(초). 실제 측정값으로 갱신된다
+        self.run = run  # async (post, page) -> True/False, 해당 없으면 None
+        self.scope = scope  # post: 게시글 페이지에서 실행 | listing: 갤로그 목록에서 실행
+
+
+class StrategyRegistry:
+    # 전략별 비용/성공률을 갤러리 종류마다 학습해 (비용 / 성공률) 이 낮은 순서로 시도
+    def __init__(self, min_attempts: int = 5, min_success: float = 0.2, probe_every: int = 20,
+                 alpha: float = 0.2):
+        self.min_attempts = min_attempts  # 이만큼 시도한 뒤부터 성공률로 제외 여부 판단
+        self.min_success = min_success  # 이보다 성공률이 낮으면 제외
+        self.probe_every = probe_every  # 제외된 전략도 이만큼 건너뛸 때마다 한 번 다시 시도
+        self.alpha = alpha  # 소요 시간 이동 평균 가중치
+        self.strategies: Dict[str, DeleteStrategy] = {}
+        self.stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    @classmethod
+    def from_env(cls) -> 'StrategyRegistry':
+        return cls(
+            min_attempts=int(os.getenv('DC_STRATEGY_MIN_ATTEMPTS', '5')),
+            min_success=float(os.getenv('DC_STRATEGY_MIN_SUCCESS', '0.2')),
+            probe_every=int(os.getenv('DC_STRATEGY_PROBE', '20')),
+        )
+
+    def register(self, strategy: DeleteStrategy):
+        self.strategies[strategy.name] = strategy
+
+    def _stat(self, kind: str, name: str) -> Dict[str, float]:
+        key = (kind, name)
+        if key not in self.stats:
+            self.stats[key] = {
+                'attempts': 0, 'success': 0, 'skipped': 0, 'cost': self.strategies[name].cost,
+            }
+        return self.stats[key]
+
+    def success_rate(self, kind: str, name: str) -> float:
+        stat = self._stat(kind, name)
+        # 시도 전에는 성공으로 가정 (라플라스 보정)
+        return (stat['success'] + 1) / (stat['attempts'] + 2)
+
+    def expected_cost(self, kind: str, name: str) -> float:
+        return self._stat(kind, name)['cost'] / self.success_rate(kind, name)
+
+    def _failing(self, kind: str, name: str) -> bool:
+        stat = self._stat(kind, name)
+        return stat['attempts'] >= self.min_attempts and stat['success'] / stat['attempts'] < self.min_success
+
+    def _excluded(self, kind: str, name: str) -> bool:
+        # 실패가 반복된 전략은 제외하되, probe_every 번 건너뛴 뒤에는 한 번 다시 시도
+        return self._failing(kind, name) and self._stat(kind, name)['skipped'] < self.probe_every
+
+    def plan(self, kind: str, scope: str = 'post') -> List[DeleteStrategy]:
+        # 시도 순서만 계산한다 (건너뛴 횟수는 실제로 건너뛴 쪽에서 skip_excluded 로 기록)
+        candidates = [s for s in self.strategies.values() if s.scope == scope]
+        candidates.sort(key=lambda s: self.expected_cost(kind, s.name))
+        active = [s for s in candidates if not self._excluded(kind, s.name)]
+        # 게시글 페이지 전략이 모두 제외되면 그래도 전부 시도한다
+        return active or (candidates if scope == 'post' else [])
+
+    def skip_excluded(self, kind: str, planned: List[DeleteStrategy], scope: str = 'post'):
+        # plan 에서 빠져 이번 글에서 건너뛴 전략의 건너뛴 횟수를 센다
+        for strategy in self.strategies.values():
+            if strategy.scope == scope and strategy not in planned and self._excluded(kind, strategy.name):
+                self._stat(kind, strategy.name)['skipped'] += 1
+
+    def record(self, kind: str, name: str, success: bool, latency: float, fail_reason: Optional[str] = None):
+        if not success and fail_reason in ENVIRONMENT_FAILURES:
+            return
+        stat = self._stat(kind, name)
+        was_failing = self._failing(kind, name)
+        stat['attempts'] += 1
+        stat['success'] += 1 if success else 0
+        stat['skipped'] = 0  # 다시 시도했으므로 건너뛴 횟수를 처음부터 센다
+        stat['cost'] += self.alpha * (latency - stat['cost'])
+        if not was_failing and self._failing(kind, name):
+            log_info(f"[strategy] {kind} 갤러리에서 '{name}' 삭제 실패 반복 -> 당분간 제외 "
+                     f"({stat['success']}/{stat['attempts']})")
+
+    def revoke(self, kind: str, name: str):
+        # 성공으로 기록했지만 검증에서 삭제되지 않은 것으로 확인된 경우
+        stat = self._stat(kind, name)
+        if stat['success'] > 0:
+            stat['success'] -= 1
+
+    def summary(self) -> str:
+        lines = []
+        for (kind, name), stat in sorted(self.stats.items()):
+            if not stat['attempts']:
+                continue
+            lines.append(
+                f"  {kind:<8}{name:<10}{stat['success']:>5}/{stat['attempts']:<5} "
+                f"평균 {stat['cost']:.2f}s  예상 비용 {self.expected_cost(kind, name):.2f}s"
+            )
+        return '\n'.join(lines)
@@ -0,0 +1,100 @@
+# dc_diagnostics.py
+# 디버깅용 DOM 직렬화/요소 상태 조회/HTML 덤프를 진단 레벨로 묶는다.
+# off(기본): 아무것도 하지 않음, summary: 본문 일부/요소 상태를 로그로, full: summary + HTML 파일 저장(실행당 최대 N개)
+import asyncio
+import os
+import time
+from typing import List, Optional
+
+from dc_logger import log_error, log_info
+
+LEVEL_OFF = 'off'
+LEVEL_SUMMARY = 'summary'
+LEVEL_FULL = 'full'
+LEVELS = {LEVEL_OFF: 0, LEVEL_SUMMARY: 1, LEVEL_FULL: 2}
+
+
+class Diagnostics:
+    def __init__(self, level: str = LEVEL_OFF, max_captures: int = 20, capture_dir: str = '.'):
+        if level not in LEVELS:
+            log_error(f"[diagnostics] 알 수 없는 진단 레벨 '{level}' -> off")
+            level = LEVEL_OFF
+        self.level = level
+        self.max_captures = max_captures
+        self.capture_dir = capture_dir
+        self.captures = 0
+        self.skipped = 0
+        self._pending: List[asyncio.Future] = []
+
+    @classmethod
+    def from_env(cls) -> 'Diagnostics':
+        return cls(
+            level=os.getenv('DC_DIAGNOSTICS', LEVEL_OFF).lower(),
+            max_captures=int(os.getenv('DC_DIAGNOSTICS_MAX', '20')),
+            capture_dir=os.getenv('DC_DIAGNOSTICS_DIR', '.'),
+        )
+
+    @property
+    def summary(self) -> bool:
+        return LEVELS[self.level] >= LEVELS[LEVEL_SUMMARY]
+
+    @property
+    def full(self) -> bool:
+        return self.level == LEVEL_FULL
+
+    async def snippet(self, page, label: str, length: int = 300):
+        # 본문 일부 출력 (summary 이상에서만 DOM 직렬화)
+        if not self.summary:
+            return
+        try:
+            content = await page.content()
+        except Exception as e:
+            log_error(f"[diagnostics] {label}: 본문 가져오기 실패: {e}")
+            return
+        log_info(f"[diagnostics] {label}: {page.url} | {content[:length]}")
+
+    async def element_state(self, element, label: str):
+        # is_enabled/is_visible 조회 (summary 이상에서만 IPC 호출)
+        if not self.summary:
+            return
+        try:
+            log_info(f"[diagnostics] {label}: enabled={await element.is_enabled()}, visible={await element.is_visible()}")
+        except Exception as e:
+            log_error(f"[diagnostics] {label}: 요소 상태 조회 실패: {e}")
+
+    async def capture(self, page, label: str) -> Optional[str]:
+        # 전체 HTML 저장 (full 에서만, 실행당 max_captures 개까지). 파일 쓰기는 executor 에서 비동기로
+        if not self.full:
+            return None
+        if self.captures >= self.max_captures:
+            self.skipped += 1
+            return None
+        self.captures += 1
+        try:
+            content = await page.content()
+        except Exception as e:
+            log_error(f"[diagnostics] {label}: 캡처 실패: {e}")
+            return None
+        path = os.path.join(self.capture_dir, f"{label}_{int(time.time())}_{self.captures}.html")
+        loop = asyncio.get_event_loop()
+        self._pending.append(loop.run_in_executor(None, self._write, path, content))
+        log_info(f"[diagnostics] 캡처 저장: {path} ({self.captures}/{self.max_captures})")
+        return path
+
+    @staticmethod
+    def _write(path: str, content: str):
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        except Exception as e:
+            log_error(f"[diagnostics] 캡처 파일 쓰기 실패: {path} | {e}")
+
+    async def drain(self):
+        # 아직 끝나지 않은 캡처 파일 쓰기를 기다린다
+        pending, self._pending = self._pending, []
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def report(self) -> str:
+        return f"level={self.level}, 캡처 {self.captures}/{self.max_captures}, 한도 초과로 생략 {self.skipped}"
@@ -0,0 +1,260 @@
+# dc_http_engine.py
+# 브라우저 없이 HTTP 세션 하나로 게시글을 삭제하는 엔진.
+# 로그인/캡차는 기존 Chromium 경로(DCCleaner)가 담당하고, 여기서는 저장된 쿠키만 재사용한다.
+import re
+from html.parser import HTMLParser
+from http.cookies import Morsel
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+
+from dc_cookie import DCCookieManager
+from dc_delete_strategy import (
+    DELETE_REFUSAL_PATTERNS, DELETE_SUCCESS_PATTERNS, FAIL_ALREADY_DELETED, FAIL_BLOCKED, FAIL_INVALID_LINK,
+    classify_exception, classify_refusal, looks_like_captcha
+)
+from dc_logger import log_error, log_info
+from dc_rate_limit import HostRateLimiter
+
+RESULT_DELETED = 'deleted'
+RESULT_FAILED = 'failed'
+RESULT_NEED_BROWSER = 'need_browser'  # 캡차/세션 만료 -> 브라우저 경로로 넘김
+
+DESKTOP_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+
+class _Blocked(Exception):
+    # 403 응답: 차단 중에는 남은 삭제 요청을 보내지 않고 바로 실패 처리
+    pass
+
+
+class _FormParser(HTMLParser):
+    # 페이지 내 <form> 들의 action/method/input 값과 제출 버튼 문구를 수집
+    def __init__(self):
+        super().__init__()
+        self.forms: List[Dict] = []
+        self._current: Optional[Dict] = None
+        self._in_button = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'form':
+            self._current = {
+                'action': attrs.get('action') or '',
+                'method': (attrs.get('method') or 'get').lower(),
+                'fields': {},
+                'labels': [],
+            }
+            self.forms.append(self._current)
+        elif self._current is None:
+            return
+        elif tag == 'input':
+            name = attrs.get('name')
+            input_type = (attrs.get('type') or 'text').lower()
+            if input_type in ('submit', 'button'):
+                self._current['labels'].append(attrs.get('value') or '')
+            if name and input_type not in ('submit', 'button', 'image', 'checkbox', 'radio'):
+                self._current['fields'][name] = attrs.get('value') or ''
+        elif tag == 'button':
+            self._in_button = True
+
+    def handle_endtag(self, tag):
+        if tag == 'form':
+            self._current = None
+        elif tag == 'button':
+            self._in_button = False
+
+    def handle_data(self, data):
+        if self._current is not None and self._in_button:
+            self._current['labels'].append(data.strip())
+
+
+def parse_forms(html: str) -> List[Dict]:
+    parser = _FormParser()
+    parser.feed(html)
+    return parser.forms
+
+
+def pick_delete_form(forms: List[Dict]) -> Optional[Dict]:
+    for form in forms:
+        if 'delete' in form['action'] or any('삭제' in label for label in form['labels']):
+            return form
+    return None
+
+
+def to_delete_url(view_link: str) -> str:
+    # /board/view/?id=..&no=.. -> /board/delete/?id=..&no=.. (mgallery/mini 동일)
+    return view_link.replace('/board/view', '/board/delete', 1)
+
+
+def _is_login_redirect(url: str) -> bool:
+    parsed = urlparse(url)
+    return parsed.netloc.startswith('sign.') or '/login' in parsed.path
+
+
+# 삭제된 글의 보기 요청은 alert('삭제된 게시물입니다.') 후 뒤로 가는 스크립트 페이지를 돌려준다
+_ALERT_RE = re.compile(r"""alert\(\s*['"]([^'"]*)['"]\s*\)""")
+
+
+def is_deleted_view(status: int, final_url: str, html: str) -> bool:
+    # 본문 전체 문자열 검색은 살아 있는 글의 본문/댓글에 같은 문구가 있으면 오판하므로
+    # 404/410, 오류 페이지 리다이렉트, 오류 alert 메시지로만 판정
+    if status in (404, 410) or '/error/' in urlparse(final_url).path:
+        return True
+    return any(p in message for message in _ALERT_RE.findall(html) for p in DELETE_SUCCESS_PATTERNS)
+
+
+def _update_jar(jar, cookies: List[Dict]):
+    for cookie in cookies:
+        morsel = Morsel()
+        morsel.set(cookie['name'], cookie['value'], cookie['value'])
+        morsel['domain'] = cookie.get('domain', '')
+        morsel['path'] = cookie.get('path', '/')
+        jar.update_cookies({cookie['name']: morsel})
+
+
+class DCHttpDeleter:
+    def __init__(self, cookie_path='dc_cookies.json', max_connections: int = 8, timeout: float = 30.0,
+                 rate_limiter: Optional[HostRateLimiter] = None):
+        self.cookie_manager = DCCookieManager(str(cookie_path))
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.session = None
+
+    async def start(self):
+        try:
+            import aiohttp
+        except ImportError:
+            raise RuntimeError("HTTP 삭제 엔진을 사용하려면 aiohttp 가 필요합니다: pip install aiohttp")
+        cookies = self.cookie_manager.load_cookies()
+        if not cookies:
+            raise RuntimeError("저장된 쿠키가 없습니다. 먼저 브라우저로 로그인해 쿠키를 저장하세요.")
+        # unsafe=True: 로컬 테스트 서버(IP 호스트)에서도 쿠키 전송
+        jar = aiohttp.CookieJar(unsafe=True)
+        _update_jar(jar, cookies)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            cookie_jar=jar,
+            headers={'User-Agent': DESKTOP_USER_AGENT, **DEFAULT_HEADERS},
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        log_info(f"[http_engine] HTTP 세션 시작 (쿠키 {len(cookies)}개, 최대 연결 {self.max_connections})")
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def reload_cookies(self):
+        # 브라우저에서 캡차/재로그인 후 저장된 쿠키를 열린 세션에 반영
+        cookies = self.cookie_manager.load_cookies()
+        if self.session is not None and cookies:
+            _update_jar(self.session.cookie_jar, cookies)
+            log_info(f"[http_engine] 쿠키 {len(cookies)}개 갱신")
+
+    def _csrf_token(self) -> Optional[str]:
+        # 디시 폼은 ci_c 쿠키 값을 ci_t 로 함께 보낸다
+        for cookie in self.session.cookie_jar:
+            if cookie.key == 'ci_c':
+                return cookie.value
+        return None
+
+    async def _fetch(self, method: str, url: str, post: Optional[dict] = None, **kwargs):
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(url)
+        async with self.session.request(method, url, **kwargs) as resp:
+            text = await resp.text(errors='replace')
+        if post is not None and (resp.status == 403 or looks_like_captcha(text)):
+            # 차단 신호 (동시 삭제 수 감소)
+            post['blocked'] = True
+            post['captcha'] = post.get('captcha') or looks_like_captcha(text)
+            if not post['captcha']:
+                raise _Blocked(f"{method} {url} -> {resp.status}")
+        return resp.status, str(resp.url), text
+
+    async def delete_post(self, post: dict) -> str:
+        link = post['link']
+        if "/board/view" not in link:
+            log_info(f"[http_engine] Invalid post link pattern: {link} -> Skipping.")
+            post['fail_reason'] = FAIL_INVALID_LINK
+            return RESULT_FAILED
+        try:
+            # 1) 게시글 보기
+            status, final_url, view_html = await self._fetch('GET', link, post)
+            if _is_login_redirect(final_url) or looks_like_captcha(view_html):
+                log_info(f"[http_engine] 로그인/캡차 필요 -> 브라우저 경로: {link}")
+                return RESULT_NEED_BROWSER
+            if is_deleted_view(status, final_url, view_html):
+                log_info(f"[http_engine] 이미 삭제된 게시물: {link}")
+                return RESULT_DELETED
+
+            # 2) goDelete 메타 삭제 URL 이 있으면 바로 POST
+            m = re.search(r"goDelete\('([^']+)'\)", view_html)
+            if m:
+                meta_url = urljoin(final_url, m.group(1))
+                status, _, body = await self._fetch('POST', meta_url, post, headers={'Referer': link})
+                log_info(f"[http_engine] 직접 삭제 요청 결과: {status}")
+                if status == 200 and not looks_like_captcha(body) and not any(p in body for p in DELETE_REFUSAL_PATTERNS):
+                    return RESULT_DELETED
+
+            # 3) 삭제 확인 페이지 -> 폼 제출
+            delete_url = to_delete_url(link)
+            status, confirm_url, confirm_html = await self._fetch('GET', delete_url, post, headers={'Referer': link})
+            if _is_login_redirect(confirm_url) or looks_like_captcha(confirm_html):
+                return RESULT_NEED_BROWSER
+            form = pick_delete_form(parse_forms(confirm_html))
+            if form is None:
+                log_info(f"[http_engine] 삭제 확인 폼 탐색 실패: {delete_url} (status={status})")
+                return RESULT_FAILED
+            fields = dict(form['fields'])
+            token = self._csrf_token()
+            if token and 'ci_t' not in fields:
+                fields['ci_t'] = token
+            action = urljoin(confirm_url, form['action'] or confirm_url)
+            status, final_url, body = await self._fetch(
+                'POST', action, post, data=fields, headers={'Referer': confirm_url}
+            )
+            if _is_login_redirect(final_url) or looks_like_captcha(body):
+                return RESULT_NEED_BROWSER
+            refusal = classify_refusal(body)
+            if refusal == FAIL_ALREADY_DELETED:
+                # 브라우저 경로(_confirm_delete)와 같이 이미 삭제된 글은 성공 취급 (원장에는 사유만 남김)
+                log_info(f"[http_engine] 이미 삭제된 게시물: {link}")
+                post['fail_reason'] = refusal
+                return RESULT_DELETED
+            if refusal:
+                log_info(f"[http_engine] 삭제 응답 본문에 실패 메시지 감지: {body[:100]}")
+                post['fail_reason'] = refusal
+                return RESULT_FAILED
+            if status in (200, 302, 303, 204):
+                log_info(f"[http_engine] [RESULT] 삭제 성공 판정: {post.get('title', '')} ({status})")
+                return RESULT_DELETED
+            log_info(f"[http_engine] [RESULT] 삭제 실패 판정: status={status}")
+            return RESULT_FAILED
+        except _Blocked as e:
+            log_info(f"[http_engine] 차단 응답, 남은 요청 중단: {e}")
+            post['fail_reason'] = FAIL_BLOCKED
+            return RESULT_FAILED
+        except Exception as e:
+            log_error(f"[http_engine] 삭제 요청 예외: {link} | {type(e).__name__}: {e}")
+            post['fail_reason'] = classify_exception(e)
+            return RESULT_FAILED
@@ -0,0 +1,252 @@
+# dc_ledger.py
+# (갤러리 id, 글번호) 단위 삭제 이력. 재시작 시 이어서 진행하고, 영구 실패 글은 건너뛴다.
+import sqlite3
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from dc_delete_strategy import DEFAULT_POLICY, FAIL_ALREADY_DELETED, PERMANENT_FAILURES, RETRY_POLICIES
+from dc_logger import log_info
+from dc_post import PostRecord, parse_post_key
+
+STATE_QUEUED = 'queued'
+STATE_DELETED = 'deleted'
+STATE_VERIFIED = 'verified'
+STATE_FAILED = 'failed'  # 영구 실패 (skip-list)
+DONE_STATES = (STATE_DELETED, STATE_VERIFIED, STATE_FAILED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    gallery_id    TEXT NOT NULL,
+    post_no       INTEGER NOT NULL,
+    link          TEXT NOT NULL,
+    title         TEXT,
+    post_date     TEXT,
+    gallog_no     TEXT,
+    state         TEXT NOT NULL,
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    last_error    TEXT,
+    first_seen    REAL,
+    last_attempt  REAL,
+    last_duration REAL,
+    deleted_at    REAL,
+    verified_at   REAL,
+    PRIMARY KEY (gallery_id, post_no)
+);
+CREATE INDEX IF NOT EXISTS idx_posts_state ON posts (state);
+-- 갤로그 목록 색인 (삭제 대상 여부와 무관하게 목록에서 본 모든 글). 다음 실행은 새 페이지만 가져온다
+CREATE TABLE IF NOT EXISTS gallog_index (
+    gallery_id    TEXT NOT NULL,
+    post_no       INTEGER NOT NULL,
+    link          TEXT NOT NULL,
+    title         TEXT,
+    post_date     TEXT,
+    gallog_no     TEXT,
+    indexed_at    REAL,
+    PRIMARY KEY (gallery_id, post_no)
+);
+CREATE INDEX IF NOT EXISTS idx_gallog_index_date ON gallog_index (post_date);
+CREATE INDEX IF NOT EXISTS idx_gallog_index_link ON gallog_index (link);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+SYNC_GALLOG_COMPLETE = 'gallog_complete'  # 갤로그 마지막 페이지까지 한 번 이상 색인했는지
+
+
+def post_key(post: dict) -> Tuple[Optional[str], Optional[int]]:
+    if post.get('gallery_id') and post.get('no') is not None:
+        return post['gallery_id'], post['no']
+    return parse_post_key(post.get('link', ''))
+
+
+class DeletionLedger:
+    def __init__(self, path='dc_ledger.sqlite3', policies: Optional[Dict[str, Tuple[int, float]]] = None):
+        self.path = str(path)
+        # 재시도 스케줄러와 같은 사유별 정책으로 영구 실패 시점을 정한다 (실행이 끊겨도 전체 시도 횟수는 유지)
+        self.policies = dict(RETRY_POLICIES, **(policies or {}))
+        # execute shard 프로세스들이 같은 원장을 함께 쓰므로 잠금 대기 시간을 둔다 (WAL)
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def max_attempts(self, reason: Optional[str]) -> int:
+        return self.policies.get(reason, DEFAULT_POLICY)[0] + 1
+
+    def state(self, post: dict) -> Optional[str]:
+        gallery_id, no = post_key(post)
+        row = self.conn.execute(
+            'SELECT state FROM posts WHERE gallery_id=? AND post_no=?', (gallery_id, no)
+        ).fetchone()
+        return row[0] if row else None
+
+    def enqueue(self, post: dict) -> bool:
+        # 큐에 넣을 글이면 True. 이미 삭제/영구 실패로 기록된 글은 False (skip)
+        gallery_id, no = post_key(post)
+        if gallery_id is None or no is None:
+            return True
+        state = self.state(post)
+        if state in DONE_STATES:
+            return False
+        if state is None:
+            date = post.get('date')
+            self.conn.execute(
+                'INSERT INTO posts (gallery_id, post_no, link, title, post_date, gallog_no, state, first_seen) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (gallery_id, no, post['link'], post.get('title'),
+                 date.isoformat() if isinstance(date, datetime) else date, post.get('gallog_no'),
+                 STATE_QUEUED, time.time())
+            )
+            self.conn.commit()
+        return True
+
+    def record_result(self, post: dict, success: bool, duration: float = 0.0, reason: Optional[str] = None):
+        gallery_id, no = post_key(post)
+        if gallery_id is None or no is None:
+            return
+        self.enqueue(post)
+        now = time.time()
+        if success or reason == FAIL_ALREADY_DELETED:
+            self.conn.execute(
+                'UPDATE posts SET state=?, attempts=attempts+1, last_attempt=?, last_duration=?, '
+                'deleted_at=?, last_error=? WHERE gallery_id=? AND post_no=?',
+                (STATE_DELETED, now, duration, now, reason, gallery_id, no)
+            )
+        else:
+            self.conn.execute(
+                'UPDATE posts SET attempts=attempts+1, last_attempt=?, last_duration=?, last_error=? '
+                'WHERE gallery_id=? AND post_no=?',
+                (now, duration, reason, gallery_id, no)
+            )
+            attempts = self.conn.execute(
+                'SELECT attempts FROM posts WHERE gallery_id=? AND post_no=?', (gallery_id, no)
+            ).fetchone()[0]
+            if reason in PERMANENT_FAILURES or attempts >= self.max_attempts(reason):
+                self.conn.execute(
+                    'UPDATE posts SET state=? WHERE gallery_id=? AND post_no=?', (STATE_FAILED, gallery_id, no)
+                )
+                log_info(f"[ledger] 영구 실패로 skip-list 등록: {post.get('link', '')} (사유: {reason or '재시도 초과'}, 시도 {attempts}회)")
+        self.conn.commit()
+
+    def mark_failed(self, post: dict, reason: Optional[str] = None):
+        # 이번 실행의 재시도 정책을 다 쓴 글 (다음 실행에서도 skip)
+        gallery_id, no = post_key(post)
+        self.conn.execute(
+            'UPDATE posts SET state=?, last_error=? WHERE gallery_id=? AND post_no=?',
+            (STATE_FAILED, reason, gallery_id, no)
+        )
+        self.conn.commit()
+
+    def mark_verified(self, post: dict):
+        gallery_id, no = post_key(post)
+        self.conn.execute(
+            'UPDATE posts SET state=?, verified_at=? WHERE gallery_id=? AND post_no=?',
+            (STATE_VERIFIED, time.time(), gallery_id, no)
+        )
+        self.conn.commit()
+
+    def mark_unverified(self, post: dict) -> bool:
+        # 검증에서 본문이 남아 있던 글을 다시 대기 상태로. 재시도 여지가 없으면 영구 실패로 두고 False
+        gallery_id, no = post_key(post)
+        row = self.conn.execute(
+            'SELECT attempts FROM posts WHERE gallery_id=? AND post_no=?', (gallery_id, no)
+        ).fetchone()
+        retry = row is None or row[0] < self.max_attempts('unverified')
+        self.conn.execute(
+            'UPDATE posts SET state=?, deleted_at=NULL, last_error=? WHERE gallery_id=? AND post_no=?',
+            (STATE_QUEUED if retry else STATE_FAILED, 'unverified', gallery_id, no)
+        )
+        self.conn.commit()
+        return retry
+
+    def indexed_links(self, links: Iterable[str]) -> Set[str]:
+        # 이미 색인된 링크만 골라낸다 (페이지당 쿼리 1회)
+        links = list(links)
+        if not links:
+            return set()
+        rows = self.conn.execute(
+            f"SELECT link FROM gallog_index WHERE link IN ({','.join('?' * len(links))})", links
+        ).fetchall()
+        return {row[0] for row in rows}
+
+    def index_posts(self, posts: List[PostRecord]) -> int:
+        now = time.time()
+        rows = []
+        for post in posts:
+            gallery_id, no = post_key(post)
+            if gallery_id is None or no is None:
+                continue
+            date = post.get('date')
+            rows.append((gallery_id, no, post['link'], post.get('title'),
+                         date.isoformat() if isinstance(date, datetime) else date, post.get('gallog_no'), now))
+        before = self.conn.total_changes
+        self.conn.executemany(
+            'INSERT OR IGNORE INTO gallog_index (gallery_id, post_no, link, title, post_date, gallog_no, indexed_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)', rows
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def indexed_posts(self, cutoff_time: datetime, chunk: int = 500) -> Iterator[PostRecord]:
+        # 색인에서 cutoff 이전 글 중 아직 삭제/영구 실패로 끝나지 않은 글 (post_date 인덱스 범위 조회).
+        # 전체를 리스트로 만들지 않고 (post_date, rowid) 기준으로 chunk 개씩 이어서 읽는다
+        done = ','.join('?' * len(DONE_STATES))
+        last: Optional[Tuple[str, int]] = None
+        while True:
+            after = '' if last is None else 'AND (g.post_date < ? OR (g.post_date = ? AND g.rowid < ?)) '
+            rows = self.conn.execute(
+                'SELECT g.gallery_id, g.post_no, g.link, g.title, g.post_date, g.gallog_no, g.rowid FROM gallog_index g '
+                'LEFT JOIN posts p ON p.gallery_id = g.gallery_id AND p.post_no = g.post_no '
+                f"WHERE g.post_date <= ? AND (p.state IS NULL OR p.state NOT IN ({done})) {after}"
+                'ORDER BY g.post_date DESC, g.rowid DESC LIMIT ?',
+                (cutoff_time.isoformat(), *DONE_STATES, *(() if last is None else (last[0], last[0], last[1])), chunk)
+            ).fetchall()
+            for row in rows:
+                yield self._row_to_post(row[:6])
+            if len(rows) < chunk:
+                return
+            last = (rows[-1][4], rows[-1][6])
+
+    def sync_value(self, key: str) -> Optional[str]:
+        row = self.conn.execute('SELECT value FROM sync_state WHERE key=?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_sync_value(self, key: str, value: str):
+        self.conn.execute('INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)', (key, value))
+        self.conn.commit()
+
+    @staticmethod
+    def _row_to_post(row) -> PostRecord:
+        gallery_id, no, link, title, post_date, gallog_no = row
+        return PostRecord(
+            title=title or '',
+            link=link,
+            date=datetime.fromisoformat(post_date) if post_date else None,
+            gallery_id=gallery_id,
+            no=no,
+            gallog_no=gallog_no,
+        )
+
+    def pending_posts(self, chunk: int = 500) -> Iterator[PostRecord]:
+        # 이전 실행에서 큐에 들어갔지만 끝나지 않은 글 (재시작 시 열거 전에 먼저 처리). rowid 순으로 chunk 개씩
+        last_rowid = 0
+        while True:
+            rows = self.conn.execute(
+                'SELECT gallery_id, post_no, link, title, post_date, gallog_no, rowid FROM posts '
+                'WHERE state=? AND rowid > ? ORDER BY rowid LIMIT ?',
+                (STATE_QUEUED, last_rowid, chunk)
+            ).fetchall()
+            for row in rows:
+                yield self._row_to_post(row[:6])
+            if len(rows) < chunk:
+                return
+            last_rowid = rows[-1][6]
+
+    def counts(self) -> Dict[str, int]:
+        return dict(self.conn.execute('SELECT state, COUNT(*) FROM posts GROUP BY state').fetchall())
@@ -1,5 +1,10 @@
 # dc_logger.py
+import atexit
+import json
+import queue
 import sys
+import threading
+import time
 import traceback
 import datetime
 import os
@@ -10,27 +15,188 @@ PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 LOG_FILE = os.path.join(PROJECT_ROOT, f"error_log_{LOG_VERSION}.txt")
 
 LOG_LEVELS = {"DEBUG":0, "INFO":1, "WARN":2, "ERROR":3}
-CURRENT_LEVEL = LOG_LEVELS["DEBUG"]  # 최소 출력 레벨
+_LEVEL_NAME = os.getenv('DC_LOG_LEVEL', 'DEBUG').upper()
+if _LEVEL_NAME not in LOG_LEVELS:
+    # 잘못된 값이면 import 단계에서 죽지 않고 DEBUG 로 동작
+    print(f"[LOGGER WARN] 알 수 없는 DC_LOG_LEVEL={_LEVEL_NAME!r}, DEBUG 로 출력 "
+          f"(사용 가능: {', '.join(LOG_LEVELS)})", file=sys.stderr)
+    _LEVEL_NAME = 'DEBUG'
+CURRENT_LEVEL = LOG_LEVELS[_LEVEL_NAME]  # 최소 출력 레벨
 
+# 백그라운드 기록 설정: 이벤트 루프에서는 큐에 넣기만 하고 파일 쓰기/출력은 별도 스레드가 모아서 처리
+LOG_ASYNC = os.getenv('DC_LOG_ASYNC', '1') != '0'
+LOG_FORMAT = os.getenv('DC_LOG_FORMAT', 'text').lower()  # text | json (JSON lines)
+LOG_CONSOLE = os.getenv('DC_LOG_CONSOLE', '1') != '0'
+LOG_MAX_BYTES = int(os.getenv('DC_LOG_MAX_BYTES', str(10 * 1024 * 1024)))  # 0 이면 회전 안 함
+LOG_BACKUPS = int(os.getenv('DC_LOG_BACKUPS', '3'))
+LOG_BATCH = 256  # 한 번에 모아 쓰는 최대 줄 수
+LOG_FLUSH_INTERVAL = 0.5  # 초
 
-def _log(msg, level="INFO", module=None, exc_info=None):
-    if LOG_LEVELS[level] < CURRENT_LEVEL:
-        return
-    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def _format_record(record):
+    ts, level, module, msg, exc_info = record
+    tb = ''.join(traceback.format_exception(*exc_info)) if exc_info else ''
+    if LOG_FORMAT == 'json':
+        data = {'version': LOG_VERSION, 'ts': ts, 'level': level, 'module': module, 'msg': str(msg)}
+        if tb:
+            data['traceback'] = tb
+        line = json.dumps(data, ensure_ascii=False)
+        return line, line, tb
     mod = f"[{module}]" if module else ""
     line = f"[{LOG_VERSION}] [{ts}] [{level}]{mod} {msg}"
-    print(line)
+    return line, line + ("\n" + tb if tb else ""), tb
+
+
+def _rotate():
+    # error_log.txt -> error_log.txt.1 -> ... -> .N (가장 오래된 것 삭제)
+    for i in range(LOG_BACKUPS - 1, 0, -1):
+        src = f"{LOG_FILE}.{i}"
+        if os.path.exists(src):
+            os.replace(src, f"{LOG_FILE}.{i + 1}")
+    if LOG_BACKUPS > 0:
+        os.replace(LOG_FILE, f"{LOG_FILE}.1")
+    else:
+        os.remove(LOG_FILE)
+
+
+def _write_records(records):
+    console = []
+    lines = []
+    for record in records:
+        try:
+            line, file_text, tb = _format_record(record)
+        except Exception as e:
+            # 메시지 str() 실패 등: 이 줄만 버리고 나머지는 기록
+            print(f"[LOGGER ERROR] 로그 포맷 실패: {type(e).__name__}: {e} / {record!r:.200}", file=sys.stderr)
+            continue
+        console.append((line, tb))
+        lines.append(file_text + "\n")
+    if LOG_CONSOLE:
+        for line, tb in console:
+            try:
+                print(line)
+                if tb:
+                    print(tb, file=sys.stderr)
+            except Exception:
+                pass  # 콘솔이 닫혀도 파일 기록은 계속
     try:
         with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
-            if exc_info:
-                tb = ''.join(traceback.format_exception(*exc_info))
-                f.write(tb + "\n")
-                print(tb, file=sys.stderr)
+            f.writelines(lines)
+            size = f.tell()
+        if LOG_MAX_BYTES and size >= LOG_MAX_BYTES:
+            _rotate()
     except Exception as e:
         print(f"[LOGGER ERROR] 로그 파일 생성/쓰기 실패: {e}", file=sys.stderr)
         print(f"[LOGGER ERROR] 경로: {LOG_FILE}", file=sys.stderr)
 
+
+class _BackgroundWriter:
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def ensure_started(self):
+        if self.thread is not None:
+            return
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name='dc-logger', daemon=True)
+                self.thread.start()
+
+    def put(self, record):
+        self.ensure_started()
+        self.queue.put(record)
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            batch, waiters, stop = [], [], False
+            # 첫 항목을 받은 뒤 짧게 모아서 한 번에 기록
+            deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or waiters or len(batch) >= LOG_BATCH:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            # flush 요청/종료 시에는 큐에 남은 것까지 모두 기록
+            if stop or waiters:
+                while True:
+                    try:
+                        item = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        batch.append(item)
+            if batch:
+                try:
+                    _write_records(batch)
+                except Exception as e:
+                    # 기록 스레드가 죽으면 이후 로그가 큐에만 쌓이므로 오류만 알리고 계속 돈다
+                    try:
+                        print(f"[LOGGER ERROR] 로그 기록 실패 ({len(batch)}줄 유실): {type(e).__name__}: {e}",
+                              file=sys.stderr)
+                    except Exception:
+                        pass
+            for event in waiters:
+                event.set()
+            if stop:
+                return
+
+    def flush(self, timeout=5.0):
+        if self.thread is None or not self.thread.is_alive():
+            return
+        event = threading.Event()
+        self.queue.put(event)
+        event.wait(timeout)
+
+    def stop(self, timeout=5.0):
+        if self.thread is None or not self.thread.is_alive():
+            return
+        self.queue.put(None)
+        self.thread.join(timeout)
+        self.thread = None
+
+
+_writer = _BackgroundWriter()
+
+
+def flush_logs(timeout=5.0):
+    # 큐에 쌓인 로그를 파일에 모두 기록할 때까지 대기
+    _writer.flush(timeout)
+
+
+def shutdown_logging(timeout=5.0):
+    _writer.stop(timeout)
+
+
+# 종료 시 남은 로그를 반드시 기록
+atexit.register(shutdown_logging)
+
+
+def _log(msg, level="INFO", module=None, exc_info=None):
+    if LOG_LEVELS[level] < CURRENT_LEVEL:
+        return
+    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    record = (ts, level, module, msg, exc_info)
+    if LOG_ASYNC:
+        _writer.put(record)
+    else:
+        _write_records([record])
+
 def log_debug(msg, module=None):
     _log(msg, level="DEBUG", module=module)
 
@@ -0,0 +1,175 @@
+# dc_memory.py
+# 대량 삭제용 메모리 상한 모드.
+# MemoryGuard: 브라우저 자식 프로세스까지 합친 RSS 를 주기적으로 재서 한도를 넘으면 동시 삭제 상한을 낮추고 놀고 있는 Page 를 닫는다.
+# MemoryProfiler: DC_TRACEMALLOC=1 일 때 단계별 파이썬 힙 최대 증가량과 할당 위치 상위 목록을 보고한다.
+import asyncio
+import os
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from dc_logger import log_info
+
+# 한도의 이 비율 아래로 내려오면 상한을 1씩 다시 올린다
+RECOVER_RATIO = 0.85
+
+
+def process_tree_rss_kb(root_pid: int) -> int:
+    # /proc 에서 root_pid 와 모든 자손 프로세스의 RSS 합계 (Linux 전용)
+    children = {}
+    rss = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            with open(f'/proc/{entry}/statm') as f:
+                rss[int(entry)] = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total
+
+
+class MemoryGuard:
+    def __init__(self, limiter, rss_limit_mb: float = 0.0, interval: float = 5.0, page_pool=None):
+        self.limiter = limiter
+        self.rss_limit_mb = rss_limit_mb  # 0 이면 끔
+        self.interval = interval
+        self.page_pool = page_pool
+        self.peak_mb = 0.0
+        self.last_mb = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {'samples': 0, 'throttled': 0, 'trimmed_pages': 0}
+
+    @classmethod
+    def from_env(cls, limiter, page_pool=None) -> 'MemoryGuard':
+        return cls(
+            limiter,
+            rss_limit_mb=float(os.getenv('DC_RSS_LIMIT_MB', '0')),
+            interval=float(os.getenv('DC_RSS_INTERVAL', '5')),
+            page_pool=page_pool,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.rss_limit_mb > 0 and self.interval > 0 and os.path.isdir('/proc')
+
+    def sample(self) -> float:
+        self.last_mb = process_tree_rss_kb(os.getpid()) / 1024
+        self.peak_mb = max(self.peak_mb, self.last_mb)
+        self.stats['samples'] += 1
+        return self.last_mb
+
+    async def check(self):
+        rss = self.sample()
+        limiter = self.limiter
+        if rss > self.rss_limit_mb:
+            # 한도 초과: 현재 동시 삭제 수의 절반을 상한으로 걸고 남는 Page 를 닫는다
+            ceiling = max(limiter.min_limit, min(limiter.limit, limiter.ceiling or limiter.max_limit) // 2)
+            if ceiling != limiter.ceiling:
+                self.stats['throttled'] += 1
+            limiter.set_ceiling(ceiling, f"RSS {rss:.0f}MB > 한도 {self.rss_limit_mb:.0f}MB")
+            if self.page_pool is not None:
+                self.stats['trimmed_pages'] += await self.page_pool.trim(ceiling)
+        elif limiter.ceiling is not None and rss < self.rss_limit_mb * RECOVER_RATIO:
+            if limiter.ceiling + 1 >= limiter.max_limit:
+                limiter.set_ceiling(None, f"RSS {rss:.0f}MB")
+            else:
+                limiter.set_ceiling(limiter.ceiling + 1, f"RSS {rss:.0f}MB")
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception as e:
+                log_info(f"[memory] RSS 확인 실패: {e}")
+
+    def start(self):
+        if not self.enabled:
+            if self.rss_limit_mb > 0:
+                log_info("[memory] /proc 이 없어 RSS 한도(DC_RSS_LIMIT_MB)를 적용하지 않습니다")
+            return
+        if self._task is None:
+            log_info(f"[memory] RSS 한도 {self.rss_limit_mb:.0f}MB ({self.interval}s 마다 확인)")
+            self._task = asyncio.ensure_future(self._loop())
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def summary(self) -> str:
+        return f"RSS 최대 {self.peak_mb:.0f}MB / 한도 {self.rss_limit_mb:.0f}MB, {self.stats}"
+
+
+class MemoryProfiler:
+    # 단계별 tracemalloc 최대 증가량. 동시에 열린 단계(워커 여러 개, total 안의 하위 단계)는
+    # 같은 구간의 최대치를 함께 보므로 단계 간 구분은 근사값이다
+    def __init__(self, frames: int = 1, top: int = 10):
+        self.frames = frames
+        self.top = top
+        self.peaks: Dict[str, int] = {}
+        self._open: Dict[int, list] = {}  # 순번 -> [시작 시 사용량, 지금까지 본 최대 사용량]
+        self._seq = 0
+
+    @classmethod
+    def from_env(cls) -> Optional['MemoryProfiler']:
+        if os.getenv('DC_TRACEMALLOC', '0') == '0':
+            return None
+        return cls(frames=int(os.getenv('DC_TRACEMALLOC_FRAMES', '1')))
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def _fold_peak(self):
+        # reset_peak(3.9+) 전에 지금까지의 최대치를 열린 단계 모두에 반영
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in self._open.values():
+            frame[1] = max(frame[1], peak)
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        return current
+
+    @contextmanager
+    def stage(self, name: str):
+        if not tracemalloc.is_tracing():
+            yield
+            return
+        self._seq += 1
+        key = self._seq
+        current = self._fold_peak()
+        self._open[key] = [current, current]
+        try:
+            yield
+        finally:
+            current = self._fold_peak()
+            start, peak = self._open.pop(key)
+            if not hasattr(tracemalloc, 'reset_peak'):
+                peak = current  # 3.8 이하: 최대치 대신 끝난 시점 증가량
+            self.peaks[name] = max(self.peaks.get(name, 0), peak - start)
+
+    def report(self) -> str:
+        if not tracemalloc.is_tracing():
+            return ''
+        current, _ = tracemalloc.get_traced_memory()
+        lines = [f"파이썬 힙 현재 {current / 1024 / 1024:.1f}MB"]
+        for name, size in sorted(self.peaks.items(), key=lambda item: -item[1]):
+            lines.append(f"  단계 {name:<16} 최대 증가 {size / 1024:>10.1f}KB")
+        lines.append(f"할당 위치 상위 {self.top}개:")
+        for stat in tracemalloc.take_snapshot().statistics('lineno')[:self.top]:
+            lines.append(f"  {stat.traceback[0].filename}:{stat.traceback[0].lineno} "
+                         f"{stat.size / 1024:.1f}KB ({stat.count}개)")
+        return '\n'.join(lines)
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
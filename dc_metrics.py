@@ -0,0 +1,194 @@
+# dc_metrics.py
+# 삭제 단계별 소요 시간(히스토그램)/카운터 수집 및 리포트, Prometheus 텍스트/JSON 내보내기
+import asyncio
+import json
+import os
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from typing import Deque, Dict, List, Optional
+
+from dc_logger import log_error
+
+# 이벤트 기반 대기 도입 전 삭제 흐름이 단계마다 무조건 쉬던 고정 sleep 합계(초).
+# 측정값이 아니라 예전 코드의 asyncio.sleep 인자를 더한 상수다 (예전 흐름의 단계 시간 = 실제 작업 시간 + 이 값)
+LEGACY_FIXED_WAITS = {
+    'navigate': 2.0,        # goto + networkidle 후 sleep(2)
+    'delete_click': 2.2,    # hover 0.5 + focus 0.2 + click 0.5 + 1.0
+    'confirm_click': 0.5,   # 확인 클릭 후 0.5
+    'server_response': 4.0, # 서버 반영 대기 4.0 (응답 대기 최대 5s 별도)
+    'verify': 8.5,          # reload 후 1.0 + 재접근 3회 x (1.5 + 1.0)
+}
+
+# 단계별 소요 시간 히스토그램 구간(초, 상한)
+HISTOGRAM_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+# 기본으로 0 부터 노출하는 카운터
+DEFAULT_COUNTERS = ('success', 'failure', 'retry', 'captcha', 'blocked')
+# 백분위 계산용으로 단계별 최근 표본만 보관 (대량 삭제에서도 메모리 일정. 개수/합계/최대는 히스토그램이 전체 기록)
+SAMPLE_WINDOW = int(os.getenv('DC_METRICS_SAMPLES', '10000'))
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class Histogram:
+    def __init__(self, buckets=HISTOGRAM_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        for i, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> List[int]:
+        result, total = [], 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+
+class StageTimer:
+    def __init__(self, memory=None):
+        self.samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=SAMPLE_WINDOW))
+        self.histograms: Dict[str, Histogram] = defaultdict(Histogram)
+        self.counters: Dict[str, int] = {name: 0 for name in DEFAULT_COUNTERS}
+        self.memory = memory  # dc_memory.MemoryProfiler (DC_TRACEMALLOC=1 일 때 단계별 최대 메모리)
+
+    def record(self, stage: str, seconds: float):
+        self.samples[stage].append(seconds)
+        self.histograms[stage].observe(seconds)
+
+    def inc(self, counter: str, amount: int = 1):
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            with self.memory.stage(name) if self.memory is not None else nullcontext():
+                yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def report(self) -> str:
+        lines = [f"{'stage':<16}{'n':>6}{'mean(s)':>10}{'p95(s)':>10}{'max(s)':>10}{'old sleep est.(s)':>20}"]
+        for stage, samples in self.samples.items():
+            hist = self.histograms[stage]
+            legacy = LEGACY_FIXED_WAITS.get(stage)
+            lines.append(
+                f"{stage:<16}{hist.count:>6}{hist.sum / hist.count:>10.2f}"
+                f"{percentile(samples, 95):>10.2f}{hist.max:>10.2f}"
+                f"{(f'~{legacy:.1f}' if legacy is not None else '-'):>20}"
+            )
+        if any(stage in LEGACY_FIXED_WAITS for stage in self.samples):
+            lines.append("* old sleep est.: 예전 코드의 고정 sleep 인자 합계로 만든 추정치 (측정값 아님, 비교는 참고용)")
+        return '\n'.join(lines)
+
+    def to_dict(self) -> dict:
+        stages = {}
+        for stage, samples in self.samples.items():
+            hist = self.histograms[stage]
+            stages[stage] = {
+                'count': hist.count,
+                'sum': hist.sum,
+                'mean': hist.sum / hist.count,
+                'p50': percentile(samples, 50),
+                'p95': percentile(samples, 95),
+                'p99': percentile(samples, 99),
+                'max': hist.max,
+                'buckets': {str(upper): count for upper, count in zip(hist.buckets, hist.cumulative())},
+            }
+        return {'generated_at': time.time(), 'counters': dict(self.counters), 'stages': stages}
+
+    def to_prometheus(self) -> str:
+        lines = [
+            '# HELP dc_stage_duration_seconds Time spent in each delete stage.',
+            '# TYPE dc_stage_duration_seconds histogram',
+        ]
+        for stage, hist in self.histograms.items():
+            for upper, count in zip(hist.buckets, hist.cumulative()):
+                lines.append(f'dc_stage_duration_seconds_bucket{{stage="{stage}",le="{upper}"}} {count}')
+            lines.append(f'dc_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} {hist.count}')
+            lines.append(f'dc_stage_duration_seconds_sum{{stage="{stage}"}} {hist.sum:.6f}')
+            lines.append(f'dc_stage_duration_seconds_count{{stage="{stage}"}} {hist.count}')
+        for name, value in self.counters.items():
+            lines.append(f'# TYPE dc_{name}_total counter')
+            lines.append(f'dc_{name}_total {value}')
+        return '\n'.join(lines) + '\n'
+
+    def render(self, prom_path: Optional[str], json_path: Optional[str]) -> Dict[str, str]:
+        files = {}
+        if prom_path:
+            files[prom_path] = self.to_prometheus()
+        if json_path:
+            files[json_path] = json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return files
+
+    def write(self, prom_path: Optional[str], json_path: Optional[str]):
+        write_files(self.render(prom_path, json_path))
+
+
+def write_files(files: Dict[str, str]):
+    # 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 임시 파일에 쓰고 교체
+    for path, text in files.items():
+        try:
+            tmp = path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except Exception as e:
+            log_error(f"[metrics] 메트릭 파일 쓰기 실패: {path} | {e}")
+
+
+class MetricsWriter:
+    # 실행 중 주기적으로 메트릭 파일을 갱신
+    def __init__(self, timer: StageTimer, prom_path: Optional[str] = 'dc_metrics.prom',
+                 json_path: Optional[str] = 'dc_metrics.json', interval: float = 30.0):
+        self.timer = timer
+        self.prom_path = prom_path
+        self.json_path = json_path
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls, timer: StageTimer) -> 'MetricsWriter':
+        return cls(
+            timer,
+            prom_path=os.getenv('DC_METRICS_PROM', 'dc_metrics.prom') or None,
+            json_path=os.getenv('DC_METRICS_JSON', 'dc_metrics.json') or None,
+            interval=float(os.getenv('DC_METRICS_INTERVAL', '30')),
+        )
+
+    def start(self):
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.ensure_future(self._loop())
+
+    def write(self):
+        self.timer.write(self.prom_path, self.json_path)
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            # 직렬화는 이벤트 루프에서(수집 중인 dict 보호), 파일 쓰기만 executor 에서
+            files = self.timer.render(self.prom_path, self.json_path)
+            await asyncio.get_event_loop().run_in_executor(None, write_files, files)
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        self.write()
@@ -0,0 +1,130 @@
+# dc_page_pool.py
+# 게시글마다 new_page()/close() 하지 않고 고정 개수의 Page 를 재사용한다.
+# 반납 시 상태 점검 + about:blank 초기화, 크래시/분리된 Page 만 새로 만든다.
+import asyncio
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+from dc_logger import log_info, log_error
+
+
+class PagePool:
+    def __init__(self, context, size: int = 3, initial: Optional[int] = None, health_timeout: float = 3.0):
+        self.context = context
+        self.size = size  # 최대 Page 수
+        self.initial = size if initial is None else min(initial, size)
+        self.health_timeout = health_timeout
+        self._idle: Optional[asyncio.Queue] = None
+        self._pages: List = []
+        self._crashed = set()
+        self._creating = 0  # 만드는 중인 Page 수 (await 중에 다른 작업자가 최대치를 넘겨 만들지 않도록 미리 자리를 잡는다)
+        self._waiting = 0  # 놀고 있는 Page 를 기다리는 호출 수 (close 시 깨워야 한다)
+        self._closed = False
+        self.stats = {'created': 0, 'reused': 0, 'replaced': 0, 'trimmed': 0}
+
+    async def _new_page(self):
+        self._creating += 1
+        try:
+            page = await self.context.new_page()
+        finally:
+            self._creating -= 1
+        page.on('crash', lambda p=page: self._crashed.add(id(p)))
+        self._pages.append(page)
+        self.stats['created'] += 1
+        return page
+
+    async def start(self):
+        self._idle = asyncio.Queue()
+        for _ in range(self.initial):
+            self._idle.put_nowait(await self._new_page())
+        log_info(f"[page_pool] Page {self.initial}개 준비 완료 (최대 {self.size}개)")
+
+    async def _healthy(self, page) -> bool:
+        if page.is_closed() or id(page) in self._crashed:
+            return False
+        try:
+            await asyncio.wait_for(page.evaluate('1'), timeout=self.health_timeout)
+            return True
+        except Exception:
+            return False
+
+    async def _reset(self, page):
+        await page.goto('about:blank', timeout=int(self.health_timeout * 1000))
+
+    async def _discard(self, page):
+        # 닫은 뒤에 목록에서 빼야 close 를 기다리는 동안 빈 자리로 보이지 않는다 (교체 Page 가 바로 자리를 잡음)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception:
+            pass
+        self._crashed.discard(id(page))
+        if page in self._pages:
+            self._pages.remove(page)
+
+    async def _release(self, page):
+        if self._closed:
+            # 풀이 닫힌 뒤 반납된 Page 는 큐에 넣지 않고 닫는다
+            await self._discard(page)
+            return
+        try:
+            if await self._healthy(page):
+                await self._reset(page)
+                self._idle.put_nowait(page)
+                self.stats['reused'] += 1
+                return
+        except Exception as e:
+            log_error(f"[page_pool] Page 초기화 실패, 교체: {e}")
+        await self._discard(page)
+        self.stats['replaced'] += 1
+        try:
+            self._idle.put_nowait(await self._new_page())
+        except Exception as e:
+            # 컨텍스트가 닫힌 경우 등: 풀 크기가 줄어든 채로 두고 호출 측 예외 처리에 맡긴다
+            log_error(f"[page_pool] Page 재생성 실패: {e}")
+
+    @asynccontextmanager
+    async def page(self):
+        if self._closed:
+            raise RuntimeError("Page 풀이 이미 닫힘")
+        if self._idle is None:
+            await self.start()
+        if self._idle.empty() and len(self._pages) + self._creating < self.size:
+            # 동시 삭제 수가 늘어 놀고 있는 Page 가 없으면 최대치까지 새로 만든다
+            page = await self._new_page()
+        else:
+            self._waiting += 1
+            try:
+                page = await self._idle.get()
+            finally:
+                self._waiting -= 1
+            if page is None:
+                # close() 가 넣은 종료 신호: 영원히 기다리지 않고 호출 측 예외 처리로 넘긴다
+                raise RuntimeError("Page 풀이 닫혀 Page 를 받을 수 없음")
+        if not await self._healthy(page):
+            await self._discard(page)
+            self.stats['replaced'] += 1
+            page = await self._new_page()
+        try:
+            yield page
+        finally:
+            await self._release(page)
+
+    async def trim(self, keep: int) -> int:
+        # 메모리 압박 시 놀고 있는 Page 를 keep 개만 남기고 닫는다 (렌더러 메모리 반환, 필요하면 다시 생성)
+        closed = 0
+        while self._idle is not None and len(self._pages) > keep and not self._idle.empty():
+            await self._discard(self._idle.get_nowait())
+            closed += 1
+        self.stats['trimmed'] += closed
+        return closed
+
+    async def close(self):
+        self._closed = True
+        if self._idle is not None:
+            # Page 를 기다리던 작업자를 종료 신호(None)로 깨운다
+            for _ in range(self._waiting):
+                self._idle.put_nowait(None)
+        for page in list(self._pages):
+            await self._discard(page)
+        self._idle = None
@@ -0,0 +1,286 @@
+# dc_pipeline.py
+# 갤로그 열거(producer)와 삭제(worker)를 bounded asyncio.Queue 로 연결해 동시에 진행한다.
+import asyncio
+import os
+import time
+from typing import Dict, Iterable, Optional, Set
+
+from dc_delete_strategy import FAIL_BLOCKED, STRATEGY_LISTING, classify_exception, gallery_type
+from dc_ledger import STATE_DELETED, STATE_FAILED, STATE_QUEUED, STATE_VERIFIED
+from dc_logger import log_info, log_error
+from dc_retry import RetryScheduler
+from dc_verify import DeletionVerifier
+
+
+class DeletePipeline:
+    def __init__(self, cleaner, hours_ago: float = 1.0, workers: Optional[int] = None,
+                 queue_size: Optional[int] = None, max_pages: Optional[int] = None,
+                 posts: Optional[Iterable[dict]] = None):
+        self.cleaner = cleaner
+        # posts 가 주어지면 갤로그를 열거하지 않고 그 목록(삭제 계획 파일의 shard)만 처리
+        self.posts = posts
+        self.hours_ago = hours_ago
+        # 워커는 최대 동시 삭제 수만큼 띄우고, 실제 동시 실행 수는 cleaner.concurrency 가 조절
+        self.workers = workers or cleaner.concurrency.max_limit
+        self.queue_size = queue_size or int(os.getenv('DC_QUEUE_SIZE', '50'))
+        self.max_pages = max_pages
+        self.queue: Optional[asyncio.Queue] = None
+        self.seen: Set[str] = set()
+        self.stats: Dict[str, int] = {
+            'enumerated': 0, 'resumed': 0, 'skipped': 0, 'success': 0, 'fail': 0, 'passes': 0,
+            'verified': 0, 'requeued': 0, 'listing': 0, 'fallback': 0, 'retried': 0, 'dead_letter': 0,
+            'recovered': 0, 'undetermined': 0,
+        }
+        # 실패한 글은 작업자 밖의 지연 재시도 큐로 (실패 사유별 backoff, 재시도 소진 시 dead-letter)
+        self.retries = RetryScheduler.from_env()
+        self.verifier: Optional[DeletionVerifier] = None
+        if os.getenv('DC_VERIFY', '1') != '0':
+            self.verifier = DeletionVerifier(
+                on_confirmed=self._on_verified,
+                on_unconfirmed=self._on_unverified,
+                on_undetermined=self._on_undetermined,
+                concurrency=int(os.getenv('DC_VERIFY_CONCURRENCY', '4')),
+                batch_size=int(os.getenv('DC_VERIFY_BATCH', '20')),
+                delay=float(os.getenv('DC_VERIFY_DELAY', '3')),
+                rate_limiter=cleaner.rate_limiter,
+                stage_timer=cleaner.stage_timer,
+            )
+
+    def _on_verified(self, post: dict):
+        self.stats['verified'] += 1
+        self.cleaner.ledger.mark_verified(post)
+
+    def _on_undetermined(self, post: dict):
+        # 검증 응답으로 판정할 수 없던 글: 원장은 삭제 상태(미검증)로 두고 다시 삭제하지 않는다
+        self.stats['undetermined'] += 1
+        log_info(f"[pipeline] 삭제 여부 판정 불가 -> 미검증으로 유지: {post.get('link', '')}", module='DeletePipeline')
+
+    async def _on_unverified(self, post: dict):
+        # 삭제했다고 판단했지만 본문이 남아 있는 글은 삭제 큐로 되돌린다
+        log_info(f"[pipeline] 삭제 미확인 -> 재삭제 대기: {post.get('link', '')}", module='DeletePipeline')
+        if post.get('strategy'):
+            # 삭제되지 않았는데 성공으로 본 전략은 성공률에서 뺀다
+            self.cleaner.strategies.revoke(gallery_type(post['link']), post.pop('strategy'))
+        if self.cleaner.ledger.mark_unverified(post):
+            self.stats['requeued'] += 1
+            self.stats['success'] -= 1
+            self.cleaner.stage_timer.inc('retry')
+            await self.queue.put(post)
+
+    async def _resume(self):
+        # 이전 실행에서 끝나지 않은 글을 열거보다 먼저 처리
+        # 미완료 글은 원장에서 조금씩 읽어 bounded 큐에 넣는다 (전체 목록을 메모리에 올리지 않음)
+        pending = self.cleaner.ledger.counts().get(STATE_QUEUED, 0)
+        if pending:
+            log_info(f"[pipeline] 원장에서 미완료 {pending}건 이어서 처리", module='DeletePipeline')
+        for post in self.cleaner.ledger.pending_posts():
+            self.seen.add(post['link'])
+            self.stats['resumed'] += 1
+            await self.queue.put(post)
+
+    async def _submit(self, post: dict) -> bool:
+        # 새로 처리할 글이면 True (목록 삭제로 끝났거나 삭제 큐에 넣음)
+        if post['link'] in self.seen:
+            return False
+        self.seen.add(post['link'])
+        if not self.cleaner.ledger.enqueue(post):
+            self.stats['skipped'] += 1
+            return False
+        self.stats['enumerated'] += 1
+        # 목록 전략(scope='listing')을 레지스트리 순서대로 시도하고, 해당 없거나 실패하면 게시글별 삭제 큐로
+        strategies = self.cleaner.strategies
+        kind = gallery_type(post['link'])
+        listing = strategies.plan(kind, scope='listing')
+        strategies.skip_excluded(kind, listing, scope='listing')
+        for strategy in listing:
+            if await self._delete_from_listing(post, strategy):
+                return True
+        await self.queue.put(post)
+        return True
+
+    async def _recover(self, generation: int) -> bool:
+        # 브라우저/메인 Page 가 죽어서 실패한 경우 재시작까지 기다리고 True (글 자체의 실패가 아님)
+        if not await self.cleaner.supervisor.recover(generation):
+            return False
+        if self.posts is not None and STRATEGY_LISTING in self.cleaner.strategies.strategies:
+            try:
+                await self._open_listing_page()
+            except Exception as e:
+                # 목록 삭제가 실패하면 게시글별 삭제로 넘어가므로 계속 진행
+                log_error(f"[pipeline] 재시작 후 갤로그 목록 열기 실패: {e}", module='DeletePipeline')
+        return True
+
+    async def _requeue_lost(self, post: dict, generation: int) -> bool:
+        # 진행 중이던 글을 원장/재시도 횟수에 기록하지 않고 다시 큐로
+        if not await self._recover(generation):
+            return False
+        for key in ('fail_reason', 'blocked', 'captcha'):
+            post.pop(key, None)
+        self.stats['recovered'] += 1
+        self.cleaner.supervisor.stats['requeued'] += 1
+        self.retries.requeue(post)
+        return True
+
+    async def _produce(self):
+        if self.posts is not None:
+            await self._produce_plan()
+            return
+        await self._resume()
+        # 삭제가 진행되면 뒤 페이지 글이 앞으로 당겨지므로, 새 글이 안 나올 때까지 1페이지부터 다시 순회
+        while True:
+            self.stats['passes'] += 1
+            found = 0
+            generation = self.cleaner.supervisor.generation
+            try:
+                async for post in self.cleaner.iter_gallog_posts(self.hours_ago, max_pages=self.max_pages):
+                    if await self._submit(post):
+                        found += 1
+            except Exception as e:
+                if not await self._recover(generation):
+                    raise
+                # 이미 큐에 넣은 글은 seen 으로 걸러지므로 재시작 후 1페이지부터 다시 열거
+                log_info(f"[pipeline] 열거 중 브라우저 재시작({type(e).__name__}) -> 1페이지부터 다시 열거",
+                         module='DeletePipeline')
+                continue
+            log_info(f"[pipeline] 열거 {self.stats['passes']}회차 완료: 신규 {found}건", module='DeletePipeline')
+            if not found:
+                break
+            await self.queue.join()
+
+    async def _produce_plan(self):
+        # 다른 shard 의 미완료 글까지 가져오지 않도록 원장 이어하기(_resume) 대신 계획 목록만 처리
+        self.stats['passes'] += 1
+        if STRATEGY_LISTING in self.cleaner.strategies.strategies:
+            await self._open_listing_page()
+        for post in self.posts:
+            await self._submit(post)
+        log_info(f"[pipeline] 삭제 계획 {self.stats['enumerated']}건 제출 (skip {self.stats['skipped']})",
+                 module='DeletePipeline')
+
+    async def _open_listing_page(self):
+        # 목록 삭제는 열린 갤로그 페이지의 쿠키/service_code 를 쓴다
+        await self.cleaner._goto(self.cleaner.page, self.cleaner.gallog_url(), wait_until='domcontentloaded',
+                                 timeout=60000)
+
+    async def _delete_from_listing(self, post: dict, strategy) -> bool:
+        # 목록 페이지에서 삭제 성공 시 True. 해당 없음/거부/실패한 글은 False 를 돌려 게시글별 삭제 큐로 넘긴다
+        await self.cleaner.challenge.wait_open()
+        started = time.time()
+        try:
+            success = await strategy.run(post, self.cleaner.page)
+        except Exception as e:
+            success = False
+            post['fail_reason'] = classify_exception(e)
+        if success is None:
+            return False  # 목록 글번호가 없는 글
+        self.cleaner.strategies.record(gallery_type(post['link']), strategy.name, success,
+                                       time.time() - started, post.get('fail_reason'))
+        if not success:
+            self.stats['fallback'] += 1
+            log_info(f"[pipeline] 목록 삭제 거부({post.pop('fail_reason', None)}) -> 게시글별 삭제: "
+                     f"{post.get('link', '')}", module='DeletePipeline')
+            if post.pop('blocked', False):
+                # 차단 응답은 동시 삭제 수 조절기에 바로 알린다
+                self.cleaner.concurrency.record(False, time.time() - started, FAIL_BLOCKED)
+                self.cleaner.stage_timer.inc('blocked')
+            return False
+        self.cleaner.ledger.record_result(post, True, time.time() - started, None)
+        self.cleaner.record_outcome(post, True, time.time() - started)
+        post['strategy'] = strategy.name
+        self.stats['success'] += 1
+        self.stats['listing'] += 1
+        if self.verifier is not None:
+            self.verifier.submit(post)
+        print(f"\033[92m[SUCCESS] Deleted from listing: {post['title']} | {post.get('link', '')}\033[0m")
+        return True
+
+    def _retry_or_fail(self, post: dict):
+        reason = post.get('fail_reason')
+        state = self.cleaner.ledger.state(post)
+        if state in (STATE_DELETED, STATE_VERIFIED):
+            # 이미 삭제된 글(FAIL_ALREADY_DELETED 등)은 실패/dead-letter 로 덮어쓰지 않는다
+            return
+        if state == STATE_FAILED:
+            # 원장이 이미 영구 실패(권한 없음, 사유별 시도 횟수 초과)로 기록한 글
+            self.retries.dead_letter(post, reason)
+        elif self.retries.schedule(post, reason):
+            self.stats['retried'] += 1
+            self.cleaner.stage_timer.inc('retry')
+            return
+        else:
+            self.cleaner.ledger.mark_failed(post, reason)
+        self.stats['fail'] += 1
+        self.stats['dead_letter'] += 1
+
+    async def _worker(self, worker_id: int):
+        while True:
+            post = await self.queue.get()
+            # except 에서도 읽으므로 try 전에 정해 둔다 (슬롯을 얻으면 시작 시각을 다시 잰다)
+            generation = self.cleaner.supervisor.generation
+            started = time.time()
+            try:
+                if post is None:
+                    return
+                async with self.cleaner.concurrency.slot():
+                    started = time.time()
+                    post.pop('fail_reason', None)
+                    success = await self.cleaner.delete_post(post)
+                if not success and await self._requeue_lost(post, generation):
+                    continue
+                self.cleaner.ledger.record_result(post, success, time.time() - started, post.get('fail_reason'))
+                self.cleaner.record_outcome(post, success, time.time() - started)
+                if success:
+                    self.stats['success'] += 1
+                    if self.verifier is not None:
+                        self.verifier.submit(post)
+                    print(f"\033[92m[SUCCESS] Deleted: {post['title']} | {post.get('link', '')}\033[0m")
+                else:
+                    print(f"\033[91m[FAIL] Failed to delete: {post['title']} | {post.get('link', '')}\033[0m")
+                    self._retry_or_fail(post)
+            except Exception as e:
+                if await self._requeue_lost(post, generation):
+                    continue
+                post['fail_reason'] = classify_exception(e)
+                self.cleaner.ledger.record_result(post, False, time.time() - started, post['fail_reason'])
+                self.cleaner.record_outcome(post, False, time.time() - started)
+                log_error(f"[pipeline] worker {worker_id} 삭제 예외: {post['title']} | {e}", module='DeletePipeline')
+                self._retry_or_fail(post)
+            finally:
+                self.queue.task_done()
+
+    async def run(self) -> Dict[str, int]:
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        workers = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        self.retries.start(self.queue)
+        if self.verifier is not None:
+            await self.verifier.start()
+        try:
+            await self._produce()
+            # 재시도 대기 글과 검증에서 되돌아온 글이 없을 때까지 삭제 -> 검증 반복
+            while True:
+                await self.queue.join()
+                if self.retries.pending:
+                    await self.retries.wait_empty()
+                    continue
+                if self.verifier is None or not await self.verifier.drain():
+                    break
+            for _ in workers:
+                await self.queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await self.retries.close()
+            if self.verifier is not None:
+                await self.verifier.close()
+        log_info(
+            f"[pipeline] 완료. 열거: {self.stats['enumerated']}, 이어서 처리: {self.stats['resumed']}, "
+            f"skip: {self.stats['skipped']}, 성공: {self.stats['success']} (목록 삭제 {self.stats['listing']}, "
+            f"게시글별 전환 {self.stats['fallback']}), 검증: {self.stats['verified']} "
+            f"(판정 불가 {self.stats['undetermined']}), "
+            f"재시도: {self.stats['retried']}, 실패: {self.stats['fail']} (dead-letter {self.stats['dead_letter']}), "
+            f"브라우저 재시작 후 다시 넣은 글: {self.stats['recovered']}",
+            module='DeletePipeline'
+        )
+        self.cleaner.log_run_report(module='DeletePipeline')
+        return self.stats
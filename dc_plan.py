@@ -0,0 +1,147 @@
+# dc_plan.py
+# 열거(plan)와 삭제(execute)를 분리한다. plan 은 갤로그를 한 번만 열거해 삭제 계획(JSONL)을 쓰고,
+# execute 는 계획을 shard 단위로 나눠 여러 프로세스가 겹치지 않게 삭제한다.
+#   dcinside-post-cleaner plan --hours-ago 1 --plan dc_plan.jsonl
+#   dcinside-post-cleaner execute --plan dc_plan.jsonl --shard-count 4              # 4개 프로세스 실행
+#   dcinside-post-cleaner execute --plan dc_plan.jsonl --shard-index 0 --shard-count 4
+import json
+import os
+import subprocess
+import sys
+import zlib
+from datetime import datetime
+from typing import Iterator, Optional
+
+from dc_ledger import DONE_STATES
+from dc_logger import log_error, log_info
+from dc_post import PostRecord
+from dc_rate_limit import HostRateLimiter
+
+
+def shard_of(post: dict, shard_count: int) -> int:
+    # 프로세스마다 달라지는 hash() 대신 crc32 로 (갤러리, 글번호) -> shard 고정
+    key = f"{post.get('gallery_id')}:{post.get('no')}" if post.get('no') is not None else post['link']
+    return zlib.crc32(key.encode('utf-8')) % shard_count
+
+
+def plan_line(post: dict) -> str:
+    date = post.get('date')
+    return json.dumps({
+        'no': post.get('no'),
+        'gallery_id': post.get('gallery_id'),
+        'link': post['link'],
+        'date': date.isoformat() if isinstance(date, datetime) else date,
+        'title': post.get('title'),
+        'gallog_no': post.get('gallog_no'),
+    }, ensure_ascii=False)
+
+
+def check_shard(shard_index: int, shard_count: int):
+    # 범위를 벗어난 shard 는 아무 글도 고르지 않으므로 조용히 넘어가지 않고 바로 오류
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise ValueError(f"shard 지정이 잘못되었습니다: --shard-index {shard_index} --shard-count {shard_count}")
+
+
+def read_plan(path: str, shard_index: int = 0, shard_count: int = 1) -> Iterator[PostRecord]:
+    check_shard(shard_index, shard_count)
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            if shard_count > 1 and shard_of(data, shard_count) != shard_index:
+                continue
+            data['date'] = datetime.fromisoformat(data['date']) if data.get('date') else None
+            data['title'] = data.get('title') or ''
+            yield PostRecord.from_dict(data)
+
+
+async def write_plan(cleaner, path: str, hours_ago: float = 1.0, max_pages: Optional[int] = None) -> int:
+    # 갤로그 열거만 하고 삭제 대상(원장에서 이미 끝난 글 제외)을 JSONL 로 저장
+    count = 0
+    seen = set()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        async for post in cleaner.iter_gallog_posts(hours_ago, max_pages=max_pages):
+            if post['link'] in seen or cleaner.ledger.state(post) in DONE_STATES:
+                continue
+            seen.add(post['link'])
+            f.write(plan_line(post) + '\n')
+            count += 1
+    os.replace(tmp_path, path)
+    log_info(f"[plan] 삭제 계획 {count}건 저장: {path}")
+    return count
+
+
+async def run_plan(path: str, hours_ago: float, max_pages: Optional[int]) -> int:
+    from dc_cleaner import DCCleaner
+    cleaner = DCCleaner()
+    try:
+        await cleaner.init_browser()
+        await cleaner.login()
+        count = await write_plan(cleaner, path, hours_ago, max_pages)
+        print(f"[PLAN] 삭제 대상 {count}건을 {path} 에 저장했습니다.")
+        return count
+    finally:
+        await cleaner.close_resources()
+
+
+async def run_execute(path: str, shard_index: int = 0, shard_count: int = 1) -> dict:
+    from dc_cleaner import DCCleaner
+    from dc_pipeline import DeletePipeline
+    check_shard(shard_index, shard_count)
+    cleaner = DCCleaner()
+    try:
+        await cleaner.init_browser()
+        await cleaner.login()
+        # 계획 파일은 한 줄씩 읽어 bounded 큐로 흘려보낸다
+        log_info(f"[plan] shard {shard_index}/{shard_count} 실행: {path}")
+        stats = await DeletePipeline(cleaner, posts=read_plan(path, shard_index, shard_count)).run()
+        print(f"\n[RESULT] shard {shard_index}/{shard_count} - 총 {stats['success']}개의 게시물을 삭제했습니다. "
+              f"(실패: {stats['fail']})")
+        return stats
+    finally:
+        await cleaner.close_resources()
+
+
+def _shard_rate_limits(shard_count: int) -> dict:
+    # shard 프로세스마다 요청 제한 버킷이 따로 생기므로 호스트별 속도를 shard 수로 나눠 전체 속도를 유지
+    limiter = HostRateLimiter.from_env()
+    limits = ','.join(
+        f"{host}={rate / shard_count}:{max(1, burst // shard_count)}"
+        for host, (rate, burst) in limiter.host_limits.items()
+    )
+    return {
+        'DC_RATE_LIMIT': str(limiter.default_rate / shard_count),
+        'DC_RATE_BURST': str(max(1, limiter.default_burst // shard_count)),
+        'DC_RATE_LIMITS': limits,
+    }
+
+
+def _shard_env(shard_index: int, shard_count: int) -> dict:
+    # 메트릭 파일은 shard 마다 따로 쓴다 (같은 파일을 서로 덮어쓰지 않도록)
+    env = dict(os.environ)
+    for key, default in (('DC_METRICS_PROM', 'dc_metrics.prom'), ('DC_METRICS_JSON', 'dc_metrics.json')):
+        path = env.get(key, default)
+        if path:
+            root, ext = os.path.splitext(path)
+            env[key] = f"{root}.shard{shard_index}{ext}"
+    env.update(_shard_rate_limits(shard_count))
+    return env
+
+
+def spawn_executors(path: str, shard_count: int) -> int:
+    # shard 마다 execute 프로세스를 하나씩 띄우고 모두 끝날 때까지 기다린다 (하나라도 실패하면 1)
+    procs = []
+    for shard_index in range(shard_count):
+        cmd = [sys.executable, '-m', 'dc_daemon', 'execute', '--plan', path,
+               '--shard-index', str(shard_index), '--shard-count', str(shard_count)]
+        procs.append(subprocess.Popen(cmd, env=_shard_env(shard_index, shard_count)))
+    log_info(f"[plan] execute 프로세스 {shard_count}개 시작: {path}")
+    status = 0
+    for shard_index, proc in enumerate(procs):
+        if proc.wait() != 0:
+            log_error(f"[plan] shard {shard_index} 실패 (exit {proc.returncode})")
+            status = 1
+    return status
+
@@ -1,5 +1,229 @@
 # dc_post.py
-async def fetch_posts(page, hours_ago=1.0):
-    # 게시글 목록 파싱 로직 분리
-    # ...
-    return []
+# 갤로그 목록 파싱. 목록 전체를 한 번의 page.evaluate (또는 한 번의 HTML 파싱)로 추출한다.
+from datetime import datetime, timedelta
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+GALLOG_ITEM_SELECTOR = '.cont_listbox li, .list_box li'
+DATE_SELECTORS = ['.date', '.gall_date', 'time']
+TITLE_SELECTORS = ['.txt_box', '.subject', 'a']
+
+# 항목당 [date, title, href, data-no] 배열만 돌려받는다 (IPC 1회)
+GALLOG_ITEMS_JS = """
+([itemSelector, dateSelectors, titleSelectors]) => {
+    const pick = (li, sels) => {
+        for (const sel of sels) {
+            const el = li.querySelector(sel);
+            if (el) return el;
+        }
+        return null;
+    };
+    return Array.from(document.querySelectorAll(itemSelector)).map(li => {
+        const date = pick(li, dateSelectors);
+        const title = pick(li, titleSelectors);
+        const link = li.querySelector('a');
+        return [
+            date ? date.innerText.trim() : null,
+            title ? title.innerText.replace(/\s+/g, ' ').trim() : null,
+            link ? link.getAttribute('href') : null,
+            li.getAttribute('data-no'),
+        ];
+    });
+}
+"""
+
+
+class PostRecord:
+    # 게시글 한 건. 대량 삭제 시 메모리를 줄이려고 dict 대신 __slots__ 를 쓰고,
+    # 기존 코드가 쓰던 post['key'] / get / pop / in / setdefault 를 그대로 지원한다 (없는 필드 = 키 없음)
+    __slots__ = (
+        'title', 'link', 'date', 'gallery_id', 'no', 'gallog_no',
+        'fail_reason', 'blocked', 'captcha', 'strategy', '_retries', '_deleted_at', '_checks',
+    )
+    BASE_FIELDS = ('title', 'link', 'date', 'gallery_id', 'no', 'gallog_no')
+
+    def __init__(self, title=None, link=None, date=None, gallery_id=None, no=None, gallog_no=None):
+        self.title = title
+        self.link = link
+        self.date = date
+        self.gallery_id = gallery_id
+        self.no = no
+        self.gallog_no = gallog_no
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PostRecord':
+        return cls(**{key: data.get(key) for key in cls.BASE_FIELDS})
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key) -> bool:
+        return hasattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def pop(self, key, *default):
+        try:
+            value = getattr(self, key)
+        except AttributeError:
+            if default:
+                return default[0]
+            raise KeyError(key) from None
+        delattr(self, key)
+        return value
+
+    def setdefault(self, key, default=None):
+        if not hasattr(self, key):
+            self[key] = default
+        return getattr(self, key)
+
+    def to_dict(self) -> dict:
+        return {key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)}
+
+    def __repr__(self):
+        return f"PostRecord({self.to_dict()!r})"
+
+
+def parse_post_key(link: str) -> Tuple[Optional[str], Optional[int]]:
+    # https://gall.dcinside.com/board/view/?id=xxx&no=123 -> ('xxx', 123)
+    query = parse_qs(urlparse(link or '').query)
+    gallery_id = query.get('id', [None])[0]
+    no = query.get('no', [None])[0]
+    return gallery_id, int(no) if no and no.isdigit() else None
+
+
+def parse_gallog_date(date_str: str) -> Optional[datetime]:
+    date_str = (date_str or '').strip()
+    # 시간이 없는 경우 00:00 으로 설정
+    if len(date_str.split()) == 1:
+        date_str = f"{date_str} 00:00"
+    try:
+        return datetime.strptime(date_str, '%Y.%m.%d %H:%M')
+    except ValueError:
+        return None
+
+
+def parse_gallog_items(items, skip_links=None) -> List[PostRecord]:
+    # items: [date, title, href, data-no] 목록 -> 링크가 있는 모든 게시글 (날짜를 못 읽으면 date=None)
+    posts = []
+    for date_str, title, link, gallog_no in items:
+        if not link or (skip_links and link in skip_links):
+            continue
+        gallery_id, no = parse_post_key(link)
+        posts.append(PostRecord(
+            title=title,
+            link=link,
+            date=parse_gallog_date(date_str) if date_str is not None else None,
+            gallery_id=gallery_id,
+            no=no,
+            gallog_no=gallog_no,
+        ))
+    return posts
+
+
+def build_posts(items, hours_ago: float = 1.0, cutoff_time: Optional[datetime] = None) -> Tuple[List[PostRecord], List[str]]:
+    # items: [date, title, href, data-no] 목록 -> (cutoff 이전 게시글, 페이지의 전체 링크)
+    if cutoff_time is None:
+        cutoff_time = datetime.now() - timedelta(hours=hours_ago)
+    parsed = parse_gallog_items(items)
+    links = [post['link'] for post in parsed]
+    posts = [
+        post for post in parsed
+        if post['title'] is not None and post['date'] is not None and post['date'] <= cutoff_time
+    ]
+    return posts, links
+
+
+async def extract_gallog_items(page) -> list:
+    return await page.evaluate(GALLOG_ITEMS_JS, [GALLOG_ITEM_SELECTOR, DATE_SELECTORS, TITLE_SELECTORS])
+
+
+async def fetch_posts(page, hours_ago=1.0, cutoff_time: Optional[datetime] = None) -> Tuple[List[PostRecord], List[str]]:
+    # 현재 로드된 갤로그 목록 페이지에서 게시글 추출
+    items = await extract_gallog_items(page)
+    return build_posts(items, hours_ago, cutoff_time)
+
+
+class _GallogListParser(HTMLParser):
+    # GALLOG_ITEMS_JS 와 같은 규칙을 page.content() 문자열에 적용 (브라우저 없는 경로/벤치마크용)
+    VOID_TAGS = {'br', 'img', 'input', 'meta', 'link', 'hr', 'source', 'wbr', 'area', 'col', 'embed'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.items: List[list] = []
+        self._stack: List[str] = []
+        self._list_depth: Optional[int] = None
+        self._item: Optional[dict] = None
+        self._capture: List[Tuple[str, int, int, list]] = []
+
+    def _match(self, selectors, tag, classes) -> Optional[int]:
+        for rank, sel in enumerate(selectors):
+            if sel.startswith('.') and sel[1:] in classes or sel == tag:
+                return rank
+        return None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+        if tag in self.VOID_TAGS:
+            return
+        self._stack.append(tag)
+        depth = len(self._stack)
+        if self._list_depth is None:
+            if tag in ('ul', 'ol', 'div') and ('cont_listbox' in classes or 'list_box' in classes):
+                self._list_depth = depth
+            return
+        if tag == 'li' and self._item is None:
+            self._item = {'depth': depth, 'no': attrs.get('data-no'), 'href': None, 'date': None, 'title': None}
+            return
+        if self._item is None:
+            return
+        if tag == 'a' and self._item['href'] is None:
+            self._item['href'] = attrs.get('href')
+        for field, selectors in (('date', DATE_SELECTORS), ('title', TITLE_SELECTORS)):
+            rank = self._match(selectors, tag, classes)
+            current = self._item.get(field + '_rank')
+            if rank is not None and (current is None or rank < current):
+                self._item[field + '_rank'] = rank
+                self._capture.append((field, rank, depth, []))
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS or tag not in self._stack:
+            return
+        while self._stack:
+            depth = len(self._stack)
+            popped = self._stack.pop()
+            while self._capture and self._capture[-1][2] == depth:
+                field, rank, _, parts = self._capture.pop()
+                if rank == self._item[field + '_rank']:
+                    self._item[field] = ' '.join(''.join(parts).split())
+            if self._item is not None and depth == self._item['depth']:
+                item = self._item
+                self.items.append([item['date'], item['title'], item['href'], item['no']])
+                self._item = None
+            if self._list_depth is not None and depth == self._list_depth:
+                self._list_depth = None
+            if popped == tag:
+                break
+
+    def handle_data(self, data):
+        for _, _, _, parts in self._capture:
+            parts.append(data)
+
+
+def parse_gallog_html(html: str) -> list:
+    parser = _GallogListParser()
+    parser.feed(html)
+    parser.close()
+    return parser.items
@@ -0,0 +1,121 @@
+# dc_rate_limit.py
+# 호스트별 토큰 버킷: 모든 워커의 goto/reload/삭제 요청/검증 요청이 같은 버킷을 거쳐 나가도록 한다.
+# 순간적인 요청 폭주로 캡차가 뜨는 것을 막고, 대기 시간 통계로 지속 가능한 최대 속도를 찾는다.
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from dc_logger import log_info
+from dc_metrics import SAMPLE_WINDOW, percentile
+
+# 기본값: 호스트당 초당 2회, 순간 최대 4회
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 4
+DEFAULT_HOST_LIMITS = {
+    'gall.dcinside.com': (2.0, 4),
+    'gallog.dcinside.com': (1.0, 2),
+    'sign.dcinside.com': (0.5, 1),
+}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        # 토큰 하나를 예약하고 기다려야 할 시간을 반환.
+        # 토큰이 음수가 될 수 있어 먼저 예약한 요청이 먼저 나간다 (lock 불필요)
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+
+class HostRateLimiter:
+    def __init__(self, default_rate: float = DEFAULT_RATE, default_burst: int = DEFAULT_BURST,
+                 host_limits: Optional[Dict[str, Tuple[float, int]]] = None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = dict(DEFAULT_HOST_LIMITS if host_limits is None else host_limits)
+        self._buckets: Dict[str, TokenBucket] = {}
+        # 백분위용 최근 대기 시간만 보관하고, 요청 수/합계/최대는 누적 카운터로 (장시간 실행에도 메모리 일정)
+        self._waits: Dict[str, Deque[float]] = {}
+        self._totals: Dict[str, list] = {}  # host -> [requests, throttled, total_wait, max_wait]
+
+    @classmethod
+    def from_env(cls) -> 'HostRateLimiter':
+        # DC_RATE_LIMITS=gall.dcinside.com=3:6,gallog.dcinside.com=1:2 (초당 횟수:버스트)
+        host_limits = dict(DEFAULT_HOST_LIMITS)
+        for item in os.getenv('DC_RATE_LIMITS', '').split(','):
+            if '=' not in item:
+                continue
+            host, spec = item.split('=', 1)
+            rate, _, burst = spec.partition(':')
+            host_limits[host.strip()] = (float(rate), int(burst or DEFAULT_BURST))
+        return cls(
+            default_rate=float(os.getenv('DC_RATE_LIMIT', str(DEFAULT_RATE))),
+            default_burst=int(os.getenv('DC_RATE_BURST', str(DEFAULT_BURST))),
+            host_limits=host_limits,
+        )
+
+    def _bucket(self, host: str) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self.host_limits.get(host, (self.default_rate, self.default_burst))
+            if rate <= 0:
+                return None  # 0 이하면 제한 없음
+            bucket = self._buckets[host] = TokenBucket(rate, burst)
+        return bucket
+
+    async def acquire(self, url: str) -> float:
+        # url 의 호스트 버킷에서 토큰을 얻을 때까지 대기하고 대기 시간을 반환
+        host = urlparse(url).hostname or ''
+        if not host:
+            return 0.0  # about:blank, data: 등
+        bucket = self._bucket(host)
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve()
+        self._waits.setdefault(host, deque(maxlen=SAMPLE_WINDOW)).append(wait)
+        totals = self._totals.setdefault(host, [0, 0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += wait > 0
+        totals[2] += wait
+        totals[3] = max(totals[3], wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, dict]:
+        result = {}
+        for host, waits in self._waits.items():
+            requests, throttled, total_wait, max_wait = self._totals[host]
+            result[host] = {
+                'requests': requests,
+                'throttled': throttled,
+                'total_wait': total_wait,
+                'p50_wait': percentile(waits, 50),
+                'p95_wait': percentile(waits, 95),
+                'max_wait': max_wait,
+            }
+        return result
+
+    def summary(self) -> str:
+        lines = [f"{'host':<24} {'req':>5} {'throttled':>9} {'total(s)':>9} {'p50(s)':>7} {'p95(s)':>7} {'max(s)':>7}"]
+        for host, s in sorted(self.stats().items()):
+            lines.append(
+                f"{host:<24} {s['requests']:>5} {s['throttled']:>9} {s['total_wait']:>9.2f} "
+                f"{s['p50_wait']:>7.2f} {s['p95_wait']:>7.2f} {s['max_wait']:>7.2f}"
+            )
+        return '\n'.join(lines)
+
+    def log_limits(self):
+        limits = ', '.join(f"{host} {rate}/s (burst {burst})" for host, (rate, burst) in self.host_limits.items())
+        log_info(f"[rate_limit] 호스트별 요청 제한: {limits}, 기타 {self.default_rate}/s (burst {self.default_burst})")
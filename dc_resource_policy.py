@@ -0,0 +1,84 @@
+# dc_resource_policy.py
+# BrowserContext 요청 가로채기: 이미지/동영상/폰트와 외부(광고/분석) 호스트 요청을 차단하고 절감량을 집계한다.
+from collections import Counter
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+from dc_logger import log_info
+
+DEFAULT_BLOCKED_TYPES = ('image', 'media', 'font')
+# 이 도메인(및 하위 도메인)만 1st-party 로 허용
+DEFAULT_ALLOWED_DOMAINS = ('dcinside.com', 'dcinside.co.kr')
+# 1st-party 도메인이라도 광고/통계 서버는 차단
+DEFAULT_BLOCKED_HOSTS = ('addc.dcinside.com', 'ad.dcinside.com', 'log.dcinside.com')
+# 캡차 이미지 등 수동 대응에 필요한 요청은 항상 허용
+ALWAYS_ALLOW_MARKERS = ('captcha',)
+# 차단한 요청의 대략적인 크기(바이트). 실제로 받지 않으므로 추정치로 집계한다
+ESTIMATED_BYTES = {
+    'image': 60000,
+    'media': 500000,
+    'font': 40000,
+    'script': 30000,
+    'stylesheet': 15000,
+    'xhr': 3000,
+    'fetch': 3000,
+    'document': 50000,
+}
+
+
+def _host_matches(host: str, domains: Iterable[str]) -> bool:
+    return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+
+class ResourcePolicy:
+    def __init__(self, blocked_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+                 allowed_domains: Iterable[str] = DEFAULT_ALLOWED_DOMAINS,
+                 blocked_hosts: Iterable[str] = DEFAULT_BLOCKED_HOSTS,
+                 extra_allowed: Optional[Iterable[str]] = None):
+        self.blocked_types = set(blocked_types)
+        self.allowed_domains = tuple(allowed_domains) + tuple(extra_allowed or ())
+        self.blocked_hosts = tuple(blocked_hosts)
+        self.allowed = 0
+        self.blocked = Counter()
+        self.blocked_hosts_seen = Counter()
+
+    def should_block(self, url: str, resource_type: str, main_frame: bool = False) -> bool:
+        if any(marker in url for marker in ALWAYS_ALLOW_MARKERS):
+            return False
+        host = urlparse(url).hostname or ''
+        if not host:
+            return False  # data:, about:blank 등
+        if _host_matches(host, self.allowed_domains) and not _host_matches(host, self.blocked_hosts):
+            return resource_type in self.blocked_types
+        # 외부 호스트는 최상위 문서 이동만 허용 (YouTube/Naver/Kakao 임베드 iframe 은 차단)
+        return not main_frame
+
+    async def _handle(self, route, request):
+        try:
+            main_frame = request.is_navigation_request() and request.frame.parent_frame is None
+        except Exception:
+            main_frame = False
+        if self.should_block(request.url, request.resource_type, main_frame):
+            self.blocked[request.resource_type] += 1
+            self.blocked_hosts_seen[urlparse(request.url).hostname or ''] += 1
+            await route.abort('blockedbyclient')
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    async def install(self, context):
+        await context.route('**/*', self._handle)
+        log_info(f"[resource_policy] 요청 차단 정책 적용: types={sorted(self.blocked_types)}, allow={list(self.allowed_domains)}")
+
+    def estimated_bytes_saved(self) -> int:
+        return sum(ESTIMATED_BYTES.get(kind, 10000) * count for kind, count in self.blocked.items())
+
+    def summary(self) -> str:
+        total_blocked = sum(self.blocked.values())
+        by_type = ', '.join(f"{kind} {count}" for kind, count in self.blocked.most_common())
+        top_hosts = ', '.join(f"{host} {count}" for host, count in self.blocked_hosts_seen.most_common(5))
+        return (
+            f"차단 {total_blocked}건 / 허용 {self.allowed}건, "
+            f"절감 추정 {self.estimated_bytes_saved() / 1024 / 1024:.1f} MB "
+            f"(유형: {by_type or '-'}; 상위 호스트: {top_hosts or '-'})"
+        )
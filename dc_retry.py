@@ -0,0 +1,139 @@
+# dc_retry.py
+# 실패한 글을 작업자 밖의 지연 재시도 큐(heap)에 넣고, 실패 사유별 정책(최대 횟수, 지수 backoff + jitter)으로 다시 삭제 큐에 넣는다.
+# 재시도를 다 쓴 글과 영구 실패 글은 dead-letter 파일(JSONL)에 남긴다.
+import asyncio
+import heapq
+import itertools
+import json
+import os
+import random
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from dc_delete_strategy import DEFAULT_POLICY, RETRY_POLICIES
+from dc_ledger import post_key
+from dc_logger import log_error, log_info
+
+
+class RetryScheduler:
+    def __init__(self, dead_letter_path: Optional[str] = 'dc_dead_letter.jsonl', max_delay: float = 300.0,
+                 jitter: float = 0.5, policies: Optional[Dict[str, Tuple[int, float]]] = None):
+        self.dead_letter_path = dead_letter_path
+        self.max_delay = max_delay
+        self.jitter = jitter  # 대기 시간에 곱할 랜덤 폭 (0.5 -> 0.5~1.5배)
+        self.policies = dict(RETRY_POLICIES, **(policies or {}))
+        self.heap: List[Tuple[float, int, dict]] = []
+        self._seq = itertools.count()
+        self._changed: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._releasing = 0  # heap 에서 꺼내 큐에 넣는 중인 글 수
+        self.stats = {'scheduled': 0, 'released': 0, 'dead_letter': 0}
+
+    @classmethod
+    def from_env(cls) -> 'RetryScheduler':
+        return cls(
+            dead_letter_path=os.getenv('DC_DEAD_LETTER_PATH', 'dc_dead_letter.jsonl') or None,
+            max_delay=float(os.getenv('DC_RETRY_MAX_DELAY', '300')),
+        )
+
+    def _event(self) -> asyncio.Event:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        return self._changed
+
+    @property
+    def pending(self) -> int:
+        return len(self.heap) + self._releasing
+
+    def delay(self, reason: Optional[str], retry: int) -> float:
+        _, base = self.policies.get(reason, DEFAULT_POLICY)
+        delay = min(self.max_delay, base * 2 ** (retry - 1))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def schedule(self, post: dict, reason: Optional[str]) -> bool:
+        # 재시도 예약 시 True. 정책상 더 재시도하지 않으면 dead-letter 에 남기고 False
+        max_retries, _ = self.policies.get(reason, DEFAULT_POLICY)
+        retry = post.get('_retries', 0) + 1
+        if retry > max_retries:
+            self.dead_letter(post, reason)
+            return False
+        post['_retries'] = retry
+        delay = self.delay(reason, retry)
+        heapq.heappush(self.heap, (time.monotonic() + delay, next(self._seq), post))
+        self.stats['scheduled'] += 1
+        self._event().set()
+        log_info(f"[retry] {delay:.1f}s 후 재시도 ({retry}/{max_retries}, 사유: {reason}): {post.get('link', '')}")
+        return True
+
+    def requeue(self, post: dict):
+        # 브라우저 재시작처럼 글과 무관한 실패: 재시도 횟수를 쓰지 않고 바로 다시 삭제 큐로
+        heapq.heappush(self.heap, (time.monotonic(), next(self._seq), post))
+        self._event().set()
+
+    def dead_letter(self, post: dict, reason: Optional[str]):
+        self.stats['dead_letter'] += 1
+        if not self.dead_letter_path:
+            return
+        date = post.get('date')
+        # 갤로그 글은 링크만 있는 경우가 많아 원장과 같은 방식으로 (갤러리, 글번호)를 뽑는다
+        gallery_id, no = post_key(post)
+        record = {
+            'link': post.get('link'),
+            'gallery_id': gallery_id,
+            'no': no,
+            'title': post.get('title'),
+            'date': date.isoformat() if isinstance(date, datetime) else date,
+            'gallog_no': post.get('gallog_no'),
+            'reason': reason,
+            'retries': post.get('_retries', 0),
+            'at': time.time(),
+        }
+        try:
+            with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except Exception as e:
+            log_error(f"[retry] dead-letter 기록 실패: {e}")
+        log_info(f"[retry] 재시도 포기 -> dead-letter (사유: {reason}): {post.get('link', '')}")
+
+    async def _release(self, queue: asyncio.Queue):
+        # 대기 시간이 지난 글부터 삭제 큐에 넣는다 (작업자는 재시도 대기로 막히지 않음)
+        event = self._event()
+        while True:
+            if not self.heap:
+                event.clear()
+                await event.wait()
+                continue
+            wait = self.heap[0][0] - time.monotonic()
+            if wait > 0:
+                event.clear()
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            _, _, post = heapq.heappop(self.heap)
+            self._releasing += 1
+            try:
+                await queue.put(post)
+            finally:
+                self._releasing -= 1
+            self.stats['released'] += 1
+
+    def start(self, queue: asyncio.Queue):
+        self._task = asyncio.ensure_future(self._release(queue))
+
+    async def wait_empty(self):
+        # 예약된 재시도가 모두 삭제 큐로 넘어갈 때까지 대기
+        while self.pending:
+            due = self.heap[0][0] - time.monotonic() if self.heap else 0.0
+            await asyncio.sleep(min(1.0, max(0.05, due)))
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,109 @@
+# dc_selectors.py
+# 후보 셀렉터 여러 개를 page.evaluate 한 번으로 확인하고, 페이지 종류별로 맞았던 셀렉터를 기억해 다음에 먼저 시도한다.
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+DELETE_BUTTON_SELECTORS = [
+    'button.btn_grey.cancle',
+    "button:has-text('삭제')",
+    "input[type=button][value=삭제]"
+]
+CONFIRM_BUTTON_SELECTORS = [
+    "button.btn_blue.btn_svc[type=submit]:has-text('삭제')",
+    "input[type=submit][value=삭제]",
+    "button:has-text('삭제')"
+]
+VIDEO_SELECTORS = [
+    'iframe[src*="youtube"]',
+    'iframe[src*="naver"]',
+    'iframe[src*="kakao"]',
+    'video',
+    '.video_area',
+    '.ytp-player'
+]
+
+# Playwright 전용 :has-text('...') 는 기본 셀렉터 + textContent 포함 여부로 흉내 낸다
+FIND_JS = """
+    const find = (sel) => {
+        const m = sel.match(/^(.*):has-text\\((['"])(.*)\\2\\)$/);
+        try {
+            if (!m) return document.querySelector(sel);
+            const text = m[3].toLowerCase();
+            return Array.from(document.querySelectorAll(m[1] || '*'))
+                .find(el => (el.textContent || '').toLowerCase().includes(text)) || null;
+        } catch (e) {
+            return null;
+        }
+    };
+"""
+# {kind: [selector, ...]} -> {kind: 처음 맞은 후보의 index (-1 = 없음)}
+RESOLVE_JS = """
+(groups) => {""" + FIND_JS + """    const result = {};
+    for (const [kind, selectors] of Object.entries(groups)) {
+        result[kind] = selectors.findIndex(sel => find(sel) !== null);
+    }
+    return result;
+}
+"""
+# [selector, ...] -> [처음 맞은 후보의 index, 요소] (없으면 [-1, null]). 확인한 요소를 그대로 핸들로 돌려받는다
+QUERY_JS = """
+(selectors) => {""" + FIND_JS + """    for (let i = 0; i < selectors.length; i++) {
+        const el = find(selectors[i]);
+        if (el) return [i, el];
+    }
+    return [-1, null];
+}
+"""
+
+
+def page_type(url: str) -> str:
+    # /mgallery/board/view/?id=..&no=.. -> /mgallery/board/view (갤러리 종류 + 페이지 종류)
+    return urlparse(url or '').path.rstrip('/') or '/'
+
+
+class SelectorResolver:
+    def __init__(self):
+        self.learned: Dict[Tuple[str, str], str] = {}
+        self.stats = {'evaluations': 0, 'learned_hits': 0, 'learned_misses': 0, 'not_found': 0}
+
+    def ordered(self, ptype: str, kind: str, candidates: List[str]) -> List[str]:
+        # 이 페이지 종류에서 맞았던 셀렉터를 맨 앞으로
+        winner = self.learned.get((ptype, kind))
+        if winner in candidates:
+            return [winner] + [sel for sel in candidates if sel != winner]
+        return list(candidates)
+
+    def _learn(self, ptype: str, kind: str, selectors: List[str], index: int) -> Optional[str]:
+        # 맞은 후보를 기억 (index < 0 이면 None)
+        if index < 0:
+            self.stats['not_found'] += 1
+            return None
+        key = (ptype, kind)
+        if key in self.learned:
+            self.stats['learned_hits' if index == 0 else 'learned_misses'] += 1
+        self.learned[key] = selectors[index]
+        return selectors[index]
+
+    async def resolve(self, page, groups: Dict[str, List[str]]) -> Dict[str, Optional[str]]:
+        # 모든 그룹을 evaluate 한 번으로 확인해 {kind: 맞은 셀렉터 또는 None} 반환
+        ptype = page_type(page.url)
+        ordered = {kind: self.ordered(ptype, kind, candidates) for kind, candidates in groups.items()}
+        indexes = await page.evaluate(RESOLVE_JS, ordered)
+        self.stats['evaluations'] += 1
+        return {kind: self._learn(ptype, kind, selectors, indexes.get(kind, -1)) for kind, selectors in ordered.items()}
+
+    async def query(self, page, kind: str, candidates: List[str]):
+        # (요소 핸들, 셀렉터). 후보 확인과 요소 조회를 evaluate_handle 한 번으로 해서
+        # 확인한 요소를 그대로 돌려준다 (다시 query_selector 하면 :has-text 해석 차이로 다른 요소를 잡을 수 있음)
+        ptype = page_type(page.url)
+        selectors = self.ordered(ptype, kind, candidates)
+        handle = await page.evaluate_handle(QUERY_JS, selectors)
+        self.stats['evaluations'] += 1
+        properties = await handle.get_properties()
+        element = properties['1'].as_element()
+        selector = self._learn(ptype, kind, selectors, await properties['0'].json_value() if element else -1)
+        return element, selector
+
+    def summary(self) -> str:
+        learned = ', '.join(f"{ptype} {kind}={sel}" for (ptype, kind), sel in sorted(self.learned.items()))
+        return f"{self.stats} | 학습: {learned or '-'}"
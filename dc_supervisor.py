@@ -0,0 +1,163 @@
+# dc_supervisor.py
+# 브라우저/컨텍스트/메인 Page 가 죽으면 init_browser 로 다시 띄우고 저장된 세션(storage state)으로 로그인 없이 복구한다.
+# 재시작할 때마다 generation 을 올려, 작업자는 삭제 시작 시점의 generation 과 비교해 진행 중이던 글을
+# 실패로 세지 않고 다시 큐에 넣는다.
+import asyncio
+import os
+from typing import Optional
+
+from dc_logger import log_error, log_info
+
+
+class BrowserSupervisor:
+    def __init__(self, cleaner, max_restarts: int = 5, restart_delay: float = 5.0, snapshot_interval: float = 300.0):
+        self.cleaner = cleaner
+        self.max_restarts = max_restarts
+        self.restart_delay = restart_delay  # n 번째 재시작 전 restart_delay * n 초 대기
+        self.snapshot_interval = snapshot_interval  # 세션 저장 주기 (재시작 시 최신 쿠키로 복원)
+        self.generation = 0
+        self.restarts = 0
+        self.closing = False
+        self._lost: Optional[str] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {'restarts': 0, 'page_restarts': 0, 'requeued': 0, 'snapshots': 0}
+
+    @classmethod
+    def from_env(cls, cleaner) -> 'BrowserSupervisor':
+        return cls(
+            cleaner,
+            max_restarts=int(os.getenv('DC_MAX_RESTARTS', '5')),
+            restart_delay=float(os.getenv('DC_RESTART_DELAY', '5')),
+            snapshot_interval=float(os.getenv('DC_SESSION_SNAPSHOT', '300')),
+        )
+
+    def _mutex(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _on_lost(self, what: str, target):
+        # 재시작/종료로 이미 교체된 객체의 이벤트는 무시
+        if self.closing or target not in (self.cleaner.browser, self.cleaner.context, self.cleaner.page):
+            return
+        if self._lost is None:
+            self._lost = what
+            log_error(f"[supervisor] {what} 종료 감지")
+
+    def attach(self):
+        # init_browser 직후 호출: 새 브라우저/컨텍스트/메인 Page 에 종료 감지 핸들러 등록
+        cleaner = self.cleaner
+        self._lost = None
+        self.closing = False
+        cleaner.browser.on('disconnected', lambda browser: self._on_lost('browser', browser))
+        cleaner.context.on('close', lambda context: self._on_lost('context', context))
+        page = cleaner.page
+        page.on('close', lambda _: self._on_lost('page', page))
+        page.on('crash', lambda _: self._on_lost('page', page))
+        if self._task is None and self.snapshot_interval > 0:
+            self._task = asyncio.ensure_future(self._snapshot_loop())
+
+    @property
+    def lost(self) -> Optional[str]:
+        # 죽은 대상 ('browser' | 'context' | 'page'), 살아 있으면 None
+        cleaner = self.cleaner
+        if self.closing:
+            return None
+        if cleaner.browser is None:
+            return self._lost  # 재시작 실패로 브라우저가 없는 상태면 'browser'
+        if self._lost is None and not cleaner.browser.is_connected():
+            self._lost = 'browser'
+        if self._lost is None and cleaner.page is not None and cleaner.page.is_closed():
+            self._lost = 'page'
+        return self._lost
+
+    async def recover(self, generation: int) -> bool:
+        # generation 이후 브라우저를 다시 띄웠으면 True (다른 작업자가 이미 복구한 경우 포함).
+        # 죽은 것이 없거나 재시작 한도를 넘으면 False -> 호출 측은 평소처럼 실패 처리
+        async with self._mutex():
+            if self.generation != generation:
+                return True
+            what = self.lost
+            if what is None:
+                return False
+            if what == 'page' and await self._restart_page():
+                return True
+            if self.restarts >= self.max_restarts:
+                log_error(f"[supervisor] 재시작 한도({self.max_restarts}회) 초과, 복구하지 않음")
+                return False
+            self.restarts += 1
+            await asyncio.sleep(self.restart_delay * self.restarts)
+            log_info(f"[supervisor] {self._lost} 종료 -> 브라우저 재시작 ({self.restarts}/{self.max_restarts})")
+            await self._teardown()
+            try:
+                await self.cleaner.init_browser()
+                await self.cleaner.login()
+            except Exception as e:
+                log_error(f"[supervisor] 브라우저 재시작 실패: {type(e).__name__}: {e}")
+                self._lost = 'browser'
+                return False
+            self.generation += 1
+            self.stats['restarts'] += 1
+            log_info("[supervisor] 브라우저 재시작 완료 (세션 복원), 진행 중이던 글은 다시 큐로")
+            return True
+
+    async def _restart_page(self) -> bool:
+        # 메인 Page 만 닫힌 경우: 브라우저는 두고 Page 만 새로
+        cleaner = self.cleaner
+        try:
+            cleaner.page = await cleaner.context.new_page()
+        except Exception as e:
+            log_error(f"[supervisor] 메인 Page 재생성 실패 -> 브라우저 재시작: {e}")
+            self._lost = 'context'
+            return False
+        page = cleaner.page
+        page.on('close', lambda _: self._on_lost('page', page))
+        page.on('crash', lambda _: self._on_lost('page', page))
+        self._lost = None
+        self.generation += 1
+        self.stats['page_restarts'] += 1
+        log_info("[supervisor] 메인 Page 재생성 완료")
+        return True
+
+    async def _teardown(self):
+        # 죽은 브라우저의 남은 자원 정리 (이미 닫혔으면 예외 무시)
+        cleaner = self.cleaner
+        self.closing = True
+        try:
+            if cleaner.page_pool:
+                await cleaner.page_pool.close()
+            for close in (cleaner.context.close if cleaner.context else None,
+                          cleaner.browser.close if cleaner.browser else None,
+                          cleaner.playwright.stop if cleaner.playwright else None):
+                if close is None:
+                    continue
+                try:
+                    await close()
+                except Exception:
+                    pass
+        finally:
+            cleaner.page_pool = None
+            cleaner.page = None
+            cleaner.context = None
+            cleaner.browser = None
+            cleaner.playwright = None
+            self.closing = False
+
+    async def _snapshot_loop(self):
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            if self.lost is not None:
+                continue
+            try:
+                await self.cleaner.save_cookies()
+                self.stats['snapshots'] += 1
+            except Exception as e:
+                log_error(f"[supervisor] 세션 저장 실패: {e}")
+
+    async def close(self):
+        # close_resources 가 정상 종료로 닫는 것은 종료 감지에서 제외
+        self.closing = True
+        if self._task:
+            self._task.cancel()
+            self._task = None
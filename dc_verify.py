@@ -0,0 +1,151 @@
+# dc_verify.py
+# 삭제된 글의 실제 삭제 여부를 삭제 워커와 분리된 단계에서 모아서 검증한다.
+# 게시글 URL 에 가벼운 GET(리다이렉트 미추적, 본문 앞부분만 읽기)을 보내 상태 코드/문구로 판정.
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from dc_delete_strategy import DELETE_SUCCESS_PATTERNS
+from dc_http_engine import DEFAULT_HEADERS, DESKTOP_USER_AGENT
+from dc_logger import log_error, log_info
+from dc_metrics import StageTimer
+from dc_rate_limit import HostRateLimiter
+
+# 본문이 아직 남아 있음을 뜻하는 마크업
+VIEW_CONTENT_MARKERS = ['write_div', 'gallview', 'btn_grey cancle']
+
+
+class DeletionVerifier:
+    def __init__(self, on_confirmed: Callable[[dict], None],
+                 on_unconfirmed: Callable[[dict], Awaitable[None]],
+                 concurrency: int = 4, batch_size: int = 20, delay: float = 3.0,
+                 prefix_bytes: int = 65536, max_checks: int = 3,
+                 rate_limiter: Optional[HostRateLimiter] = None, stage_timer: Optional[StageTimer] = None,
+                 on_undetermined: Optional[Callable[[dict], None]] = None):
+        self.on_confirmed = on_confirmed
+        self.on_unconfirmed = on_unconfirmed
+        self.on_undetermined = on_undetermined  # max_checks 까지 판정 불가인 글 (삭제 큐로 되돌리지 않음)
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.delay = delay  # 삭제 후 서버 반영을 기다렸다가 검증할 최소 시간
+        self.prefix_bytes = prefix_bytes
+        self.max_checks = max_checks
+        self.rate_limiter = rate_limiter
+        self.stage_timer = stage_timer
+        self.pending: List[dict] = []
+        self.session = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._lock = asyncio.Lock()  # 주기 검증과 drain 이 같은 글을 동시에 다루지 않도록
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {'confirmed': 0, 'unconfirmed': 0, 'unknown': 0, 'undetermined': 0}
+
+    async def start(self):
+        import aiohttp
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=30)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': DESKTOP_USER_AGENT, **DEFAULT_HEADERS},
+            timeout=aiohttp.ClientTimeout(total=20),
+        )
+        self._task = asyncio.ensure_future(self._loop())
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def submit(self, post: dict):
+        post['_deleted_at'] = time.monotonic()
+        post['_checks'] = 0
+        self.pending.append(post)
+
+    async def verify_one(self, post: dict) -> Optional[bool]:
+        # True: 삭제 확인, False: 본문이 남아 있음, None: 판정 불가
+        started = time.perf_counter()
+        try:
+            return await self._verify_one(post)
+        finally:
+            if self.stage_timer:
+                self.stage_timer.record('verify', time.perf_counter() - started)
+
+    async def _verify_one(self, post: dict) -> Optional[bool]:
+        async with self._semaphore:
+            try:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire(post['link'])
+                async with self.session.get(post['link'], allow_redirects=False) as resp:
+                    if resp.status in (404, 410):
+                        return True
+                    if 300 <= resp.status < 400:
+                        location = resp.headers.get('Location', '')
+                        deleted = any(mark in location for mark in ('/error/', 'delete', '/board/lists'))
+                        return True if deleted else None
+                    prefix = (await resp.content.read(self.prefix_bytes)).decode('utf-8', errors='replace')
+            except Exception as e:
+                log_error(f"[verify] 검증 요청 예외: {post['link']} | {type(e).__name__}: {e}")
+                return None
+        # 본문 마크업이 있으면 사이드바/댓글/공지에 삭제 문구가 섞여 있어도 살아 있는 글
+        if any(marker in prefix for marker in VIEW_CONTENT_MARKERS):
+            return False
+        if any(p in prefix for p in DELETE_SUCCESS_PATTERNS):
+            return True
+        return None
+
+    async def flush(self, wait_due: bool = False) -> int:
+        # 검증 시점이 된 글들을 배치로 검증. 삭제 큐로 되돌린 글 수를 반환
+        async with self._lock:
+            return await self._flush(wait_due)
+
+    async def _flush(self, wait_due: bool) -> int:
+        if wait_due and self.pending:
+            oldest = min(post['_deleted_at'] for post in self.pending)
+            await asyncio.sleep(max(0.0, oldest + self.delay - time.monotonic()))
+        now = time.monotonic()
+        due = [post for post in self.pending if now - post['_deleted_at'] >= self.delay]
+        if not due:
+            return 0
+        self.pending = [post for post in self.pending if now - post['_deleted_at'] < self.delay]
+        requeued = 0
+        for i in range(0, len(due), self.batch_size):
+            batch = due[i:i + self.batch_size]
+            results = await asyncio.gather(*(self.verify_one(post) for post in batch))
+            for post, result in zip(batch, results):
+                post['_checks'] += 1
+                if result is True:
+                    self.stats['confirmed'] += 1
+                    self.on_confirmed(post)
+                elif result is None and post['_checks'] < self.max_checks:
+                    # 판정 불가는 잠시 뒤 다시 확인
+                    self.stats['unknown'] += 1
+                    post['_deleted_at'] = time.monotonic()
+                    self.pending.append(post)
+                elif result is None:
+                    # 끝까지 판정 불가: 본문이 남아 있다는 근거가 없으므로 삭제 시도를 다시 쓰지 않는다
+                    self.stats['undetermined'] += 1
+                    if self.on_undetermined is not None:
+                        self.on_undetermined(post)
+                else:
+                    self.stats['unconfirmed'] += 1
+                    requeued += 1
+                    await self.on_unconfirmed(post)
+        log_info(f"[verify] 배치 검증 {len(due)}건: 확인 {self.stats['confirmed']}, 미확인 {self.stats['unconfirmed']}, "
+                 f"판정 불가 {self.stats['undetermined']} (누적)")
+        return requeued
+
+    async def drain(self) -> int:
+        # 남은 글을 모두 검증 (판정 불가 재확인 포함)
+        requeued = 0
+        while self.pending:
+            requeued += await self.flush(wait_due=True)
+        return requeued
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.delay)
+            try:
+                await self.flush()
+            except Exception as e:
+                log_error(f"[verify] 배치 검증 예외: {e}")
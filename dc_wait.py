@@ -0,0 +1,92 @@
+# dc_wait.py
+# 고정 sleep 대신 실제 신호(응답/URL 이동/문구 표시)가 오는 즉시 끝나는 대기. 모든 대기는 timeout 을 가진다.
+import asyncio
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+TEXT_PRESENT_JS = """
+(phrases) => {
+    const text = document.body ? document.body.innerText : '';
+    for (const phrase of phrases) {
+        if (text.includes(phrase)) return phrase;
+    }
+    return null;
+}
+"""
+
+
+# 문서 이동으로 대기 중이던 execution context 가 사라졌을 때의 오류 문구 (새 문서에서 다시 대기)
+NAVIGATION_ERROR_MARKERS = (
+    'Execution context was destroyed',
+    'Cannot find context with specified id',
+    'because of a navigation',
+)
+
+
+def _is_timeout(exc: BaseException) -> bool:
+    return isinstance(exc, asyncio.TimeoutError) or type(exc).__name__ == 'TimeoutError'
+
+
+def _is_navigation_error(exc: BaseException) -> bool:
+    message = str(exc)
+    return any(marker in message for marker in NAVIGATION_ERROR_MARKERS)
+
+
+async def wait_for_text(page, phrases: List[str], timeout: float = 5000) -> Optional[str]:
+    # 문구 중 하나가 본문에 나타나면 그 문구를 반환, timeout 이면 None
+    deadline = time.monotonic() + timeout / 1000
+    while True:
+        remaining = (deadline - time.monotonic()) * 1000
+        if remaining <= 0:
+            return None
+        try:
+            handle = await page.wait_for_function(TEXT_PRESENT_JS, arg=phrases, timeout=remaining)
+            return await handle.json_value()
+        except Exception as e:
+            if _is_timeout(e):
+                return None
+            if not _is_navigation_error(e):
+                raise  # 페이지 종료(TargetClosed) 등은 호출 측에서 처리
+            # 이동 중 execution context 가 바뀌면 새 문서에서 다시 대기
+            await asyncio.sleep(0.05)
+
+
+async def wait_first(page, timeout: float = 10000,
+                     response: Optional[Callable[[Any], bool]] = None,
+                     url: Optional[Callable[[str], bool]] = None,
+                     text: Optional[List[str]] = None) -> Tuple[Optional[str], Any]:
+    # 지정한 신호 중 가장 먼저 온 것을 (종류, 값) 으로 반환. 모두 timeout 이면 (None, None)
+    tasks = {}
+    if response is not None:
+        tasks[asyncio.ensure_future(page.wait_for_event('response', predicate=response, timeout=timeout))] = 'response'
+    if url is not None:
+        tasks[asyncio.ensure_future(page.wait_for_url(url, wait_until='commit', timeout=timeout))] = 'url'
+    if text is not None:
+        tasks[asyncio.ensure_future(wait_for_text(page, text, timeout=timeout))] = 'text'
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.cancelled() or task.exception() is not None:
+                    continue
+                kind = tasks[task]
+                value = task.result()
+                if kind == 'text' and value is None:
+                    continue
+                if kind == 'url':
+                    value = page.url
+                return kind, value
+        return None, None
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def start_waiting(page, **kwargs) -> 'asyncio.Future':
+    # 클릭 "전에" 대기를 걸어 두기 위한 헬퍼: waiter = await start_waiting(...); await click(); await waiter
+    waiter = asyncio.ensure_future(wait_first(page, **kwargs))
+    # wait_first 와 하위 대기 태스크가 리스너를 등록할 때까지 이벤트 루프를 몇 번 양보
+    for _ in range(3):
+        await asyncio.sleep(0)
+    return waiter
@@ -1,5 +1,4 @@
-from dc_cleaner import main
+from dc_daemon import cli
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    cli()
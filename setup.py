@@ -9,16 +9,20 @@ setup(
     url='https://github.com/yourname/dcinside-post-cleaner',
     packages=find_packages(),
     py_modules=[
-        'dc_cleaner', 'dc_auth', 'dc_cookie', 'dc_post', 'dc_logger', 'dc_delete_strategy'
+        'dc_cleaner', 'dc_auth', 'dc_cookie', 'dc_post', 'dc_logger', 'dc_delete_strategy',
+        'dc_http_engine', 'dc_pipeline', 'dc_ledger', 'dc_wait', 'dc_metrics',
+        'dc_verify', 'dc_resource_policy', 'dc_page_pool', 'dc_concurrency', 'dc_rate_limit', 'dc_diagnostics', 'dc_challenge', 'dc_daemon',
+        'dc_selectors', 'dc_plan', 'dc_retry', 'dc_memory', 'dc_supervisor'
     ],
     install_requires=[
         'playwright==1.40.0',
         'python-dotenv==1.0.0',
+        'aiohttp>=3.8',
     ],
     python_requires='>=3.8',
     entry_points={
         'console_scripts': [
-            'dcinside-post-cleaner=dc_cleaner:main',
+            'dcinside-post-cleaner=dc_daemon:cli',
         ],
     },
     include_package_data=True,
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+# 테스트 중에는 콘솔 출력 없이 동기 기록 (로그 파일은 아래에서 임시 경로로 바꾼다)
+os.environ.setdefault('DC_LOG_CONSOLE', '0')
+os.environ.setdefault('DC_LOG_ASYNC', '0')
+
+import dc_logger  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _log_file(tmp_path_factory):
+    dc_logger.LOG_FILE = str(tmp_path_factory.mktemp('logs') / 'error_log.txt')
+    yield
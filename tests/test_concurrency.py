@@ -0,0 +1,75 @@
+import asyncio
+
+from dc_concurrency import AdaptiveLimiter
+from dc_delete_strategy import FAIL_BLOCKED, FAIL_TIMEOUT
+
+
+def _window(limiter: AdaptiveLimiter, success: bool = True, latency: float = 1.0, failures: int = 0):
+    for i in range(limiter.window):
+        limiter.record(success and i >= failures, latency)
+
+
+def test_healthy_windows_increase_by_one_up_to_max():
+    limiter = AdaptiveLimiter(initial=2, max_limit=4, window=5)
+    _window(limiter)
+    assert limiter.limit == 3
+    _window(limiter)
+    _window(limiter)
+    assert limiter.limit == 4
+
+
+def test_backoff_signal_halves_immediately_and_skips_next_increase():
+    limiter = AdaptiveLimiter(initial=8, max_limit=8, window=5)
+    limiter.record(False, 1.0, FAIL_BLOCKED)
+    assert limiter.limit == 4
+    limiter.record(False, 1.0, FAIL_TIMEOUT)
+    assert limiter.limit == 2
+    _window(limiter)
+    assert limiter.limit == 2  # 감소 직후 한 구간은 증가하지 않는다
+    _window(limiter)
+    assert limiter.limit == 3
+
+
+def test_failure_ratio_halves_and_never_drops_below_min():
+    limiter = AdaptiveLimiter(initial=4, min_limit=1, window=10, max_failure_ratio=0.3)
+    _window(limiter, failures=4)
+    assert limiter.limit == 2
+    _window(limiter, failures=10)
+    _window(limiter, failures=10)
+    assert limiter.limit == 1
+
+
+def test_slow_window_decreases_by_one():
+    limiter = AdaptiveLimiter(initial=4, window=5, latency_slack=2.0)
+    _window(limiter, latency=1.0)
+    assert limiter.limit == 5
+    _window(limiter, latency=3.0)
+    assert limiter.limit == 4
+
+
+def test_ceiling_caps_limit():
+    limiter = AdaptiveLimiter(initial=6, max_limit=8, window=5)
+    limiter.set_ceiling(3, 'memory')
+    assert limiter.limit == 3
+    _window(limiter)
+    assert limiter.limit == 3
+    limiter.set_ceiling(None)
+    _window(limiter)
+    assert limiter.limit == 4
+
+
+def test_slot_bounds_in_flight():
+    async def scenario():
+        limiter = AdaptiveLimiter(initial=2, max_limit=4)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        return peak, limiter.in_flight
+
+    assert asyncio.run(scenario()) == (2, 0)
@@ -0,0 +1,68 @@
+import json
+
+from dc_cookie import (
+    SESSION_EXPIRED, SESSION_MISSING, SESSION_NEAR_EXPIRY, SESSION_UNVERIFIED, SESSION_VALID, DCCookieManager,
+    session_expiry, write_json_atomic
+)
+
+NOW = 1_700_000_000.0
+
+
+def _cookie(expires, name='PHPSESSID', http_only=True, domain='.dcinside.com'):
+    return {'name': name, 'value': 'v', 'domain': domain, 'path': '/', 'expires': expires, 'httpOnly': http_only}
+
+
+def _manager(tmp_path, **kwargs) -> DCCookieManager:
+    return DCCookieManager(str(tmp_path / 'cookies.json'), state_path=str(tmp_path / 'session.json'), **kwargs)
+
+
+def test_session_expiry_uses_earliest_auth_cookie():
+    cookies = [
+        _cookie(NOW + 100),
+        _cookie(NOW + 50, name='tracking', http_only=False),  # 인증 쿠키 아님
+        _cookie(NOW + 10, domain='.example.com'),
+        _cookie(NOW + 200, name='ci_c'),
+        _cookie(-1, name='session_only'),
+    ]
+    assert session_expiry(cookies) == NOW + 100
+    assert session_expiry([_cookie(-1)]) is None
+
+
+def test_session_status_by_expiry(tmp_path):
+    manager = _manager(tmp_path, refresh_margin=3600)
+    assert manager.session_status(NOW) == SESSION_MISSING
+    manager.save_state({'cookies': [_cookie(NOW + 7200)]}, verified_at=NOW)
+    assert manager.session_status(NOW) == SESSION_VALID
+    assert manager.session_status(NOW + 5400) == SESSION_NEAR_EXPIRY
+    assert manager.session_status(NOW + 7200) == SESSION_EXPIRED
+
+
+def test_session_without_expiry_is_valid_for_max_age_after_verification(tmp_path):
+    manager = _manager(tmp_path, max_age=100, refresh_margin=10)
+    manager.save_state({'cookies': [_cookie(-1)]}, verified_at=NOW)
+    assert manager.session_status(NOW + 50) == SESSION_VALID
+    assert manager.session_status(NOW + 100) == SESSION_EXPIRED
+
+
+def test_save_without_verification_keeps_previous_verified_at(tmp_path):
+    manager = _manager(tmp_path, max_age=100, refresh_margin=10)
+    manager.save_state({'cookies': [_cookie(-1)]}, verified_at=NOW)
+    # 주기 저장(스냅샷)은 확인 시각을 늘리지 않는다
+    manager.save_state({'cookies': [_cookie(-1)]})
+    with open(manager.state_path, encoding='utf-8') as f:
+        assert json.load(f)['verified_at'] == NOW
+    assert manager.session_status(NOW + 100) == SESSION_EXPIRED
+
+
+def test_never_verified_session_is_not_valid(tmp_path):
+    manager = _manager(tmp_path)
+    manager.save_state({'cookies': [_cookie(NOW + 7200)]})
+    assert manager.session_status(NOW) == SESSION_UNVERIFIED
+
+
+def test_write_json_atomic_replaces_file(tmp_path):
+    path = tmp_path / 'data.json'
+    write_json_atomic(str(path), {'a': 1})
+    write_json_atomic(str(path), {'a': 2})
+    assert json.loads(path.read_text(encoding='utf-8')) == {'a': 2}
+    assert [p.name for p in tmp_path.iterdir()] == ['data.json']
@@ -0,0 +1,14 @@
+import pytest
+
+from dc_daemon import check_host
+
+
+@pytest.mark.parametrize('host', ['127.0.0.1', '::1', 'localhost'])
+def test_loopback_host_is_allowed(host):
+    check_host(host)
+
+
+@pytest.mark.parametrize('host', ['0.0.0.0', '::', '192.168.0.10', 'example.com'])
+def test_non_loopback_host_is_refused(host):
+    with pytest.raises(ValueError):
+        check_host(host)
@@ -0,0 +1,68 @@
+from dc_delete_strategy import (
+    FAIL_ALREADY_DELETED, FAIL_BLOCKED, FAIL_PERMISSION, DeleteStrategy, StrategyRegistry, classify_refusal,
+    gallery_type, parse_listing_delete_response
+)
+
+
+def test_classify_refusal():
+    assert classify_refusal('이미 삭제된 게시물입니다.') == FAIL_ALREADY_DELETED
+    assert classify_refusal('삭제할 권한이 없습니다.') == FAIL_PERMISSION
+    assert classify_refusal('권한이 없습니다') == FAIL_PERMISSION
+    assert classify_refusal('삭제되었습니다.') is None
+    assert classify_refusal('') is None
+
+
+def test_parse_listing_delete_response():
+    assert parse_listing_delete_response(200, '{"result": "success"}') == (True, None)
+    assert parse_listing_delete_response(200, 'true') == (True, None)
+    assert parse_listing_delete_response(200, '{"result": "fail", "msg": "삭제할 권한이 없습니다."}') \
+        == (False, FAIL_PERMISSION)
+    assert parse_listing_delete_response(200, '{"result": "fail"}') == (False, 'refused')
+    assert parse_listing_delete_response(403, '') == (False, FAIL_BLOCKED)
+    assert parse_listing_delete_response(500, '') == (False, 'http_500')
+
+
+def test_gallery_type():
+    assert gallery_type('https://gall.dcinside.com/board/view/?id=a&no=1') == 'main'
+    assert gallery_type('https://gall.dcinside.com/mgallery/board/view/?id=a&no=1') == 'minor'
+    assert gallery_type('https://gall.dcinside.com/mini/board/view/?id=a&no=1') == 'mini'
+
+
+def _registry():
+    async def run(post, page):
+        return None
+    registry = StrategyRegistry(min_attempts=2, min_success=0.5, probe_every=3)
+    registry.register(DeleteStrategy('cheap', 0.5, run))
+    registry.register(DeleteStrategy('slow', 3.0, run))
+    return registry
+
+
+def test_plan_excludes_failing_strategy_without_side_effects():
+    registry = _registry()
+    for _ in range(2):
+        registry.record('main', 'cheap', False, 0.5)
+    assert [s.name for s in registry.plan('main')] == ['slow']
+    assert [s.name for s in registry.plan('main')] == ['slow']
+    assert registry.stats[('main', 'cheap')]['skipped'] == 0
+
+
+def test_excluded_strategy_is_probed_after_skips():
+    registry = _registry()
+    for _ in range(2):
+        registry.record('main', 'cheap', False, 0.5)
+    planned = []
+    for _ in range(4):
+        plan = registry.plan('main')
+        registry.skip_excluded('main', plan)
+        planned.append([s.name for s in plan])
+    assert planned[:3] == [['slow']] * 3
+    assert planned[3] == ['cheap', 'slow']
+    registry.record('main', 'cheap', False, 0.5)
+    assert [s.name for s in registry.plan('main')] == ['slow']
+
+
+def test_failures_from_environment_are_not_learned():
+    registry = _registry()
+    for _ in range(5):
+        registry.record('main', 'cheap', False, 0.5, FAIL_BLOCKED)
+    assert [s.name for s in registry.plan('main')] == ['cheap', 'slow']
@@ -0,0 +1,123 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import dc_cleaner
+from dc_cleaner import DCCleaner
+from dc_ledger import SYNC_GALLOG_COMPLETE, DeletionLedger
+from dc_post import PostRecord
+
+
+def _link(no: int) -> str:
+    return f'https://gall.dcinside.com/board/view/?id=test&no={no}'
+
+
+def _item(no: int, date: str = '2020.01.01 10:00'):
+    # extract_gallog_items 결과 한 줄: [날짜, 제목, 링크, data-no]
+    return [date, f'글 {no}', _link(no), str(no)]
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = DeletionLedger(tmp_path / 'ledger.sqlite3')
+    yield ledger
+    ledger.close()
+
+
+class _Gallog:
+    # 최신 글이 앞에 오는 갤로그 목록을 per_page 개씩 나눠 보여 준다
+    def __init__(self, items, per_page: int = 2):
+        self.items = items
+        self.per_page = per_page
+        self.visits = []
+
+    def page(self, page_no: int):
+        self.visits.append(page_no)
+        start = (page_no - 1) * self.per_page
+        return self.items[start:start + self.per_page]
+
+
+def _walk(ledger, gallog: _Gallog, monkeypatch, max_pages=None, hours_ago: float = 1.0):
+    # 브라우저 없이 DCCleaner.iter_gallog_posts 의 색인 경로만 돌린다
+    cleaner = DCCleaner.__new__(DCCleaner)
+    cleaner.ledger = ledger
+    cleaner.gallog_index = True
+    cleaner.listing_deleted = 0
+    cleaner.gallog_base = 'https://gallog.dcinside.com'
+    cleaner.username = 'user'
+    cleaner.page = None
+    current = {}
+
+    async def goto(page, url, **kwargs):
+        current['page'] = int(url.split('?p=')[1]) if '?p=' in url else 1
+
+    async def extract(page):
+        return gallog.page(current['page'])
+
+    cleaner._goto = goto
+    monkeypatch.setattr(dc_cleaner, 'extract_gallog_items', extract)
+    monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
+
+    async def collect():
+        return [post['link'] async for post in cleaner.iter_gallog_posts(hours_ago, max_pages=max_pages)]
+    return asyncio.run(collect())
+
+
+def test_index_posts_ignores_duplicates_and_posts_without_key(ledger):
+    posts = [PostRecord(link=_link(1)), PostRecord(link=_link(2)), PostRecord(link='https://gallog.dcinside.com/x')]
+    assert ledger.index_posts(posts) == 2
+    assert ledger.index_posts(posts[:1]) == 0
+    assert ledger.indexed_links([_link(1), _link(3)]) == {_link(1)}
+    assert ledger.indexed_links([]) == set()
+
+
+def test_indexed_posts_by_date_skips_done_and_reads_in_chunks(ledger):
+    base = datetime(2020, 1, 1)
+    ledger.index_posts([PostRecord(link=_link(no), title=f'글 {no}', date=base + timedelta(hours=no))
+                        for no in range(1, 8)])
+    ledger.record_result({'link': _link(3)}, True, 0.1)
+    cutoff = base + timedelta(hours=6)
+    posts = list(ledger.indexed_posts(cutoff, chunk=2))
+    assert [post['no'] for post in posts] == [6, 5, 4, 2, 1]  # 최신순, 7번은 cutoff 이후, 3번은 삭제됨
+    assert posts[0]['date'] == base + timedelta(hours=6)
+    assert posts[0]['title'] == '글 6'
+
+
+def test_sync_value_round_trip(ledger):
+    assert ledger.sync_value(SYNC_GALLOG_COMPLETE) is None
+    ledger.set_sync_value(SYNC_GALLOG_COMPLETE, '1')
+    assert ledger.sync_value(SYNC_GALLOG_COMPLETE) == '1'
+
+
+def test_first_walk_indexes_every_page_then_only_new_pages(ledger, monkeypatch):
+    gallog = _Gallog([_item(no) for no in (6, 5, 4, 3, 2, 1)])
+    assert sorted(_walk(ledger, gallog, monkeypatch)) == sorted(_link(no) for no in range(1, 7))
+    assert gallog.visits == [1, 2, 3, 4]
+    assert ledger.sync_value(SYNC_GALLOG_COMPLETE) == '1'
+    for no in (6, 5, 4, 3):
+        ledger.record_result({'link': _link(no)}, True, 0.1)
+
+    # 새 글 1건: 1페이지(새 글 + 색인된 글), 2페이지(모두 색인됨)에서 멈추고 나머지는 색인에서 고른다
+    gallog.items.insert(0, _item(7))
+    gallog.visits.clear()
+    links = _walk(ledger, gallog, monkeypatch)
+    assert gallog.visits == [1, 2]
+    assert links[0] == _link(7)
+    assert sorted(links) == sorted([_link(7), _link(2), _link(1)])
+
+
+def test_walk_is_not_cut_short_before_first_full_index(ledger, monkeypatch):
+    gallog = _Gallog([_item(no) for no in (4, 3, 2, 1)])
+    _walk(ledger, gallog, monkeypatch, max_pages=1)
+    assert ledger.sync_value(SYNC_GALLOG_COMPLETE) is None
+    gallog.visits.clear()
+    _walk(ledger, gallog, monkeypatch)
+    assert gallog.visits == [1, 2, 3]  # 1페이지가 모두 색인되어 있어도 끝까지 한 번은 순회
+
+
+def test_recent_posts_are_indexed_but_not_yielded(ledger, monkeypatch):
+    recent = (datetime.now() - timedelta(minutes=5)).strftime('%Y.%m.%d %H:%M')
+    gallog = _Gallog([_item(2, recent), _item(1)])
+    assert _walk(ledger, gallog, monkeypatch) == [_link(1)]
+    assert ledger.indexed_links([_link(2)]) == {_link(2)}
@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from dc_delete_strategy import FAIL_BLOCKED, FAIL_INVALID_LINK  # noqa: E402
+from dc_http_engine import (  # noqa: E402
+    RESULT_DELETED, RESULT_FAILED, RESULT_NEED_BROWSER, DCHttpDeleter, is_deleted_view
+)
+from mock_server import MockDCServer  # noqa: E402
+
+
+def _run(tmp_path, server: MockDCServer, posts):
+    # 대역 서버를 띄우고 posts 를 차례로 삭제한 결과 목록
+    cookie_path = tmp_path / 'cookies.json'
+    cookie_path.write_text(json.dumps([
+        {'name': 'ci_c', 'value': 'token', 'domain': '127.0.0.1', 'path': '/'},
+    ]), encoding='utf-8')
+
+    async def scenario():
+        base_url = await server.start()
+        try:
+            async with DCHttpDeleter(cookie_path=cookie_path, timeout=5) as deleter:
+                results = []
+                for post in posts:
+                    if post['link'].startswith('/'):
+                        post['link'] = base_url + post['link']
+                    results.append(await deleter.delete_post(post))
+                return results
+        finally:
+            await server.stop()
+
+    return asyncio.run(scenario())
+
+
+def _server(**kwargs) -> MockDCServer:
+    return MockDCServer(posts=2, latency=0.0, jitter=0.0, seed=1, **kwargs)
+
+
+def _view(no: int) -> dict:
+    return {'link': f'/board/view/?id=bench&no={no}', 'title': f'글 {no}'}
+
+
+@pytest.mark.parametrize('meta_ratio', [1.0, 0.0])
+def test_delete_via_meta_url_and_confirm_form(tmp_path, meta_ratio):
+    server = _server(meta_ratio=meta_ratio)
+    assert _run(tmp_path, server, [_view(1000), _view(1001)]) == [RESULT_DELETED, RESULT_DELETED]
+    assert server.posts == {}
+    assert server.stats['deleted'] == 2
+
+
+def test_already_deleted_post_is_not_requested_again(tmp_path):
+    server = _server()
+    post = _view(999)
+    assert _run(tmp_path, server, [post]) == [RESULT_DELETED]
+    assert server.stats['requests'] == 1
+    assert 'fail_reason' not in post
+
+
+def test_captcha_hands_over_to_browser(tmp_path):
+    server = _server(captcha_rate=1.0)
+    post = _view(1000)
+    assert _run(tmp_path, server, [post]) == [RESULT_NEED_BROWSER]
+    assert post['captcha'] and post['blocked']
+    assert 1000 in server.posts
+
+
+def test_forbidden_stops_after_first_request(tmp_path):
+    server = _server(forbidden_rate=1.0)
+    post = _view(1000)
+    assert _run(tmp_path, server, [post]) == [RESULT_FAILED]
+    assert post['fail_reason'] == FAIL_BLOCKED
+    assert post['blocked'] and not post['captcha']
+    assert server.stats['requests'] == 1
+    assert 1000 in server.posts
+
+
+def test_invalid_link_is_failed_without_request(tmp_path):
+    server = _server()
+    post = {'link': '/bench/posting', 'title': 'x'}
+    assert _run(tmp_path, server, [post]) == [RESULT_FAILED]
+    assert post['fail_reason'] == FAIL_INVALID_LINK
+    assert server.stats['requests'] == 0
+
+
+def test_is_deleted_view():
+    assert is_deleted_view(404, 'https://gall.dcinside.com/board/view/?id=a&no=1', '')
+    assert is_deleted_view(200, 'https://gall.dcinside.com/error/deleted/a', '')
+    assert is_deleted_view(200, 'https://gall.dcinside.com/board/view/?id=a&no=1',
+                           "<script>alert('삭제된 게시물입니다.');history.back();</script>")
+    # 살아 있는 글 본문에 같은 문구가 있어도 삭제로 보지 않는다
+    assert not is_deleted_view(200, 'https://gall.dcinside.com/board/view/?id=a&no=1',
+                               '<div class="write_div">삭제된 게시물 모음</div>')
@@ -0,0 +1,83 @@
+from dc_delete_strategy import FAIL_ALREADY_DELETED, FAIL_NO_BUTTON, FAIL_PERMISSION, FAIL_TIMEOUT, RETRY_POLICIES
+from dc_ledger import STATE_DELETED, STATE_FAILED, STATE_QUEUED, STATE_VERIFIED, DeletionLedger
+
+import pytest
+
+LINK = 'https://gall.dcinside.com/board/view/?id=test&no=100'
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = DeletionLedger(tmp_path / 'ledger.sqlite3')
+    yield ledger
+    ledger.close()
+
+
+def test_enqueue_records_queued_once(ledger):
+    post = {'link': LINK, 'title': 't'}
+    assert ledger.enqueue(post)
+    assert ledger.state(post) == STATE_QUEUED
+    assert ledger.enqueue(post)  # 아직 대기 중이면 다시 큐에 넣어도 된다
+
+
+def test_success_then_verified_is_skipped(ledger):
+    post = {'link': LINK}
+    ledger.enqueue(post)
+    ledger.record_result(post, True, 0.1)
+    assert ledger.state(post) == STATE_DELETED
+    ledger.mark_verified(post)
+    assert ledger.state(post) == STATE_VERIFIED
+    assert not ledger.enqueue(post)
+
+
+def test_already_deleted_counts_as_deleted(ledger):
+    post = {'link': LINK}
+    ledger.record_result(post, False, 0.1, FAIL_ALREADY_DELETED)
+    assert ledger.state(post) == STATE_DELETED
+
+
+def test_permanent_failure_goes_to_skip_list(ledger):
+    post = {'link': LINK}
+    ledger.record_result(post, False, 0.1, FAIL_PERMISSION)
+    assert ledger.state(post) == STATE_FAILED
+    assert not ledger.enqueue(post)
+
+
+@pytest.mark.parametrize('reason', [FAIL_TIMEOUT, FAIL_NO_BUTTON])
+def test_transient_failure_fails_after_policy_retries(ledger, reason):
+    # 재시도 스케줄러와 같은 예산: 최대 재시도 + 1 번째 실패에서 영구 실패
+    post = {'link': LINK}
+    for _ in range(RETRY_POLICIES[reason][0]):
+        ledger.record_result(post, False, 0.1, reason)
+        assert ledger.state(post) == STATE_QUEUED
+    ledger.record_result(post, False, 0.1, reason)
+    assert ledger.state(post) == STATE_FAILED
+
+
+def test_policy_override(tmp_path):
+    ledger = DeletionLedger(tmp_path / 'ledger.sqlite3', policies={FAIL_TIMEOUT: (5, 1.0)})
+    post = {'link': LINK}
+    for _ in range(5):
+        ledger.record_result(post, False, 0.1, FAIL_TIMEOUT)
+    assert ledger.state(post) == STATE_QUEUED
+    ledger.record_result(post, False, 0.1, FAIL_TIMEOUT)
+    assert ledger.state(post) == STATE_FAILED
+    ledger.close()
+
+
+def test_unverified_goes_back_to_queue_until_attempts_run_out(ledger):
+    post = {'link': LINK}
+    ledger.record_result(post, True, 0.1)
+    assert ledger.mark_unverified(post)
+    assert ledger.state(post) == STATE_QUEUED
+    ledger.record_result(post, False, 0.1, FAIL_TIMEOUT)
+    ledger.record_result(post, True, 0.1)
+    assert not ledger.mark_unverified(post)
+    assert ledger.state(post) == STATE_FAILED
+
+
+def test_link_without_key_is_not_tracked(ledger):
+    post = {'link': 'https://gallog.dcinside.com/user/posting'}
+    assert ledger.enqueue(post)
+    ledger.record_result(post, True, 0.1)
+    assert ledger.state(post) is None
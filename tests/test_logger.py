@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+import dc_logger
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    path = tmp_path / 'log.txt'
+    monkeypatch.setattr(dc_logger, 'LOG_FILE', str(path))
+    monkeypatch.setattr(dc_logger, 'CURRENT_LEVEL', dc_logger.LOG_LEVELS['DEBUG'])
+    return path
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    # 전역 기록 스레드 대신 테스트마다 새 스레드
+    writer = dc_logger._BackgroundWriter()
+    monkeypatch.setattr(dc_logger, '_writer', writer)
+    monkeypatch.setattr(dc_logger, 'LOG_ASYNC', True)
+    yield writer
+    writer.stop()
+
+
+def _lines(path):
+    return path.read_text(encoding='utf-8').splitlines()
+
+
+def test_flush_writes_queued_records_in_order(log_file, writer):
+    for i in range(300):  # LOG_BATCH 보다 많이
+        dc_logger.log_info(f'msg {i}', module='test')
+    dc_logger.flush_logs()
+    lines = _lines(log_file)
+    assert len(lines) == 300
+    assert lines[0].endswith('[INFO][test] msg 0')
+    assert lines[-1].endswith('msg 299')
+
+
+def test_shutdown_writes_remaining_records_and_stops_thread(log_file, writer):
+    dc_logger.log_error('last words')
+    thread = writer.thread
+    dc_logger.shutdown_logging()
+    assert not thread.is_alive()
+    assert _lines(log_file)[-1].endswith('[ERROR] last words')
+
+
+def test_level_filter(log_file, monkeypatch):
+    monkeypatch.setattr(dc_logger, 'CURRENT_LEVEL', dc_logger.LOG_LEVELS['WARN'])
+    dc_logger.log_info('hidden')
+    dc_logger.log_warn('shown')
+    assert [line.split('] ')[-1] for line in _lines(log_file)] == ['shown']
+
+
+def test_rotation_keeps_configured_backups(log_file, monkeypatch):
+    monkeypatch.setattr(dc_logger, 'LOG_MAX_BYTES', 200)
+    monkeypatch.setattr(dc_logger, 'LOG_BACKUPS', 2)
+    for i in range(40):
+        dc_logger.log_info(f'line {i:02d} ' + 'x' * 40)
+    backups = sorted(p.name for p in log_file.parent.iterdir())
+    assert backups == ['log.txt', 'log.txt.1', 'log.txt.2']
+    assert log_file.stat().st_size < 200
+    # 회전 후에도 최신 줄은 현재 파일, 바로 앞 줄들은 .1 에 있다
+    newest = _lines(log_file) or _lines(log_file.parent / 'log.txt.1')
+    assert newest[-1].split('] ')[-1].startswith('line 39')
+
+
+def test_json_format(log_file, monkeypatch):
+    monkeypatch.setattr(dc_logger, 'LOG_FORMAT', 'json')
+    try:
+        raise ValueError('bad')
+    except ValueError as e:
+        dc_logger.log_error('failed', module='test', exc_info=(type(e), e, e.__traceback__))
+    record = json.loads(_lines(log_file)[0])
+    assert (record['level'], record['module'], record['msg']) == ('ERROR', 'test', 'failed')
+    assert 'ValueError: bad' in record['traceback']
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from dc_page_pool import PagePool
+
+
+class _Page:
+    def __init__(self):
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    async def evaluate(self, script):
+        return 1
+
+    async def goto(self, url, timeout=None):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class _Context:
+    async def new_page(self):
+        return _Page()
+
+
+def test_close_wakes_waiting_callers():
+    async def scenario():
+        pool = PagePool(_Context(), size=1)
+
+        async def hold(release):
+            async with pool.page():
+                await release.wait()
+
+        release = asyncio.Event()
+        holder = asyncio.ensure_future(hold(release))
+        await asyncio.sleep(0)
+
+        async def wait_for_page():
+            async with pool.page():
+                pass
+
+        waiter = asyncio.ensure_future(wait_for_page())
+        await asyncio.sleep(0)
+        assert pool._waiting == 1
+        await pool.close()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(waiter, timeout=1)
+        release.set()
+        await holder
+        assert all(page.closed for page in pool._pages) and not pool._pages
+        with pytest.raises(RuntimeError):
+            async with pool.page():
+                pass
+
+    asyncio.run(scenario())
+
+
+def test_pages_are_reused_up_to_size():
+    async def scenario():
+        pool = PagePool(_Context(), size=2, initial=1)
+        seen = set()
+
+        async def use():
+            async with pool.page() as page:
+                seen.add(id(page))
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(use() for _ in range(6)))
+        await pool.close()
+        return pool.stats, seen
+
+    stats, seen = asyncio.run(scenario())
+    assert stats['created'] == 2 and len(seen) == 2
+    assert stats['reused'] == 6
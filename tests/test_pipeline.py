@@ -0,0 +1,136 @@
+import asyncio
+import json
+
+import pytest
+
+from dc_concurrency import AdaptiveLimiter
+from dc_delete_strategy import FAIL_NO_BUTTON, FAIL_PERMISSION, FAIL_TIMEOUT, StrategyRegistry
+from dc_ledger import STATE_DELETED, STATE_FAILED, DeletionLedger
+from dc_metrics import StageTimer
+from dc_pipeline import DeletePipeline
+
+
+class _Supervisor:
+    generation = 0
+
+    def __init__(self):
+        self.stats = {'requeued': 0}
+
+    async def recover(self, generation: int) -> bool:
+        return False  # 브라우저가 죽은 적 없음
+
+
+class _Cleaner:
+    # 브라우저 없이 DeletePipeline 이 쓰는 부분만 흉내 낸다.
+    # results[link] 의 결과를 차례로 쓴다: True = 삭제 성공, 문자열 = 실패 사유, 예외 = 삭제 중 예외
+    def __init__(self, tmp_path, results):
+        self.results = {link: list(outcomes) for link, outcomes in results.items()}
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+        self.concurrency = AdaptiveLimiter(initial=2, min_limit=1, max_limit=2)
+        self.stage_timer = StageTimer()
+        self.ledger = DeletionLedger(tmp_path / 'ledger.sqlite3')
+        self.strategies = StrategyRegistry()
+        self.supervisor = _Supervisor()
+        self.rate_limiter = None
+
+    async def delete_post(self, post: dict) -> bool:
+        self.calls.append(post['link'])
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            outcome = self.results[post['link']].pop(0)
+        finally:
+            self.running -= 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        if outcome is not True:
+            post['fail_reason'] = outcome
+            return False
+        return True
+
+    def record_outcome(self, post: dict, success: bool, latency: float):
+        self.concurrency.record(success, latency, None if success else post.get('fail_reason'))
+
+    def log_run_report(self, module=None):
+        pass
+
+
+def _link(no: int) -> str:
+    return f'https://gall.dcinside.com/board/view/?id=test&no={no}'
+
+
+def _run(cleaner, posts, policies=None, **kwargs):
+    pipeline = DeletePipeline(cleaner, posts=posts, **kwargs)
+    # 테스트에서는 재시도 대기를 짧게 (원장도 같은 정책으로 영구 실패 시점을 정한다)
+    for reason, policy in (policies or {}).items():
+        pipeline.retries.policies[reason] = policy
+        cleaner.ledger.policies[reason] = policy
+    stats = asyncio.run(pipeline.run())
+    cleaner.ledger.close()
+    return pipeline, stats
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch, tmp_path):
+    monkeypatch.setenv('DC_VERIFY', '0')
+    monkeypatch.setenv('DC_DEAD_LETTER_PATH', str(tmp_path / 'dead.jsonl'))
+
+
+def test_workers_delete_every_post_within_concurrency_limit(tmp_path):
+    links = [_link(no) for no in range(1, 7)]
+    cleaner = _Cleaner(tmp_path, {link: [True] for link in links})
+    _, stats = _run(cleaner, [{'link': link, 'title': link} for link in links], queue_size=2)
+    assert stats['success'] == 6 and stats['fail'] == 0
+    assert sorted(cleaner.calls) == sorted(links)
+    assert cleaner.peak == 2
+    ledger = DeletionLedger(tmp_path / 'ledger.sqlite3')
+    assert ledger.counts() == {STATE_DELETED: 6}
+    ledger.close()
+
+
+def test_duplicate_and_done_posts_are_skipped(tmp_path):
+    cleaner = _Cleaner(tmp_path, {_link(1): [True]})
+    cleaner.ledger.record_result({'link': _link(2)}, True, 0.1)
+    posts = [{'link': _link(1), 'title': 'a'}, {'link': _link(1), 'title': 'a'}, {'link': _link(2), 'title': 'b'}]
+    _, stats = _run(cleaner, posts)
+    assert cleaner.calls == [_link(1)]
+    assert stats['skipped'] == 1 and stats['success'] == 1
+
+
+def test_worker_exception_is_recorded_and_worker_keeps_running(tmp_path):
+    cleaner = _Cleaner(tmp_path, {_link(1): [RuntimeError('boom')], _link(2): [True]})
+    pipeline = DeletePipeline(cleaner, posts=[{'link': _link(1), 'title': 'a'}, {'link': _link(2), 'title': 'b'}],
+                              workers=1)
+    pipeline.retries.policies['RuntimeError'] = (0, 0.0)
+    stats = asyncio.run(pipeline.run())
+    assert stats['success'] == 1 and stats['fail'] == 1
+    assert cleaner.ledger.state({'link': _link(1)}) == STATE_FAILED
+    cleaner.ledger.close()
+
+
+def test_failed_post_is_retried_with_backoff_then_deleted(tmp_path):
+    cleaner = _Cleaner(tmp_path, {_link(1): [FAIL_TIMEOUT, FAIL_TIMEOUT, True]})
+    pipeline, stats = _run(cleaner, [{'link': _link(1), 'title': 'a'}], policies={FAIL_TIMEOUT: (2, 0.01)})
+    assert cleaner.calls == [_link(1)] * 3
+    assert stats['retried'] == 2 and stats['success'] == 1 and stats['fail'] == 0
+    assert pipeline.retries.stats['released'] == 2
+    assert not (tmp_path / 'dead.jsonl').exists()
+
+
+def test_exhausted_and_permanent_failures_go_to_dead_letter(tmp_path):
+    cleaner = _Cleaner(tmp_path, {_link(1): [FAIL_NO_BUTTON] * 2, _link(2): [FAIL_PERMISSION]})
+    posts = [{'link': _link(1), 'title': 'a'}, {'link': _link(2), 'title': 'b'}]
+    _, stats = _run(cleaner, posts, policies={FAIL_NO_BUTTON: (1, 0.01)})
+    assert cleaner.calls.count(_link(1)) == 2 and cleaner.calls.count(_link(2)) == 1
+    assert stats['retried'] == 1 and stats['fail'] == 2 and stats['dead_letter'] == 2
+    records = [json.loads(line) for line in (tmp_path / 'dead.jsonl').read_text(encoding='utf-8').splitlines()]
+    assert sorted((r['no'], r['reason'], r['retries']) for r in records) == [(1, FAIL_NO_BUTTON, 1),
+                                                                             (2, FAIL_PERMISSION, 0)]
+    ledger = DeletionLedger(tmp_path / 'ledger.sqlite3')
+    assert ledger.counts() == {STATE_FAILED: 2}
+    # 다음 실행에서는 건너뛴다
+    assert not ledger.enqueue({'link': _link(1)})
+    ledger.close()
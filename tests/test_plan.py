@@ -0,0 +1,87 @@
+import asyncio
+import json
+import zlib
+from datetime import datetime
+
+import pytest
+
+from dc_ledger import DeletionLedger
+from dc_plan import _shard_env, _shard_rate_limits, check_shard, plan_line, read_plan, shard_of, write_plan
+from dc_post import PostRecord
+from dc_rate_limit import HostRateLimiter
+
+
+def _post(no: int, gallery_id: str = 'test') -> PostRecord:
+    return PostRecord(title=f'글 {no}', link=f'https://gall.dcinside.com/board/view/?id={gallery_id}&no={no}',
+                      date=datetime(2020, 1, 1, 10, no % 60), gallery_id=gallery_id, no=no, gallog_no=str(no))
+
+
+def test_shard_of_is_crc32_of_post_key():
+    post = _post(123)
+    assert shard_of(post, 4) == zlib.crc32(b'test:123') % 4
+    # 글번호가 없으면 링크로
+    assert shard_of({'link': 'https://x/1'}, 4) == zlib.crc32(b'https://x/1') % 4
+    # 계획 파일에서 읽은 줄도 같은 shard
+    assert shard_of(json.loads(plan_line(post)), 4) == shard_of(post, 4)
+
+
+def test_check_shard_rejects_out_of_range():
+    check_shard(0, 1)
+    check_shard(3, 4)
+    for index, count in ((4, 4), (-1, 4), (0, 0)):
+        with pytest.raises(ValueError):
+            check_shard(index, count)
+
+
+def test_shards_split_plan_without_overlap(tmp_path):
+    path = tmp_path / 'plan.jsonl'
+    posts = [_post(no, gallery_id) for gallery_id in ('a', 'b') for no in range(50)]
+    path.write_text(''.join(plan_line(post) + '\n' for post in posts) + '\n', encoding='utf-8')
+    shards = [[post['link'] for post in read_plan(str(path), index, 3)] for index in range(3)]
+    assert sorted(sum(shards, [])) == sorted(post['link'] for post in posts)
+    assert all(shards)  # 100건이면 모든 shard 에 글이 있다
+    first = next(read_plan(str(path)))
+    assert (first['gallery_id'], first['no'], first['date'], first['gallog_no']) == \
+        ('a', 0, datetime(2020, 1, 1, 10, 0), '0')
+
+
+def test_write_plan_skips_done_and_duplicate_posts(tmp_path):
+    class _Cleaner:
+        def __init__(self):
+            self.ledger = DeletionLedger(tmp_path / 'ledger.sqlite3')
+
+        async def iter_gallog_posts(self, hours_ago, max_pages=None):
+            for post in (_post(1), _post(2), _post(1), _post(3)):
+                yield post
+
+    cleaner = _Cleaner()
+    cleaner.ledger.record_result(_post(2), True, 0.1)
+    path = tmp_path / 'plan.jsonl'
+    assert asyncio.run(write_plan(cleaner, str(path))) == 2
+    cleaner.ledger.close()
+    assert [post['no'] for post in read_plan(str(path))] == [1, 3]
+    assert not (tmp_path / 'plan.jsonl.tmp').exists()
+
+
+def test_shard_rate_limits_split_total_rate(monkeypatch):
+    monkeypatch.setenv('DC_RATE_LIMITS', 'gall.dcinside.com=4:8')
+    monkeypatch.setenv('DC_RATE_LIMIT', '2')
+    monkeypatch.setenv('DC_RATE_BURST', '3')
+    env = _shard_rate_limits(4)
+    assert env['DC_RATE_LIMIT'] == '0.5'
+    assert env['DC_RATE_BURST'] == '1'  # 버스트는 최소 1
+    # shard 프로세스가 from_env 로 읽으면 호스트별 속도가 1/4
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    limits = HostRateLimiter.from_env().host_limits
+    assert limits['gall.dcinside.com'] == (1.0, 2)
+    assert limits['sign.dcinside.com'] == (0.125, 1)
+
+
+def test_shard_env_separates_metrics_files(monkeypatch):
+    monkeypatch.setenv('DC_METRICS_PROM', 'out/metrics.prom')
+    monkeypatch.setenv('DC_METRICS_JSON', '')
+    env = _shard_env(2, 4)
+    assert env['DC_METRICS_PROM'] == 'out/metrics.shard2.prom'
+    assert env['DC_METRICS_JSON'] == ''  # 꺼 둔 출력은 그대로
+    assert 'DC_RATE_LIMITS' in env
@@ -0,0 +1,67 @@
+import asyncio
+import types
+
+import pytest
+
+import dc_rate_limit
+from dc_rate_limit import HostRateLimiter, TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # time.monotonic 을 직접 움직이는 시계로 바꾼다
+    clock = types.SimpleNamespace(now=100.0)
+    monkeypatch.setattr(dc_rate_limit, 'time', types.SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_burst_then_waits_in_reservation_order(clock):
+    bucket = TokenBucket(rate=2.0, burst=2)
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+
+def test_tokens_refill_with_time_up_to_burst(clock):
+    bucket = TokenBucket(rate=2.0, burst=2)
+    bucket.reserve()
+    bucket.reserve()
+    clock.now += 0.5
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.5
+    clock.now += 60  # 오래 쉬어도 burst 개까지만 쌓인다
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+
+def test_limiter_uses_per_host_buckets_and_counts_waits(clock, monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+    monkeypatch.setattr(dc_rate_limit, 'asyncio', types.SimpleNamespace(sleep=fake_sleep))
+
+    limiter = HostRateLimiter(default_rate=0, host_limits={'gall.dcinside.com': (1.0, 1)})
+
+    async def scenario():
+        waits = [await limiter.acquire('https://gall.dcinside.com/board/view/?id=a&no=1') for _ in range(3)]
+        # 제한 없는 호스트와 호스트 없는 주소는 기다리지 않는다
+        waits.append(await limiter.acquire('https://example.com/'))
+        waits.append(await limiter.acquire('about:blank'))
+        return waits
+
+    assert asyncio.run(scenario()) == [0.0, 1.0, 2.0, 0.0, 0.0]
+    assert sleeps == [1.0, 2.0]
+    stats = limiter.stats()
+    assert list(stats) == ['gall.dcinside.com']
+    assert stats['gall.dcinside.com']['requests'] == 3
+    assert stats['gall.dcinside.com']['throttled'] == 2
+    assert stats['gall.dcinside.com']['total_wait'] == 3.0
+    assert stats['gall.dcinside.com']['max_wait'] == 2.0
+
+
+def test_from_env_parses_host_limits(monkeypatch):
+    monkeypatch.setenv('DC_RATE_LIMITS', 'gall.dcinside.com=3:6, example.com=0.5')
+    monkeypatch.setenv('DC_RATE_LIMIT', '1.5')
+    limiter = HostRateLimiter.from_env()
+    assert limiter.host_limits['gall.dcinside.com'] == (3.0, 6)
+    assert limiter.host_limits['example.com'] == (0.5, dc_rate_limit.DEFAULT_BURST)
+    assert limiter.host_limits['gallog.dcinside.com'] == dc_rate_limit.DEFAULT_HOST_LIMITS['gallog.dcinside.com']
+    assert limiter.default_rate == 1.5
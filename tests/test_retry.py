@@ -0,0 +1,56 @@
+import asyncio
+import json
+
+from dc_delete_strategy import FAIL_BLOCKED, FAIL_NO_BUTTON, FAIL_PERMISSION, FAIL_TIMEOUT
+from dc_retry import RetryScheduler
+
+LINK = 'https://gall.dcinside.com/mgallery/board/view/?id=test&no=7'
+
+
+def test_schedule_until_policy_runs_out(tmp_path):
+    path = tmp_path / 'dead.jsonl'
+    retries = RetryScheduler(dead_letter_path=str(path), jitter=0.0)
+    post = {'link': LINK}
+    assert retries.schedule(post, FAIL_TIMEOUT)
+    assert retries.schedule(post, FAIL_TIMEOUT)
+    assert not retries.schedule(post, FAIL_TIMEOUT)
+    assert retries.stats == {'scheduled': 2, 'released': 0, 'dead_letter': 1}
+    assert post['_retries'] == 2
+    assert path.exists()
+
+
+def test_permanent_failure_is_dead_lettered_with_post_key(tmp_path):
+    path = tmp_path / 'dead.jsonl'
+    retries = RetryScheduler(dead_letter_path=str(path))
+    assert not retries.schedule({'link': LINK, 'title': 't'}, FAIL_PERMISSION)
+    record = json.loads(path.read_text(encoding='utf-8'))
+    assert (record['gallery_id'], record['no']) == ('test', 7)
+    assert record['reason'] == FAIL_PERMISSION
+    assert record['retries'] == 0
+
+
+def test_delay_doubles_and_is_capped():
+    retries = RetryScheduler(dead_letter_path=None, max_delay=60.0, jitter=0.0)
+    assert retries.delay(FAIL_TIMEOUT, 1) == 2.0
+    assert retries.delay(FAIL_TIMEOUT, 2) == 4.0
+    assert retries.delay(FAIL_BLOCKED, 2) == 60.0
+    assert retries.delay('unknown', 1) == 2.0
+
+
+def test_release_puts_due_posts_on_queue():
+    async def scenario():
+        retries = RetryScheduler(dead_letter_path=None, jitter=0.0, policies={FAIL_NO_BUTTON: (1, 0.01)})
+        queue = asyncio.Queue()
+        retries.start(queue)
+        first, second = {'link': LINK}, {'link': LINK + '1'}
+        retries.schedule(first, FAIL_NO_BUTTON)
+        retries.requeue(second)
+        assert retries.pending == 2
+        await asyncio.wait_for(retries.wait_empty(), timeout=2)
+        await retries.close()
+        return [queue.get_nowait(), queue.get_nowait()], retries
+
+    released, retries = asyncio.run(scenario())
+    assert released[0]['link'] == LINK + '1'  # requeue 는 대기 없이 먼저
+    assert retries.stats['released'] == 2
+    assert released[0].get('_retries') is None  # 재시도 횟수를 쓰지 않는다
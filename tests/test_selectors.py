@@ -0,0 +1,58 @@
+import asyncio
+
+from dc_selectors import QUERY_JS, SelectorResolver, page_type
+
+
+class _Handle:
+    def __init__(self, value, element=None):
+        self.value = value
+        self.element = element
+
+    def as_element(self):
+        return self.element
+
+    async def json_value(self):
+        return self.value
+
+
+class _Page:
+    # present 에 있는 셀렉터만 문서에 있는 것처럼 QUERY_JS 결과([index, 요소])를 흉내 낸다
+    url = 'https://gall.dcinside.com/mgallery/board/delete/?id=a&no=1'
+
+    def __init__(self, present):
+        self.present = present
+        self.calls = []
+
+    async def evaluate_handle(self, script, selectors):
+        assert script == QUERY_JS
+        self.calls.append(list(selectors))
+        index = next((i for i, sel in enumerate(selectors) if sel in self.present), -1)
+        element = f'<{selectors[index]}>' if index >= 0 else None
+        result = _Handle(None)
+
+        async def get_properties():
+            return {'0': _Handle(index), '1': _Handle(element, element)}
+        result.get_properties = get_properties
+        return result
+
+
+def test_page_type():
+    assert page_type('https://gall.dcinside.com/mgallery/board/view/?id=a&no=1') == '/mgallery/board/view'
+    assert page_type('') == '/'
+
+
+def test_query_learns_selector_and_tries_it_first_next_time():
+    resolver = SelectorResolver()
+    page = _Page(present={'c'})
+    assert asyncio.run(resolver.query(page, 'confirm_button', ['a', 'b', 'c'])) == ('<c>', 'c')
+    assert resolver.learned[('/mgallery/board/delete', 'confirm_button')] == 'c'
+    assert asyncio.run(resolver.query(page, 'confirm_button', ['a', 'b', 'c'])) == ('<c>', 'c')
+    assert page.calls == [['a', 'b', 'c'], ['c', 'a', 'b']]
+    assert resolver.stats['learned_hits'] == 1
+
+
+def test_query_not_found():
+    resolver = SelectorResolver()
+    assert asyncio.run(resolver.query(_Page(present=set()), 'confirm_button', ['a'])) == (None, None)
+    assert resolver.stats['not_found'] == 1
+    assert not resolver.learned